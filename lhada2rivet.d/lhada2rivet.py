@@ -5,6 +5,11 @@ import argparse
 import sys
 import os.path
 import subprocess
+import hashlib
+import multiprocessing
+import tempfile
+import shutil
+import json
 from collections import OrderedDict
 
 
@@ -140,6 +145,13 @@ class FileReader:
         self.f.seek(self.stored_pos)
         self.current_line = self.stored_line
 
+    def tell(self):
+        return (self.f.tell(), self.current_line)
+
+    def seek(self, pos):
+        (offset, self.current_line) = pos
+        self.f.seek(offset)
+
     def readline(self):
         self.current_line_contents = self.f.readline()
         self.current_line += 1
@@ -154,21 +166,30 @@ class FuncDef:
         self.body = body
         self.source_file = source_file
     #enddef __init__
+
+    def to_dict(self):
+        '''Returns the function definition as a dictionary, without the source file, used to store it in the function index cache'''
+        return { "template_line": self.template_line, \
+                 "return_type": self.return_type, \
+                 "name": self.name, \
+                 "arg_list": self.arg_list, \
+                 "body": self.body }
+    #enddef to_dict
     
-    def rivet_code(self):
-        '''Generate c++ code to incluse in the Rivet analysis class'''
-        code_template = '''%TEMPLATE_LINE%
+    code_template = '''%TEMPLATE_LINE%
 %RETURN_TYPE% %FUNC_NAME%(%ARG_LIST%){
 %FUNC_BODY%
 }'''
 
+    def rivet_code(self):
+        '''Generate c++ code to incluse in the Rivet analysis class'''
         subst_map = { "%TEMPLATE_LINE%": self.template_line,  \
                       "%RETURN_TYPE%": self.return_type, \
                       "%FUNC_NAME%": self.name, \
                       "%ARG_LIST%": self.arg_list, \
-                      "%FUNC_BODY%": self.body}
+                      "%FUNC_BODY%": self.body.lstrip("\n")} #body starts after the opening curly bracket
         
-        return block_replace(code_template, subst_map)
+        return compile_template(self.code_template).render(subst_map)
     #endef rivet_code
 #end class FuncDef
 
@@ -220,6 +241,12 @@ histo_booking = ""
 #command to compile provided c++ code
 compile_cmd = ["g++", "-c", "-Wall", "-Werror", "-I../code_lib/include" ]
 
+#identity of the compiler, see compiler_identity()
+compiler_id = None
+
+#include statements, used to find the files a source file depends on
+re_include_any = re.compile(r'^\s*#\s*include\s*(?:"([^"]+)"|<([^>]+)>)', re.M)
+
 #Meta information on the analysis read from "info analysis" Lhada block
 ana_info = {}
 
@@ -237,6 +264,19 @@ objects = OrderedDict([("Particles", particles)])
 #Map object (cpp name) to types including intermediat object, i.e. not defined in LHADA file.
 types = { particles: "Particles"}
 
+#c++ names of the objects declared as members of the analysis class
+declared_objects = [ particles ]
+
+#Objects generated from an object block, indexed by the canonical form of
+#the block, see object_block_key(). Identical object blocks, of the same
+#or of different LHADA files, share the same c++ object.
+shared_objects = {}
+
+#Prefix of the c++ names of the cut blocks of the LHADA file being parsed,
+#used to distinguish the cut flows of the different analyses when several
+#LHADA files are translated into a single Rivet analysis
+cut_prefix = ""
+
 #list of defined cuts with their dependencu on other cut block
 # key: cut block name, value: CutNode object
 cutblocks = {}
@@ -252,6 +292,9 @@ cutflows = OrderedDict()
 #the list maps function names to its FuncDef object instance
 funcs_lhada = {}
 
+#Functions defined in the function blocks of all the LHADA files
+funcs_referenced = []
+
 #list of all functions read from c++ files references in the function blocks
 #elements
 funcs_all = []
@@ -259,6 +302,18 @@ funcs_all = []
 #List of c++ files read to fill the funcs_all list
 cpp_files = []
 
+#Files included by the c++ files read.
+#key: file name, value: list of the included files
+cpp_includes = {}
+
+#Index of the functions defined in the c++ files read.
+#key: file name, value: dictionary mapping function name to the list of its FuncDef's
+funcs_index = {}
+
+#Version of the format of the function index cache, to be increased
+#when the c++ parsing changes
+funcs_index_version = 1
+
 #return types of defined functions listed in functions
 #If the value (v) is a int then it refers to the type of
 #the (v+1)-nth argument: the function is templated and
@@ -267,14 +322,15 @@ cpp_files = []
 #as a string
 #func_return_types = {}
 
-jetAk04Eta48Proj = None
-atlasCaloFs = None
+#Declared projections, indexed by their canonical configuration, see declare_projection()
+projections = {}
 
 #Flag indicating if a cast operator from Vector3 to FourMomentum is required
 vector3ToFourMometum = False
 
 #List of code files accompagnying the lhada description
-#Code validity is checked before adding the file to the list
+#Code validity is checked by check_code_files once the lhada files are parsed
+#list of (code file, directory of the lhada file referring to it)
 code_files = []
 
 #different ways to call a LHADA object block:
@@ -292,36 +348,42 @@ def tonth(i):
     else:
         return "%dth" % i
 
+def declare_projection(config, name, code):
+    '''Declares a projection, unless a projection with the same configuration was already declared. config is the canonical configuration of the projection: a tuple with its type, its input projections and its parameters (algorithm, radius, cuts, etc.). code is the c++ code that declares it in the init() method, with %PROJ% standing for the projection tag, which is also used as variable name. A new tag is derived from name. Returns the projection tag.'''
+    global projections, proj_init
+    try:
+        return projections[config]
+    except KeyError:
+        proj = unique_name(name)
+        proj_init += multi_replace(code, { "%PROJ%": proj })
+        projections[config] = proj
+        return proj
+#enddef declare_projection
+
 def gen_RecoObj(object, partName, etaAcc, effTag, smearTag, cuts, localVar):
-    global proj_init, obj_def
+    global obj_def
     insert_include("Rivet/Tools/SmearingFunctions.hh")
     insert_include("Rivet/Projections/PromptFinalState.hh")
     insert_include("Rivet/Projections/SmearedParticles.hh")
     pidName = partName.upper()
-    truthParts = unique_name("Truth%ss" % partName)
-    truthPartFS = unique_name("Truth%sFS" % partName)
     if localVar:
         type_decl = "Particles "
     else:
         type_decl = ""
     #endif
-    proj_init += multi_replace('''PromptFinalState %TRUTH_PART_FS%(Cuts::abseta < %ETA_ACC% && Cuts::abspid == PID::%PID_NAME%, true, true);
-declare(%TRUTH_PART_FS%, "%TRUTH_PARTS%");
-declare(SmearedParticles(%TRUTH_PART_FS%, %EFF_TAG%, %SMEAR_TAG%), "%OBJECT%");\n''',
-                                { "%TRUTH_PART_FS%": truthPartFS, \
-                                  "%EFF_TAG%": effTag, \
-                                  "%SMEAR_TAG%": smearTag, \
-                                  "%ETA_ACC%": etaAcc, \
-                                  "%PID_NAME%": pidName, \
-                                  "%TRUTH_PARTS%": truthParts, \
-                                  "%OBJECT%": object}
-    )
-    #FIXME: postpone the projection until the object is used, so we can includes the cuts
-    #and avoid an intermediate object ?
+    truthCut = "Cuts::abseta < %s && Cuts::abspid == PID::%s" % (etaAcc, pidName)
+    truthPartFS = declare_projection(("PromptFinalState", truthCut, "true", "true"), "Truth%sFS" % partName,
+                                     '''PromptFinalState %%PROJ%%(%s, true, true);
+declare(%%PROJ%%, "%%PROJ%%");
+''' % truthCut)
+    smearedParts = declare_projection(("SmearedParticles", truthPartFS, effTag, smearTag), "Smeared%ss" % partName,
+                                      '''declare(SmearedParticles(%s, %s, %s), "%%PROJ%%");
+''' % (truthPartFS, effTag, smearTag))
     if cuts is None:
         cuts = ""
-    obj_def += multi_replace('''%TYPE_DECL%%OBJECT% = applyProjection<ParticleFinder>(event, "%OBJECT%").particles(%CUTS%);
+    obj_def += multi_replace('''%TYPE_DECL%%OBJECT% = applyProjection<ParticleFinder>(event, "%PROJ%").particles(%CUTS%);
 ''', { "%OBJECT%": object, \
+       "%PROJ%": smearedParts, \
        "%CUTS%": cuts, \
        "%TYPE_DECL%": type_decl});
     return ("Particles", object)
@@ -340,31 +402,21 @@ def gen_MuonCms_00(object, cuts, localVar):
     return gen_RecoObj(object, "Muon", "2.7", "MUON_EFF_CMS_RUN2", "MUON_SMEAR_CMS_RUN2", cuts, localVar)
 
 def getAtlasCaloFs():
-    global atlasCaloFs, proj_init
-    if not atlasCaloFs:
-        atlasCaloFS = unique_name("caloFS")
-        proj_init += multi_replace('''FinalState %CALO_FS%(Cuts::abseta < 4.8);
-''', { "%CALO_FS%": atlasCaloFS })
-    #endif
-    return atlasCaloFS
-        
+    return declare_projection(("FinalState", "Cuts::abseta < 4.8"), "caloFS",
+                              '''FinalState %PROJ%(Cuts::abseta < 4.8);
+''')
+
 def getJetAk04Eta48Proj():
-    global jetAk04Eta48Proj, proj_init
-    if not jetAk04Eta48Proj:
-        caloFS = getAtlasCaloFs()
-        jetAk04Eta48Proj = unique_name("jetAk04Eta48Proj")
-        includes.append("Rivet/Projections/FastJets.hh")
-        proj_init += multi_replace('''FastJets %JET_PROJ%(%CALO_FS%, FastJets::ANTIKT, 0.4);
-declare(%JET_PROJ%, "%JET_PROJ%");
-''',  { "%CALO_FS%": caloFS, \
-        "%JET_PROJ%": jetAk04Eta48Proj})
-    #endif
-    return jetAk04Eta48Proj
+    caloFS = getAtlasCaloFs()
+    insert_include("Rivet/Projections/FastJets.hh")
+    return declare_projection(("FastJets", caloFS, "ANTIKT", "0.4"), "jetAk04Eta48Proj",
+                              '''FastJets %%PROJ%%(%s, FastJets::ANTIKT, 0.4);
+declare(%%PROJ%%, "%%PROJ%%");
+''' % caloFS)
     
     
 def gen_MetAtlas_00(object, cuts, localVar):
-    global proj_init, obj_def, vector3ToFourMometum
-    truthMET   = unique_name("TruthMET")
+    global obj_def, vector3ToFourMometum
     caloFS = getAtlasCaloFs()
     if cuts:
         raise RuntimeError("Error file %s, line %d. reject/select directive cannot be applied on MET" %  (lhadafile.current_line, lhadafile.name))
@@ -376,34 +428,27 @@ def gen_MetAtlas_00(object, cuts, localVar):
     else:
         type_decl = ""
     #endif
-    proj_init += multi_replace('''MissingMomentum %TRUTH_MET%(%CALO_FS%);
-declare(%TRUTH_MET%, "%TRUTH_MET%");
-declare(SmearedMET(%TRUTH_MET%, MET_SMEAR_ATLAS_RUN2), "%RECO_MET%");
-''',  { "%CALO_FS%": caloFS, \
-        "%TRUTH_MET%": truthMET, \
-        "%RECO_MET%": object})
+    truthMET = declare_projection(("MissingMomentum", caloFS), "TruthMET",
+                                  '''MissingMomentum %%PROJ%%(%s);
+declare(%%PROJ%%, "%%PROJ%%");
+''' % caloFS)
+    recoMET = declare_projection(("SmearedMET", truthMET, "MET_SMEAR_ATLAS_RUN2"), "SmearedMET",
+                                 '''declare(SmearedMET(%s, MET_SMEAR_ATLAS_RUN2), "%%PROJ%%");
+''' % truthMET)
     obj_def += multi_replace('''%TYPE_DECL%%OBJECT% = toFourMomentum(applyProjection<SmearedMET>(event, "%RECO_MET%").vectorMPT());
 ''', { "%OBJECT%": object, \
-       "%RECO_MET%": object, \
+       "%RECO_MET%": recoMET, \
        "%TYPE_DECL%": type_decl})
     vector3ToFourMometum = True
     return ("FourMomentum", object)
 #enddef    
 
-jetAk04Atlas_00_proj = None
 def getJetAk04Atlas_00_proj():
-    global jetAk04Atlas_00_proj, proj_init, obj_def
     insert_include("Rivet/Projections/SmearedJets.hh")
-    if not jetAk04Atlas_00_proj:
-        jetAk04Atlas_00_proj = unique_name("recoJetAk04")
-        genJetProj = getJetAk04Eta48Proj()
-        proj_init += multi_replace('''declare(SmearedJets(%GEN_JET_PROJ%, JET_SMEAR_ATLAS_RUN2, JET_BTAG_ATLAS_RUN2_MV2C20), "%RECO_JET_PROJ%");
-''', { "%GEN_JET_PROJ%": genJetProj, \
-       "%RECO_JET_PROJ%": jetAk04Atlas_00_proj})
-    obj_def += multi_replace('''SmearedJets %RECO_JET_PROJ% = applyProjection<SmearedJets>(event, "%RECO_JET_PROJ%");
-''', {"%RECO_JET_PROJ%": jetAk04Atlas_00_proj})
-    #endif
-    return jetAk04Atlas_00_proj
+    genJetProj = getJetAk04Eta48Proj()
+    return declare_projection(("SmearedJets", genJetProj, "JET_SMEAR_ATLAS_RUN2", "JET_BTAG_ATLAS_RUN2_MV2C20"), "recoJetAk04",
+                              '''declare(SmearedJets(%s, JET_SMEAR_ATLAS_RUN2, JET_BTAG_ATLAS_RUN2_MV2C20), "%%PROJ%%");
+''' % genJetProj)
     
 def gen_JetAk04Atlas_00(object, cuts, localVar):
     global obj_def
@@ -415,7 +460,7 @@ def gen_JetAk04Atlas_00(object, cuts, localVar):
         type_decl = ""
     #endif
     recoJetProj = getJetAk04Atlas_00_proj()
-    obj_def += multi_replace('''%TYPE_DECL%%OBJECT% = %PROJ%.jetsByPt(%CUTS%);
+    obj_def += multi_replace('''%TYPE_DECL%%OBJECT% = applyProjection<JetFinder>(event, "%PROJ%").jetsByPt(%CUTS%);
 ''', {"%OBJECT%": object, \
       "%CUTS%": cuts, \
       "%PROJ%": recoJetProj, \
@@ -457,26 +502,131 @@ def unique_name(name):
         return name
 #enddef
 
-def check_code(filename):
-    '''Check validity of a source file by trying to compile it with g++'''
-    #Check first availability of the compiler:
-    cmd = [compile_cmd[0], "--version"]
-    try:
-        rc = subprocess.call(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    except OSError:
-        rc = 1
-    if rc != 0:
+def get_cache_dir():
+    '''Returns the directory where code checks and function indices are cached, creating it if needed. Returns None if the cache is disabled or cannot be used.'''
+    cache = args.cache_dir
+    if cache and not os.path.isdir(cache):
+        try:
+            os.makedirs(cache)
+        except OSError:
+            mess("Cache directory %s cannot be created, cache is disabled." % cache)
+            args.cache_dir = cache = None
+        #endtry
+    #endif
+    return cache
+#enddef
+
+def compiler_identity():
+    '''Identify the compiler used to check the code from the path, size and modification time of its executable. Raises an exception if the compiler is not found.'''
+    global compiler_id
+    if compiler_id:
+        return compiler_id
+    #endif
+    path = None
+    for d in os.environ.get("PATH", "").split(os.pathsep):
+        p = os.path.join(d, compile_cmd[0])
+        if os.path.isfile(p) and os.access(p, os.X_OK):
+            path = os.path.realpath(p)
+            break
+        #endif
+    #next d
+    if not path:
         raise RuntimeError("Compiler %s is required, while it was not found. Please check it is available in the default search paths defined by PATH environment variable." \
-                           % cmd)
-        
-    cmd = compile_cmd
-    cmd.extend(["-I", os.path.dirname(lhadafile.name)])
-    cmd.append(filename)
-    rc = subprocess.call(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    if rc != 0:
-        raise RuntimeError("C++ code in file %s is not valid. Please to check it can be compiled with the following command:\n %s" \
-                           % (filename, " ".join(cmd)))
+                           % compile_cmd[0])
     #endif
+    st = os.stat(path)
+    compiler_id = "%s:%d:%d" % (path, st.st_size, st.st_mtime)
+    return compiler_id
+#enddef
+
+def source_digest(filename, include_dirs, digests):
+    '''Compute the hash of a source file and of the files it includes, recursively. Included files are looked for in the directory of the including file and in include_dirs; files not found there are system headers, which are identified by the compiler. digests maps the files already hashed to their hash.'''
+    filename = os.path.realpath(filename)
+    if filename in digests:
+        return digests[filename]
+    #endif
+    digests[filename] = "" #protection against include loops
+    with open(filename, "rb") as f:
+        contents = f.read()
+    h = hashlib.sha1(contents)
+    for (quoted, angled) in re_include_any.findall(contents):
+        dirs = include_dirs
+        if quoted:
+            dirs = [ os.path.dirname(filename) ] + include_dirs
+        #endif
+        for d in dirs:
+            p = os.path.join(d, quoted or angled)
+            if os.path.isfile(p):
+                h.update(source_digest(p, include_dirs, digests))
+                break
+            #endif
+        #next d
+    #next quoted, angled
+    digests[filename] = h.hexdigest()
+    return digests[filename]
+#enddef
+
+def compile_check(cmd):
+    '''Run a compilation command and returns its exit code. Used by check_code_files, possibly in a worker process.'''
+    with open(os.devnull, "w") as devnull:
+        return subprocess.call(cmd, stdout=devnull, stderr=devnull)
+#enddef
+
+def check_code_files(files):
+    '''Check validity of source files by trying to compile them with g++. files is a list of (source file, directory of the LHADA file referring to it), the latter being added to the include path. A successful check is recorded in the cache directory, under a key made of the hashes of the file and of the files it includes and of the compiler identity and options, so that it is not repeated for unchanged code. Files that are not in the cache are compiled in parallel.'''
+    ident = compiler_identity()
+
+    cache = get_cache_dir()
+
+    #hashes of the files, per LHADA directory, since included files
+    #are looked for in this directory
+    digests = {}
+    todo = []
+    for (f, lhada_dir) in files:
+        flags = compile_cmd[1:] + ["-I", lhada_dir]
+        include_dirs = [ x[2:] for x in compile_cmd if x.startswith("-I") ] + [ lhada_dir ]
+        cmd = [ compile_cmd[0] ] + flags + [ f ]
+        key = hashlib.sha1("\n".join([ident] + flags + [source_digest(f, include_dirs, digests.setdefault(lhada_dir, {}))])).hexdigest()
+        if cache and os.path.exists(os.path.join(cache, key)):
+            mess("Code of file %s was already checked." % f)
+            continue
+        #endif
+        todo.append((f, cmd, key))
+    #next f
+
+    if not todo:
+        return
+    #endif
+
+    #compiler outputs (object files or precompiled headers) are discarded
+    outdir = tempfile.mkdtemp(prefix = "lhada2rivet")
+    cmds = [ cmd + [ "-o", os.path.join(outdir, "%d.o" % i) ] for i, (f, cmd, key) in enumerate(todo) ]
+    try:
+        if len(cmds) > 1:
+            pool = multiprocessing.Pool(min(len(cmds), multiprocessing.cpu_count()))
+            try:
+                rcs = pool.map(compile_check, cmds)
+            finally:
+                pool.close()
+                pool.join()
+            #endtry
+        else:
+            rcs = [ compile_check(cmds[0]) ]
+        #endif
+    finally:
+        shutil.rmtree(outdir, ignore_errors = True)
+    #endtry
+
+    for (f, cmd, key), rc in zip(todo, rcs):
+        if rc != 0:
+            raise RuntimeError("C++ code in file %s is not valid. Please to check it can be compiled with the following command:\n %s" \
+                               % (f, " ".join(cmd)))
+        #endif
+        if cache:
+            #only successful checks are recorded, failures are always reported
+            open(os.path.join(cache, key), "w").close()
+        #endif
+    #next f, cmd, key, rc
 #enddef
 
 def trans_func(code):
@@ -493,33 +643,74 @@ def trans_func(code):
 
 def get_func_code(file, func_name):
     '''Search for a function with name <func_name> in the c/c++ file <file>. Returns FuncDef object.'''
-    global funcs_all
     read_cpp_file(file)
-    r = None
-    for f in funcs_all:
-        if f.name == func_name and f.source_file != file:
-            print '>>2', func_name, f.source_file, file
-        if f.name == func_name and f.source_file == file:
-            if r:
-                for f in funcs_all:
-                    print f.name, f.source_file
-                raise RuntimeError("Error. The function %s was declared multiple times in the file %s. A function defined in the lhada file should be uniquely defined in the provided source file and overloading (functions with same name and differenet argument list) is not possible." % (func_name, file))
-            r = f
-        #endif
-    #next f
-    return r
+    r = funcs_index[file].get(func_name, [])
+    if len(r) > 1:
+        raise RuntimeError("Error. The function %s was declared multiple times in the file %s. A function defined in the lhada file should be uniquely defined in the provided source file and overloading (functions with same name and differenet argument list) is not possible." % (func_name, file))
+    #endif
+    if r:
+        return r[0]
+    else:
+        return None
 #enddef
 
 #def get_func_code(file, func_name):
 #    '''Search for a function with name <func_name> in the c/c++ file <file>. Returns a list with in order the possible template defintion line, the function return type, the function name (i. e. func_name), and the function body without its curly brackets.'''
 def read_cpp_file(file):
-    '''Read a C++ code file to store the function definitions'''
+    '''Read a C++ code file to store the function definitions. The result of the parsing is cached, keyed by the hash of the file contents.'''
     global cpp_files, funcs_all
     if file in cpp_files:
         return
     else:
         cpp_files.append(file)
-    
+    if file not in [ x[0] for x in code_files ]:
+        #the code is compiled with the directory of the LHADA file
+        #that refers to it in the include path
+        code_files.append((file, os.path.dirname(lhadafile.name) or "."))
+
+    with open(file) as f:
+        contents = f.read()
+    cache = get_cache_dir()
+    index_file = None
+    if cache:
+        key = hashlib.sha1("%d\n%s" % (funcs_index_version, contents)).hexdigest()
+        index_file = os.path.join(cache, "functions_%s.json" % key)
+    #endif
+    try:
+        with open(index_file) as f:
+            index = json.load(f)
+        #latin-1 maps any byte to a character, the file contents
+        #are recovered unchanged when the index is read back
+        includes_ = [ x.encode("latin-1") for x in index["includes"] ]
+        funcs = [ FuncDef(source_file = file, **dict([ (str(k), v.encode("latin-1")) for k, v in d.iteritems() ])) \
+                  for d in index["functions"] ]
+        mess("Function index of file %s read from %s." % (file, index_file))
+    except (TypeError, IOError, ValueError, KeyError):
+        (includes_, funcs) = parse_cpp_file(file, contents.splitlines(True))
+        if index_file:
+            index = { "includes": includes_, "functions": [ x.to_dict() for x in funcs ] }
+            #written to a temporary file first, for concurrent runs
+            tmp = "%s.%d" % (index_file, os.getpid())
+            with open(tmp, "w") as f:
+                json.dump(index, f, encoding = "latin-1")
+            os.rename(tmp, index_file)
+        #endif
+    #endtry
+
+    #the includes are inserted only if a function of the file is used,
+    #see gen_func_block()
+    cpp_includes[file] = includes_
+    file_funcs = funcs_index.setdefault(file, {})
+    for f in funcs:
+        funcs_all.append(f)
+        file_funcs.setdefault(f.name, []).append(f)
+    #next f
+#enddef
+
+def parse_cpp_file(file, lines):
+    '''Parse the lines of a C++ code file. Returns the list of included files and the list of FuncDef's of the functions it defines.'''
+    includes_ = []
+    funcs = []
     state = "init"
     comment_line = re.compile(r'^\s*//')
     il = 0
@@ -535,17 +726,14 @@ def read_cpp_file(file):
     template_line = ""
     r = None
     bra = 0
-    if file not in code_files:
-        check_code(file)
-        code_files.append(file)
-    for l in open(file):
+    for l in lines:
         il += 1
         if comment_line.match(l):
             continue
         m = re_include.match(l)
         if m:
             file_to_include = m.groups()[0]
-            insert_include(file_to_include)
+            includes_.append(file_to_include)
             continue
         #endif m
         for t in re_split.split(l):
@@ -649,7 +837,7 @@ def read_cpp_file(file):
                                 arg_list = trans_func(arg_list), \
                                 body = trans_func(func_body), \
                                 source_file = file)
-                    funcs_all.append(f)
+                    funcs.append(f)
                     #if func_found:
                     #    #store result
                     #    r = (template_line, trans_func(return_type), func_name, trans_func(arg_list), trans_func(func_body))
@@ -663,7 +851,7 @@ def read_cpp_file(file):
             #endif state == "function_body"
         #next t(oken)
     #next l(ine)
-#    return r
+    return (includes_, funcs)
 #enddef
 
 
@@ -687,41 +875,86 @@ def report_syntax_error(line_num, filename, line, message = ""):
     raise RuntimeError(mess)
 
 def compose_rivet_cuts(cuts):
-    '''Generate code to perform an object cut using a combination of standard Rivet cuts. Returns None in the case the expression is too complex.'''
-    #TODO add support to parentheses.
-    cut = r"\s*\(?(pt|E|m|rapidity|\|\s*rapidity\s*\|charge|\|\s*charge\s*\|pid|\|\s*pid\s*\|phi)\s*(<|>|<=|>=|!=|==)\s*((0|[1-9]\d*)(\.\d*)?|\.\d+)([eE][+-]?\d+)?\)?"
-    r = re.compile(r"^%s\s*((&&|\|\||and|or)\s*%s)*$" % (cut, cut))
+    '''Translate the object cuts, given as syntax trees, to a combination of standard Rivet cuts, which are applied by the projection. The cuts are and-ed: a cut, or the operand of a top-level and, that cannot be translated is left to be applied afterwards. Returns (rivet_cut, remaining_cuts), with rivet_cut the c++ code of the Rivet cut, or None if no cut could be translated.'''
+    translated = []
+    remaining = []
+    stack = list(reversed(cuts))
+    while stack:
+        c = stack.pop()
+        code = gen_rivet_cut(c)
+        if code is not None:
+            if c.kind == "or":
+                code = "(" + code + ")"
+            translated.append(code)
+        elif c.kind == "and":
+            stack.extend(reversed(c.args))
+        else:
+            remaining.append(c)
+        #endif
+    #endwhile
 
-    combined_cut = ""
-    op = ""
-    for c in cuts:
-        #TODO omit parentheses when they are not needed
-        combined_cut += "%s(%s)" % (op, c)
-        op = " && "
-    #next c
+    if not translated:
+        return (None, remaining)
 
-    if not r.match(combined_cut):
-        return None
-    
     insert_include('Rivet/Tools/Cuts.hh')
-    re.sub(r"\bpt\b", "Cuts::pT", combined_cut)
-    re.sub(r"\bE\b", "Cuts::E", combined_cut)
-    re.sub(r"\bm\b", "Cuts::mass", combined_cut)
-    re.sub(r"\brapidity\b", "Cuts::rap", combined_cut)
-    re.sub(r"\b\|\s*rapidity\s*\|\b", "Cuts::absrap", combined_cut)
-    re.sub(r"\bcharge\b", "Cuts::charge", combined_cut)
-    re.sub(r"\b\|\s*charge\s*\|\b", "Cuts::abscharge", combined_cut)
-    re.sub(r"\bpid\b", "Cuts::pid", combined_cut)
-    re.sub(r"\b\|\s*pid\s*\|\b", "Cuts::abspid", combined_cut)
-    re.sub(r"\bphi\b", "Cuts::phi", combined_cut)
-    re.sub(r"\band\b", "&&", combined_cut)
-    re.sub(r"\bor\b", "||", combined_cut)
-
-    return combined_cut
+    return (" && ".join(translated), remaining)
+#enddef compose_rivet_cuts
+
+def gen_rivet_cut(node):
+    '''Translate the syntax tree of an object cut to Rivet cut algebra. Returns None if the cut cannot be expressed with the standard Rivet cuts.'''
+    kind = node.kind
+    if kind in ["and", "or"]:
+        args = []
+        for x in node.args:
+            code = gen_rivet_cut(x)
+            if code is None:
+                return None
+            if x.kind in ["and", "or"] and x.kind != kind:
+                code = "(" + code + ")"
+            args.append(code)
+        #next x
+        return {"and": " && ", "or": " || "}[kind].join(args)
+    elif kind == "not":
+        code = gen_rivet_cut(node.args[0])
+        if code is None:
+            return None
+        return "!(%s)" % code
+    elif kind == "cmp":
+        (left, right) = node.args
+        op = node.value
+        if rivet_cut_quantity(left) is None:
+            #constant on the left side: 20 < pt is written pT > 20
+            (left, right) = (right, left)
+            op = {"<": ">", ">": "<", "<=": ">=", ">=": "<="}.get(op, op)
+        #endif
+        quantity = rivet_cut_quantity(left)
+        if quantity is None:
+            return None
+        if right.kind == "num":
+            value = right.value
+        elif right.kind == "neg" and right.args[0].kind == "num":
+            value = "-" + right.args[0].value
+        else:
+            return None
+        #endif
+        return "%s %s %s" % (quantity, op, value)
+    #endif
+    return None
+#enddef gen_rivet_cut
+
+def rivet_cut_quantity(node):
+    '''Returns the Rivet cut quantity (e.g. Cuts::abseta) corresponding to a particle attribute or to its absolute value, or None if there is no such quantity'''
+    if node.kind == "name":
+        return rivet_cut_quantities.get(node.value)
+    elif node.kind == "abs" and node.args[0].kind == "name":
+        return rivet_abs_cut_quantities.get(node.args[0].value)
+    #endif
+    return None
+#enddef rivet_cut_quantity
 
 
 def gen_antikt(input_obj, dR, ptmin, etamax, cuts, output_obj):
-    global proj_init, obj_def, particles, lhadafile
+    global obj_def, particles, lhadafile
 
     #TODO: support for other inputs than external/particles?
     if input_obj != particles:
@@ -729,19 +962,17 @@ def gen_antikt(input_obj, dR, ptmin, etamax, cuts, output_obj):
     
     insert_include("Rivet/Projections/FastJets.hh")
     name = output_obj
-    projname = unique_name(output_obj + "Proj")
-    proj_init += 'addProjection(FastJets(fs, FastJets::ANTIKT, %g), "%s");\n' % (dR, name)
+    projname = declare_projection(("FastJets", "fs", "ANTIKT", "%g" % dR), output_obj + "Proj",
+                                  'addProjection(FastJets(fs, FastJets::ANTIKT, %g), "%%PROJ%%");\n' % dR)
 #    cutname = output_obj + "Cut"
-    if cuts:
-        cut_expr = compose_rivet_cuts(cuts)
-    else:
+    (cut_expr, remaining_cuts) = compose_rivet_cuts(cuts)
+    if cut_expr is None:
         cut_expr = ""
     #TODO: support for complex cuts
-    if cut_expr is None:
+    if remaining_cuts:
         #TODO: check lhada file line number and fix it if not correct
         raise RuntimeError("Error while generating for the object %s defined line %d of file %s. Only standard cuts are supported for jet inputs." % (output_obj, lhadafile.current_line, lhadafile.name))
-    obj_def += multi_replace('''const FastJets& jetPro = applyProjection<FastJets>(event, "JETS");
-OBJ_TYPE JETS = jetPro.jetsByPt(CUTS);\n''',
+    obj_def += multi_replace('''OBJ_TYPE JETS = applyProjection<FastJets>(event, "jetPro").jetsByPt(CUTS);\n''',
                              {"OBJ_TYPE": "Jets",
                               "JETS": name,
                               "jetPro": projname,
@@ -751,7 +982,7 @@ OBJ_TYPE JETS = jetPro.jetsByPt(CUTS);\n''',
 
 def gen_met(input_obj, cuts, output_obj):
     '''Generate code to produce missing ET quadrivector'''
-    global proj_init, obj_def, lhadafile
+    global obj_def, lhadafile
 
     #TODO: support for other inputs than external/particles?
     if input_obj != particles:
@@ -759,10 +990,9 @@ def gen_met(input_obj, cuts, output_obj):
 
     insert_include("Rivet/Projections/MissingMomentum.hh")
     name = output_obj
-    projname = unique_name(output_obj + "Proj")
-    proj_init += 'addProjection(MissingMomentum(fs), "%s");\n' % name
-    obj_def   += multi_replace('''const MissingMomentum PROJ = applyProjection<MissingMomentum>(event, "OBJ");
-OBJ = PROJ.missingMomentum();\n''', {"OBJ": name, "PROJ": projname})    
+    projname = declare_projection(("MissingMomentum", "fs"), output_obj + "Proj",
+                                  'addProjection(MissingMomentum(fs), "%PROJ%");\n')
+    obj_def   += multi_replace('''OBJ = applyProjection<MissingMomentum>(event, "PROJ").missingMomentum();\n''', {"OBJ": name, "PROJ": projname})    
     insert_include('Rivet/Projections/MissingMomentum.hh')
     return ("FourMomentum", name)
 
@@ -847,50 +1077,106 @@ def preprocess_line(l):
         return l[:pos]
 
 def multi_replace(s, replace_map):
+    '''Replace the keys of replace_map found in the string s by the corresponding values, in a single pass over s'''
     for key, value in replace_map.items():
         mess(key + "->" + str(value))
         if value is None:
             sys.stderr.write("Missing value for the key '%s'.\n" % key)
-        s = s.replace(key, value)
-    #next key. value
-    return s
+    #next key, value
+    if not replace_map:
+        return s
+    #longest keys first, for keys that are prefixes of other keys
+    p = re.compile("|".join([ re.escape(k) for k in sorted(replace_map, key = len, reverse = True) ]))
+    return p.sub(lambda m: str(replace_map[m.group(0)]), s)
+
+class CodeTemplate:
+    '''Code template whose placeholders, %KEY%, are located once when the template is compiled. A placeholder at the beginning of a line, after its indentation, is replaced by a text block, which is indented and aligned to the placeholder position; if the block is empty or ends with a new line, the empty lines that follow the placeholder are dropped. Other placeholders are replaced inline. Placeholders without value are left unchanged.'''
+    re_block = re.compile(r'([\s]*)(%[^\s%]+%)(.*)')
+    re_inline = re.compile(r'(%[^\s%]+%)')
+
+    def __init__(self, text):
+        #list of (indent, key, tail) with key None for lines without leading
+        #placeholder, and tail the rest of the line split into text and
+        #inline placeholders
+        self.lines = []
+        for l in text.split("\n"):
+            m = self.re_block.match(l)
+            if m:
+                (indent, key, tail) = m.groups()
+            else:
+                (indent, key, tail) = ("", None, l)
+            #endif
+            self.lines.append((indent, key, self.re_inline.split(tail)))
+        #next l
+    #enddef __init__
 
-def block_replace(s, replace_map):
-    '''Insert text blocks in a string at location indentified by keys. The block is indented and aligned to the key position. The key must start and end with a percent sign and should not contain space. s contains the text where substitution must be made and replace_map is an associative array with the keys and the corresponding text block'''
-    r = ""
-    swallow_empty_line = False
-    for l in s.split("\n"):
-        p1 = re.compile(r'([\s]*)(%[^\s]+%)(.*)')
-        m = p1.match(l)
-        if m:
-            (indent, toks, tail) = m.groups()
-            try:
-                first_line = True
-                for ll in replace_map[toks].split("\n"):
-                    if first_line:
-                        first_line = False
-                    else:
-                        r += '\n'
-                    if ll:
-                        r += indent + ll
-                        swallow_empty_line = False
-                    else:
-                        swallow_empty_line = True
-            except KeyError:
-                tail = l
-                pass
-            #endtry
-            tail_ = multi_replace(tail, replace_map)
-            r += tail_
+    def render(self, values):
+        '''Returns the code with the placeholders replaced by the values of the dictionary values'''
+        r = []
+        self.write(r.append, values)
+        return "".join(r)
+    #enddef render
+
+    def write(self, write, values):
+        '''Write the code with the placeholders replaced by the values of the dictionary values, using the function write'''
+        state = { "first": True }
+        def write_line(l):
+            if state["first"]:
+                state["first"] = False
+            else:
+                write("\n")
             #endif
-        else:
-            if len(l.strip()) == 0 and swallow_empty_line:
-                pass
+            write(l)
+        #enddef write_line
+        swallow_empty_line = False
+        for (indent, key, tail) in self.lines:
+            #odd elements of tail are placeholders
+            tail = "".join([ values.get(t, t) if i % 2 else t for i, t in enumerate(tail) ])
+            if key is not None and key in values:
+                block = values[key].split("\n")
+                swallow_empty_line = block[-1] == "" and not tail
+                if swallow_empty_line:
+                    block.pop()
+                else:
+                    block[-1] += tail
+                #endif
+                for l in block:
+                    if l:
+                        write_line(indent + l)
+                    else:
+                        write_line("")
+                    #endif
+                #next l
             else:
-                r += l + "\n"
+                if key is not None:
+                    tail = indent + key + tail
+                #endif
+                if swallow_empty_line and len(tail.strip()) == 0:
+                    continue
+                #endif
+                write_line(tail)
                 swallow_empty_line = False
-        #endif
-    return r
+            #endif
+        #next (indent, key, tail)
+    #enddef write
+#end class CodeTemplate
+
+#Compiled templates, see compile_template()
+compiled_templates = {}
+
+def compile_template(text):
+    '''Returns the template text compiled into a CodeTemplate. Templates are compiled once.'''
+    try:
+        return compiled_templates[text]
+    except KeyError:
+        t = CodeTemplate(text)
+        compiled_templates[text] = t
+        return t
+#enddef
+
+def block_replace(s, replace_map):
+    '''Insert text blocks in a string at location indentified by keys. The block is indented and aligned to the key position. The key must start and end with a percent sign and should not contain space. s contains the text where substitution must be made and replace_map is an associative array with the keys and the corresponding text block. See CodeTemplate.'''
+    return compile_template(s).render(replace_map)
 
 #def gen_cut(collection, observable, operator, value):
 #    mess("Generating code for cut %s.%s %s %s"  % (collection, observable, operator, value))   
@@ -987,7 +1273,7 @@ def gen_no_apply_object(input_obj, cuts, output_obj):
     output_obj = unique_name(output_obj)
     global obj_def
     if len(cuts) == 0:
-        obj_def = '''%s %s = %s;\n''' % (get_obj_type(input_obj), output_obj, input_obj)
+        obj_def += '''%s = %s;\n''' % (output_obj, input_obj)
     else:
         obj_def += gen_collection_filter_code(get_obj_type(input_obj), input_obj, cuts, output_obj, False)
     #endif
@@ -997,9 +1283,10 @@ def gen_external(external_object_name, internal_object_name, cuts):
     global lhadafile, external_objs, obj_def
     rivet_cut = None
     tmpObj = False
+    remaining_cuts = []
     if len(cuts) > 0:
-        rivet_cut = compose_rivet_cuts(cuts)
-        if rivet_cut:
+        (rivet_cut, remaining_cuts) = compose_rivet_cuts(cuts)
+        if not remaining_cuts:
             obj_name = unique_name(internal_object_name)
         else:
             #cuts could not be expressed as a rivet cut object
@@ -1015,11 +1302,11 @@ def gen_external(external_object_name, internal_object_name, cuts):
     #FIXME: treatement of cuts...
     (obj_type, obj_name) =  gen_func(obj_name, rivet_cut, tmpObj)
     
-    if len(cuts) > 0 and not rivet_cut:
+    if remaining_cuts:
         #cuts could not be expressed as a rivet cut object
         pre_obj = obj_name
         obj_name = unique_name(internal_object_name)
-        obj_def += gen_collection_filter_code(obj_type, pre_obj, cuts, obj_name, False)
+        obj_def += gen_collection_filter_code(obj_type, pre_obj, remaining_cuts, obj_name, False)
     #endif
     return (obj_type, obj_name)
 
@@ -1028,14 +1315,13 @@ def gen_collection_filter_code(coltype, incol, cuts, outcol, localVar):
     '''Generate c++ code that filters the object collection <incol> by applying cuts listed in the parameter <cuts> to produce the new collection <outcol>. Returns the generated code.'''
     expr = ""
     op = ""
-    simple_cut = re.compile(r"\s*\(?(pt|E|m|rapidity|\|\s*rapidity\s*\|charge|\|\s*charge\s*\|pid|\|\s*pid\s*\|phi)\s*(<|>|<=|>=|!=|==)\s*((0|[1-9]\d*)(\.\d*)?|\.\d+)([eE][+-]?\d+)?\)?")
     if localVar:
         type_decl = coltype + " " + outcol + ";\n"
     else:
         type_decl = ""
     for c in cuts:
-        subst_expr = parse_cut_line(c, "p.")[0]
-        if not simple_cut.match(c):
+        subst_expr = gen_rivet_expr(c, "p.")
+        if c.kind == "or":
             subst_expr = "(" + subst_expr + ")"
         expr += op + subst_expr
         op = "\n" + indent*2 + "&& ";
@@ -1110,6 +1396,15 @@ def parse_object_block():
         raise RuntimeError("Duplicate definition of object %s found line %d of file %s.\t%s\n" % (lhadafile.current_line, lhadafile.name, line1))
     if object_name in funcs_lhada:
         raise RuntimeError("Name %s was already used to name a function and cannot be used in line %d of file %s to define an object.\t%s\n" % (object_name, lhadafile.current_line, lhadafile.name, line1))
+    #an object identical to an already generated one is not generated again
+    block_start_pos = lhadafile.tell()
+    key = object_block_key(read_object_block())
+    if key in shared_objects:
+        mess("Object %s is identical to the object %s and shares its code." % (object_name, shared_objects[key]))
+        objects[object_name] = shared_objects[key]
+        return
+    #endif
+    lhadafile.seek(block_start_pos)
     lhadafile.save_pos()
     apply_stmt = None
     cuts = []
@@ -1161,11 +1456,9 @@ def parse_object_block():
                 raise RuntimeError("Syntax error in line %d of file %s: select statement should follow the format 'select variable operator value." % (lhadafile.current_line, lhadafile.name))
             #endif
             if toks[0] == 'reject': #inverted cut
-                #FIXME add code to simplify the expression ?
-#                cuts.append("!(%s)" % m.groups()[1])
-                cuts.append(invert_cond(m.groups()[1]))
+                cuts.append(negate_expr(parse_expr(m.groups()[1])))
             else:
-                cuts.append(m.groups()[1])
+                cuts.append(parse_expr(m.groups()[1]))
             #endif            
         elif toks[0] == 'apply':
             pattern = re.compile(r'apply\s+([^\s]+)\(([^)]*)\)')
@@ -1192,6 +1485,10 @@ def parse_object_block():
                 args.insert(0, "input_object=%s" % last_obj)
             #split args into { "param1": "value1", "param2": "value2", ...}
             args = OrderedDict(map(lambda(x): x.split("="), args))
+            #objects passed as argument are referred to by their c++ name
+            for k, v in args.iteritems():
+                args[k] = objects.get(v, v)
+            #next k, v
             #endif
             #if last object is external, code to produce it must be generated:
             if last_obj == "external":
@@ -1231,9 +1528,80 @@ def parse_object_block():
     #endif
     objects[object_name] = last_obj
     types[last_obj] = obj_type
+    declared_objects.append(last_obj)
+    if key is not None:
+        shared_objects[key] = last_obj
     cuts = []
 #enddef
 
+def read_object_block():
+    '''Reads the statements of the object block whose first line was just read. Returns the list of statements, with the comments removed, and leaves the file at the end of the block.'''
+    statements = []
+    while True:
+        lhadafile.save_pos()
+        l = lhadafile.readline()
+        if len(l) == 0:
+            break
+        indented = re_indented.match(l) #must be checked before preprocess_line
+        l = preprocess_line(l)
+        if len(l) == 0:
+            continue
+        if not indented:
+            lhadafile.restore_pos()
+            break
+        #endif
+        statements.append(l)
+    #endwhile
+    return statements
+#enddef read_object_block
+
+def object_block_key(statements):
+    '''Returns the canonical form of an object block, given its statements, or None if it cannot be determined. The LHADA names are replaced by the c++ names of the objects and by the code of the functions they refer to, and the cuts by their c++ code, such that two blocks with the same canonical form define the same object, whatever LHADA file they come from.'''
+    key = []
+    funcs = []
+    re_apply = re.compile(r'apply\s+([^\s]+)\(([^)]*)\)')
+    try:
+        for l in statements:
+            toks = l.split()
+            if toks[0] == 'take':
+                key.append(tuple(["take"] + [ objects.get(x, x) for x in toks[1:] ]))
+            elif toks[0] in ['select', 'reject']:
+                tree = parse_expr(l[len(toks[0]):])
+                if toks[0] == 'reject':
+                    tree = negate_expr(tree)
+                #endif
+                stack = [ tree ]
+                while stack:
+                    n = stack.pop()
+                    if n.kind == "call":
+                        funcs.append(n.value)
+                    stack.extend(n.args)
+                #endwhile
+                key.append(("select", gen_rivet_expr(tree, "p.")))
+            elif toks[0] == 'apply':
+                m = re_apply.match(l)
+                if not m:
+                    return None
+                (func_name, args) = m.groups()
+                args = [ x.split("=") for x in "".join(args.split()).split(",") if x ]
+                key.append(("apply", func_name) + tuple([ (x[0], objects.get(x[-1], x[-1])) for x in args ]))
+                funcs.append(func_name)
+            else:
+                key.append(tuple(toks))
+            #endif
+        #next l
+    except RuntimeError:
+        #the error is reported when the block is parsed
+        return None
+    for f in funcs:
+        fdef = funcs_lhada.get(f)
+        if fdef:
+            key.append(("function", fdef.template_line, fdef.return_type, fdef.name, fdef.arg_list, fdef.body))
+        #endif
+    #next f
+    return tuple(key)
+#enddef object_block_key
+
 def parse_function_block():
     """Parsing a function block. Information from the function block is not required by the translator, the block is skipped."""
     global funcs_lhada, re_indented, lhadafile
@@ -1274,6 +1642,8 @@ def parse_function_block():
                 raise RuntimeError("Function %s() defined line %d of LHADA file %s was not found in file %s" % (func_name, block_first_line, lhadafile.name, cpp_fname))
             #endif
             funcs_lhada[func_name] = r
+            if r not in funcs_referenced:
+                funcs_referenced.append(r)
 #                (template_line, return_type, func_name, arg_list, func_body) = r
 #            code_template = '''%TEMPLATE_LINE%
 #%RETURN_TYPE% %FUNC_NAME%(%ARG_LIST%){
@@ -1294,22 +1664,64 @@ def parse_function_block():
 #enddef parse_function
 
 
+def reachable_funcs():
+    '''Returns the functions of funcs_all called, directly or indirectly, by the functions of the function blocks (funcs_referenced). Calls are looked for as identifiers in the function bodies, which can only select too many functions, e.g. when a variable has the name of a function.'''
+    by_name = {}
+    for f in funcs_all:
+        by_name.setdefault(f.name, []).append(f)
+    #next f
+    re_id = re.compile(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b')
+    reached = set()
+    to_visit = list(funcs_referenced)
+    while to_visit:
+        f = to_visit.pop()
+        if f in reached:
+            continue
+        #endif
+        reached.add(f)
+        for name in set(re_id.findall(f.body)):
+            #all the overloads of a called function are kept
+            to_visit.extend(by_name.get(name, []))
+        #next name
+    #endwhile
+    return reached
+#enddef reachable_funcs
+
 def gen_func_block():
-    '''Generate code of function defined in the auxilary c++ source files'''
+    '''Generate code of function defined in the auxilary c++ source files. Only the functions used by the function blocks are generated, and the files included by the source files that define them are added to the include list.'''
 
     #functions defined in Lhada files and therefore called in the code
     #generated from the other lhada block are grouped at the end of
     #the function definition block
     
-    code = []
+    reached = reachable_funcs()
     for f in funcs_all:
-        if f not in funcs_lhada.values():
-            code.append(f.rivet_code())
+        if f not in reached:
+            mess("Function %s of file %s is not used, its code is not included." % (f.name, f.source_file))
         #endif
     #next f
+    for file in cpp_files:
+        if [ x for x in reached if x.source_file == file ]:
+            for i in cpp_includes[file]:
+                insert_include(i)
+            #next i
+        #endif
+    #next file
 
-    for fname, fdef in funcs_lhada.iteritems():
-        code.append(fdef.rivet_code())
+    code = []
+    #function definitions already generated, indexed by the function
+    #signature, to skip the functions found in several files
+    defined = {}
+    for f in [ x for x in funcs_all if x in reached and x not in funcs_referenced ] + funcs_referenced:
+        signature = (f.template_line, f.return_type, f.name, " ".join(f.arg_list.split()))
+        if signature in defined:
+            if defined[signature].body != f.body:
+                raise RuntimeError("Error. The function %s is defined differently in the files %s and %s. Analyses that define different functions with the same name cannot be combined." % (f.name, defined[signature].source_file, f.source_file))
+            #endif
+            continue
+        #endif
+        defined[signature] = f
+        code.append(f.rivet_code())
     #next f
 
     return code
@@ -1388,7 +1800,7 @@ def parse_cut_block():
     mess("Cut name: " + cut_name)
     if cut_name in cutblocks:
         raise RuntimeError("Duplicate definition of object %s found line %d of file %s.\t%s\n" % (il, lhadafile.name, line1))
-    cutblocks[cut_name] = CutNode(cut_name)
+    cutblocks[cut_name] = CutNode(cut_prefix + cut_name)
 
 #    func_name = "cut_%s" % cut_name
 
@@ -1412,15 +1824,16 @@ def parse_cut_block():
             break
         toks = l.split()
         if toks[0] in ['select', 'reject']:
-            (expr, extra_dependencies) = parse_cut_line(" ".join(toks[1:]), "")
+            tree = parse_expr(" ".join(toks[1:]))
+            if toks[0] == 'reject':
+                tree = negate_expr(tree)
+            #endif
+            extra_dependencies = []
+            expr = gen_rivet_expr(tree, "", extra_dependencies)
             if extra_dependencies:
                 cutblocks[cut_name].add_dependencies(extra_dependencies)
             else:
-                if toks[0] == 'select':
-                    cutblocks[cut_name].cuts.append(expr)
-                elif toks[0] == 'reject':
-                    cutblocks[cut_name].cuts.append(invert_cond(expr))
-                #endif tok[0]...
+                cutblocks[cut_name].cuts.append(expr)
             #endif dependencies
         else:
             raise RuntimeError("Syntax error in line %d of file %s. Every line of the body of a cut block should start with the keyword 'select'.\n\t%s" % (lhadafile.current_line, lhadafile.name, l))
@@ -1428,135 +1841,285 @@ def parse_cut_block():
         #FIXME: handle duplicate names
         
 
-def invert_cond(expr):
-    '''Invert a mathematical condition expression'''
-    r = re.compile(r'([^*/+-=<>|&^]+)(=|==|!=|<|>|<=|>=)([^*/+-=<>|&^]+)')
-    ops = (('==','!='), ('<', '>='), ('<=', '>'))
-    newop = None
-    if r.match(expr):
-        print '2>', r.groups
-        l, op, r = r.groups()
-        if op == '=':
-            op = '=='
-        for op1, op2 in ops:
-            if op == op1:
-                newop = op2
-                break;
-            elif op == op2:
-                newop = op1
-                break;
+#Tokens of LHADA expressions: numbers, identifiers and operators. A dot
+#following digits belongs to the number only if it is not followed by
+#an identifier (jets[0].pt).
+re_expr_token = re.compile(r'\s*(?:(?P<num>(?:\d+\.\d+|\d+\.(?![a-zA-Z_])|\d+|\.\d+)(?:[eE][+-]?\d+)?)'
+                           r'|(?P<id>[a-zA-Z_][a-zA-Z_0-9]*)'
+                           r'|(?P<op><=|>=|==|!=|&&|\|\||\*\*|[-+*/^<>=!|()\[\],.]))')
+
+#Binding power of the infix operators of LHADA expressions
+expr_infix_power = { "or": 10, "||": 10,
+                     "and": 20, "&&": 20,
+                     "<": 40, ">": 40, "<=": 40, ">=": 40, "=": 40, "==": 40, "!=": 40,
+                     "+": 50, "-": 50,
+                     "*": 60, "/": 60,
+                     "^": 70, "**": 70,
+                     ".": 90, "[": 90, "(": 90 }
+
+#Comparison operators and their negation
+expr_cmp_negation = { "<": ">=", ">=": "<", ">": "<=", "<=": ">", "==": "!=", "!=": "==" }
+
+#Particle attributes and corresponding Rivet accessors
+rivet_attributes = { "pt": "pt", "eta": "eta", "rapidity": "rap", "theta": "theta",
+                     "size": "size", "e": "E", "m": "mass", "phi": "phi",
+                     "px": "px", "py": "py", "pz": "pz", "charge": "charge", "pid": "pid" }
+
+#Rivet accessors of the absolute values of particle attributes
+rivet_abs_attributes = { "eta": "abseta", "rapidity": "absrapidity", "charge": "abscharge", "pid": "abspid" }
+
+#Rivet cut quantities corresponding to particle attributes and to their absolute values
+rivet_cut_quantities = { "pt": "Cuts::pT", "eta": "Cuts::eta", "rapidity": "Cuts::rap", "phi": "Cuts::phi",
+                         "e": "Cuts::E", "E": "Cuts::E", "m": "Cuts::mass",
+                         "px": "Cuts::px", "py": "Cuts::py", "pz": "Cuts::pz",
+                         "charge": "Cuts::charge", "pid": "Cuts::pid" }
+rivet_abs_cut_quantities = { "eta": "Cuts::abseta", "rapidity": "Cuts::absrap", "charge": "Cuts::abscharge", "pid": "Cuts::abspid" }
+
+class ExprNode:
+    '''Node of the syntax tree of a LHADA expression. kind is one of num, name, attr, index, call, abs, neg, not, binop, cmp, and, or. value is the number, the name, the attribute name or the operator, args the list of operands, and argnames the argument names of a call (None for a positional argument). text is the LHADA expression the tree was parsed from.'''
+    def __init__(self, kind, value = None, args = None, argnames = None):
+        self.kind = kind
+        self.value = value
+        self.args = args or []
+        self.argnames = argnames
+        self.text = None
+    #enddef __init__
+#end class ExprNode
+
+class ExprParser:
+    '''Pratt parser of LHADA expressions'''
+    def __init__(self, text):
+        self.text = text
+        self.tokens = []
+        pos = 0
+        text = text.rstrip()
+        while pos < len(text):
+            m = re_expr_token.match(text, pos)
+            if not m:
+                self.error("unexpected character '%s'" % text[pos:].strip()[0])
             #endif
-        #next op1,op2
-    #endif
-    if newop:
-        return l + newop + r;
+            kind = m.lastgroup
+            self.tokens.append((kind, m.group(kind)))
+            pos = m.end()
+        #endwhile
+        self.tokens.append(("end", ""))
+        self.pos = 0
+    #enddef __init__
+
+    def error(self, message):
+        raise RuntimeError("Syntax error in line %d of file %s: %s.\n\t%s\n" % (lhadafile.current_line, lhadafile.name, message, self.text))
+    #enddef error
+
+    def peek(self, offset = 0):
+        return self.tokens[min(self.pos + offset, len(self.tokens) - 1)]
+    #enddef peek
+
+    def next(self):
+        t = self.tokens[self.pos]
+        if t[0] != "end":
+            self.pos += 1
+        return t
+    #enddef next
+
+    def expect(self, op):
+        t = self.next()
+        if t != ("op", op):
+            self.error("'%s' expected, while '%s' was found" % (op, t[1] or "end of line"))
+        #endif
+    #enddef expect
+
+    def parse(self):
+        node = self.expr(0)
+        if self.peek()[0] != "end":
+            self.error("unexpected '%s'" % self.peek()[1])
+        #endif
+        node.text = self.text.strip()
+        return node
+    #enddef parse
+
+    def infix_power(self, t):
+        kind, value = t
+        if kind == "op" or (kind == "id" and value in ["and", "or"]):
+            return expr_infix_power.get(value, 0)
+        return 0
+    #enddef infix_power
+
+    def expr(self, rbp):
+        left = self.prefix()
+        while self.infix_power(self.peek()) > rbp:
+            left = self.infix(self.next()[1], left)
+        #endwhile
+        return left
+    #enddef expr
+
+    def prefix(self):
+        kind, value = self.next()
+        if kind == "num":
+            return ExprNode("num", value)
+        elif kind == "id" and value == "not" or (kind, value) == ("op", "!"):
+            return ExprNode("not", args = [self.expr(30)])
+        elif kind == "id":
+            return ExprNode("name", value)
+        elif value == "-":
+            return ExprNode("neg", args = [self.expr(65)])
+        elif value == "+":
+            return self.expr(65)
+        elif value == "(":
+            node = self.expr(0)
+            self.expect(")")
+            return node
+        elif value == "|":
+            node = ExprNode("abs", args = [self.expr(0)])
+            self.expect("|")
+            return node
+        #endif
+        self.error("unexpected '%s'" % (value or "end of line"))
+    #enddef prefix
+
+    def infix(self, op, left):
+        if op in ["or", "||"]:
+            return ExprNode("or", args = [left, self.expr(10)])
+        elif op in ["and", "&&"]:
+            return ExprNode("and", args = [left, self.expr(20)])
+        elif op in ["^", "**"]:
+            #right associative
+            return ExprNode("binop", "^", [left, self.expr(69)])
+        elif op in ["+", "-", "*", "/"]:
+            return ExprNode("binop", op, [left, self.expr(expr_infix_power[op])])
+        elif op == ".":
+            kind, name = self.next()
+            if kind != "id":
+                self.error("attribute name expected after '.'")
+            return ExprNode("attr", name, [left])
+        elif op == "[":
+            node = ExprNode("index", args = [left, self.expr(0)])
+            self.expect("]")
+            return node
+        elif op == "(":
+            if left.kind != "name":
+                self.error("only named functions can be called")
+            node = ExprNode("call", left.value, [], [])
+            while self.peek() != ("op", ")"):
+                if node.args:
+                    self.expect(",")
+                if self.peek()[0] == "id" and self.peek(1) == ("op", "="):
+                    node.argnames.append(self.next()[1])
+                    self.next()
+                else:
+                    node.argnames.append(None)
+                #endif
+                node.args.append(self.expr(0))
+            #endwhile
+            self.expect(")")
+            return node
+        #endif
+        #comparison, a < b < c is read as a < b and b < c
+        right = self.expr(40)
+        node = ExprNode("cmp", {"=": "=="}.get(op, op), [left, right])
+        while self.peek()[0] == "op" and self.peek()[1] in ["<", ">", "<=", ">=", "=", "==", "!="]:
+            op = self.next()[1]
+            left = right
+            right = self.expr(40)
+            node = ExprNode("and", args = [node, ExprNode("cmp", {"=": "=="}.get(op, op), [left, right])])
+        #endwhile
+        return node
+    #enddef infix
+#end class ExprParser
+
+def parse_expr(text):
+    '''Parse a LHADA expression. Returns its syntax tree (ExprNode)'''
+    return ExprParser(text).parse()
+
+def negate_expr(node):
+    '''Returns the syntax tree of the negation of an expression. Comparisons are inverted and De Morgan's laws applied, other expressions are negated with a not.'''
+    if node.kind == "cmp":
+        r = ExprNode("cmp", expr_cmp_negation[node.value], node.args)
+    elif node.kind in ["and", "or"]:
+        r = ExprNode({"and": "or", "or": "and"}[node.kind], args = [negate_expr(x) for x in node.args])
+    elif node.kind == "not":
+        r = node.args[0]
     else:
-        return "!(%s)" % expr
-#endif invert_cond
-    
-    
-def parse_cut_line(l, pref):
-    ''' '''
-    dependencies = []
-    l = l.strip()
-    r = ""
-    toks_ = re.split("([\W]+)", l)
-    #fixing some splitting failures:
-    toks = []
-    for t in toks_:
-        tt = re.split(r"(<=|>=|[\]\[()=<>])", t)
-        toks.extend(tt)
-    #next t
-    toks_ = toks
-    toks = []
-    state = "init"
-    for t in toks_:
-        if state == "init" and t.strip() == "|":
-            state = "first|"
-        elif state == "first|" and t.strip() == "|":
-            toks[-1] = "|" + toks[-1] + "|"
-            state = "init"
-        else:
-            toks.append(t)
+        r = ExprNode("not", args = [node])
+    #endif
+    if node.text:
+        r.text = "not (%s)" % node.text
+    return r
+#enddef negate_expr
+
+#Precedence of the c++ operators produced by gen_rivet_expr
+rivet_precedence = { "or": 1, "and": 2, "cmp": 3, "+": 4, "-": 4, "*": 5, "/": 5, "neg": 6, "not": 6 }
+
+def gen_rivet_expr(node, pref, dependencies = None):
+    '''Translate the syntax tree of a LHADA expression to c++ code. pref is prepended to particle attributes (e.g. "p."). Cut blocks the expression refers to are appended to the dependencies list.'''
+    (code, prec) = gen_rivet_expr_(node, pref, dependencies)
+    return code
+
+def gen_rivet_expr_(node, pref, dependencies):
+    '''Implementation of gen_rivet_expr. Returns the code and the precedence of its operator (9 for a primary expression)'''
+    def sub(n, min_prec):
+        (code, prec) = gen_rivet_expr_(n, pref, dependencies)
+        if prec < min_prec:
+            return "(%s)" % code
+        return code
+    #enddef sub
+    kind = node.kind
+    if kind == "num":
+        return (node.value, 9)
+    elif kind == "name":
+        name = node.value
+        if name in rivet_attributes:
+            return ("%s%s()" % (pref, rivet_attributes[name]), 9)
+        elif name in objects:
+            return (objects[name], 9)
+        elif name in cutblocks:
+            if dependencies is not None:
+                dependencies.append(cutblocks[name])
+            return ("cut_%s(w)" % cutblocks[name].name, 9)
+        elif name in funcs_lhada:
+            return (name, 9)
         #endif
-    #next t
-
-    ops = [ "+", "-", "/", "*", "^", "**"]
-    r = ""
-
-    trans = {
-        r"^\|\s*eta\s*\|$": "%sabseta()",
-        r"^eta$": "%seta() ",
-        r"^\|\s*rapidity[\s]*\|$": "%sabsrapidity()",
-        r"^rapidity$": "%srap() ",
-        r"^theta$": "%stheta() ",
-        r"^size$": "%ssize()",
-        r"^and$": " && ",
-        r"^or$": " || ",
-        r"^e$": "%sE() ",
-        r"^pt$": "%spt() ",
-        r"^m$": "%smass() ",
-        r"^phi$": "%sphi() ",
-        r"^px$": "%spx() ",
-        r"^py$": "%spy() ",
-        r"^pz$": "%spz() ",
-        r"^\.$": ".",
-        r"^\($": "(",
-        r"^\)$": ") ",
-        r"^>$": "> ",
-        r"^<$": " < ",
-        r"^>=$": " >= ",
-        r"^<=$": " >= ",
-        r"^=$": " == ",
-        r"^==$": " == ",
-        r"^\+" : " + ",
-        r"^-$": " - ",
-        r"^\*$": " * ",
-        r"^,$": ", "
-    };
-
-    for (k,v) in trans.iteritems():
-        trans[k] = v.replace("%s", pref)
-
-    for tok in toks:
-        tok = tok.strip()
-        if len(tok) == 0:
-            continue
-        done = False
-        for k, v in trans.iteritems():
-            if re.match(k, tok):
-                r += v
-                done = True
-                break
-            #endif
-        #next k,v
-        if done:
-            continue
-        p = re.match(r'[a-zA-Z_][a-zA-Z_0-9]', tok)
-        if p:
-            if tok in objects:
-                r += tok
-                continue
-            #endif
-            if tok in cutblocks:
-                r += "cut_%s(w)" % tok
-                dependencies.append(cutblocks[tok])
-                continue
-            #endif
-            if tok in funcs_lhada:
-                r +=  tok
-                continue
-            raise RuntimeError("Entity '%s' referred line %d in file %s is not defined.\n\t%s\n" % (tok, lhadafile.current_line, lhadafile.name, l))
+        raise RuntimeError("Entity '%s' referred line %d in file %s is not defined.\n\t%s\n" % (name, lhadafile.current_line, lhadafile.name, lhadafile.current_line_contents.strip()))
+    elif kind == "attr":
+        if node.value not in rivet_attributes:
+            raise RuntimeError("Entity '%s' referred line %d in file %s is not defined.\n\t%s\n" % (node.value, lhadafile.current_line, lhadafile.name, lhadafile.current_line_contents.strip()))
+        return ("%s.%s()" % (sub(node.args[0], 9), rivet_attributes[node.value]), 9)
+    elif kind == "index":
+        return ("%s[%s]" % (sub(node.args[0], 9), sub(node.args[1], 0)), 9)
+    elif kind == "call":
+        if node.value not in funcs_lhada:
+            raise RuntimeError("Error in line %d of file %s: the function %s was not declared. A 'function' block must declare it before its usage." %(lhadafile.current_line, lhadafile.name, node.value))
+        args = OrderedDict()
+        for i, (argname, arg) in enumerate(zip(node.argnames, node.args)):
+            args[argname or i] = sub(arg, 0)
+        #next argname, arg
+        return ("%s(%s)" % (node.value, gen_arg_list(node.value, args)), 9)
+    elif kind == "abs":
+        a = node.args[0]
+        if a.kind == "name" and a.value in rivet_abs_attributes:
+            return ("%s%s()" % (pref, rivet_abs_attributes[a.value]), 9)
+        elif a.kind == "attr" and a.value in rivet_abs_attributes:
+            return ("%s.%s()" % (sub(a.args[0], 9), rivet_abs_attributes[a.value]), 9)
         #endif
-        if tok == '[':
-            r += "["
-            continue
-        if tok == ']':
-            r += "]"
-            continue
-        r += tok
-    #TODO: handle function named arguments
-    return (r.rstrip(), dependencies)
+        return ("std::abs(%s)" % sub(a, 0), 9)
+    elif kind == "neg":
+        return ("-%s" % sub(node.args[0], 7), 6)
+    elif kind == "not":
+        return ("!%s" % sub(node.args[0], 9), 6)
+    elif kind == "binop":
+        if node.value == "^":
+            return ("pow(%s, %s)" % (sub(node.args[0], 0), sub(node.args[1], 0)), 9)
+        prec = rivet_precedence[node.value]
+        #operands of same precedence on the right need parentheses: a - (b - c)
+        return ("%s %s %s" % (sub(node.args[0], prec), node.value, sub(node.args[1], prec + 1)), prec)
+    elif kind == "cmp":
+        prec = rivet_precedence["cmp"]
+        return ("%s %s %s" % (sub(node.args[0], prec + 1), node.value, sub(node.args[1], prec + 1)), prec)
+    else: #and, or
+        prec = rivet_precedence[kind]
+        op = {"and": " && ", "or": " || "}[kind]
+        return (op.join([ sub(x, prec) for x in node.args ]), prec)
+    #endif
+#enddef gen_rivet_expr_
 
 #under dev# def gen_histo_code():
 #under dev#     """Generates the code to book and fill histograms of the analysis. For a cut and count analysis, an histogram with one enty per region is filled"""
@@ -1629,7 +2192,7 @@ def gen_object_decl():
     code = '''/** Analysis objects
  * @{
  */'''
-    for lhada_obj, cpp_obj in objects.iteritems():
+    for cpp_obj in declared_objects:
         cpp_type = types[cpp_obj]
         code += "\n%s %s;\n" % (cpp_type, cpp_obj)
     code += '''/** @}
@@ -1685,8 +2248,9 @@ def gen_cut_func_code():
                 implemented_cut_blocks.append(cutblock.name)
                 cutblock.order = cut_order
                 code += multi_replace('''bool %FUNC%(double w){
-%I%std::vector<int> cfs = {%CUTFLOW_LIST%};
+%I%static constexpr int cfs[] = {%CUTFLOW_LIST%};
 %I%bool r = true;
+%I%int npassed = 0; //number of cuts passed, the cut flows are filled at once
 ''', {"%I%": indent, \
       "%FUNC%": func_name, \
       "%CUTFLOW_LIST%": ", ".join(["k%s" % x.name.capitalize() for x in cutblock.cutflows])})
@@ -1697,23 +2261,24 @@ def gen_cut_func_code():
             for expr in cutblock.cuts:
                 if make_code:
                     code += multi_replace('''
-%I%r = r && fillCutFlows(cfs, %CUT_ORDER%,
-%I%                      %EXPR%,
-%I%                      w);''',  {"%I%": indent, \
-       "%CUT_ORDER%": str(cut_order), \
+%I%r = r && (%EXPR%);
+%I%npassed += r;''',  {"%I%": indent, \
         "%EXPR%": expr})
                 #endif make_code
                 cut_order += 1 #expr. sequence order in the cut flow
             #next expr
             if make_code:
-                code += "\n%sreturn r;\n};\n\n" % indent
+                code += "\n\n%sfillCutFlows(cfs, %d, npassed, w);\n%sreturn r;\n};\n\n" % (indent, cutblock.order, indent)
         #next cutblock
     #next cf, cl
     return code
 #enddef gen_cut_func_code
 
 def gen_code():
-    global analysis_code_template, includes, include_block, objects, func_codes, vector3ToFourMometum
+    global analysis_code_template, includes, include_block, declared_objects, func_codes, vector3ToFourMometum
+
+    #Generated first, as it adds the includes of the auxiliary c++ files
+    func_block = gen_func_block()
 
     #Generate #include list block:
     for i in includes:
@@ -1746,7 +2311,7 @@ def gen_code():
         func_codes.insert(0, cast_op)
     #endif
 
-    func_codes.extend(gen_func_block())
+    func_codes.extend(func_block)
 
     func_codes.append(gen_cutflowfill_func_code())
 
@@ -1754,19 +2319,32 @@ def gen_code():
 
     cut_flow_code = gen_cut_call_code()
     
-    # we substitute the code block in two steps in
-    # order to check if the instance 'particles' is used
-    # before generating the code that creates it.
-    
+    #check if particles objet is used: look for the particles variable,
+    #excluding the particles() member functions of the projections
+    re_particles = re.compile(r'(?<![\w.])%s\b(?!\s*\()' % re.escape(particles))
+    blocks = [obj_def, proj_init, cut_flow_code] + obj_cuts + func_codes
+    if [ x for x in blocks if re_particles.search(x) ]:
+        particles_def = '''particles = applyProjection<FinalState>(event, "fs").particles();'''
+        fs_proj_init = '''addProjection(fs, "fs");'''
+    else:
+        particles_def = ""
+        fs_proj_init = ""
+        declared_objects = [ x for x in declared_objects if x != particles ]
+
+    obj_decl = gen_object_decl()
+
     # Inserts complete code blocks in the code template:
     subst_map = {"%INCLUDE_BLOCK%": include_block,
+                 "%ANALYSIS_NAME%": analysis_name,
                  "%DECL_CF_IDS%": decl_cf_ids,
                  "%CFS_DECL%": cfs_decl,
                  "%CFS_INIT%": cfs_init,
+                 "%FS_PROJ_INIT%": fs_proj_init,
                  "%PROJECTION_INIT%": proj_init,
                  "%COUNTER_INIT%": counter_init,
+                 "%PARTICLES_DEFINITION%": particles_def,
                  "%OBJECT_DEFINITIONS%": obj_def,
-                 "%COUNTER_FILL%": counter_fill,
+                 "%OBJECT_DECLARATION%":  obj_decl,
                  "%COUNTER_DECLARATION%": counter_decl,
                  "%OBJECT_CUTS%": "\n\n".join(obj_cuts), 
                  "%FUNCTION_DEFINITIONS%": "\n\n".join(func_codes),
@@ -1775,34 +2353,12 @@ def gen_code():
                  "%COUNTER_FILL%":""
     }
 
-    code = block_replace(analysis_code_template, subst_map)
-    subst_map = { "%ANALYSIS_NAME%": analysis_name}
-    code = multi_replace(code, subst_map)
-    #check if particles objet is used
-    re_particles = re.compile(r'\bparticle\b')
-    re_particles_func = re.compile(r'\bparticle\s*\(')
-    #we remove particle() function call and look for a remaining particle word:
-    if re_particles.match(re_particles_func.sub("", code)):
-        particles_def = '''particles = applyProjection<FinalState>(event, "fs");'''
-        fs_proj_init = '''addProjection(fs, "fs")'''
-    else:
-        particles_def = ""
-        fs_proj_init = ""
-        objects = OrderedDict([(k, v) for k, v in objects.iteritems() if v != "particles"])
-
-    obj_decl = gen_object_decl()
-
-    subst_map = {"%FS_PROJ_INIT%": fs_proj_init,
-                 "%PARTICLES_DEFINITION%": particles_def,
-                 "%OBJECT_DECLARATION%":  obj_decl}
+    for i in range(1, nhooks + 1):
+        subst_map['%%USER_CODE_%d%%' % i] = user_code(vars(args)["user_code_%d" % i])
+    #next i
 
-    code = block_replace(code, subst_map)
+    code = compile_template(analysis_code_template).render(subst_map)
 
-    for i in range(1, nhooks + 1):
-        filename = vars(args)["user_code_%d" % i]
-        code = add_user_code(i, filename, code)
-    #next c
-        
     with open(analysis_name + ".cc", "w") as f:
         f.write(code + "\n")
         
@@ -1811,10 +2367,21 @@ def gen_code():
 
         
 
+def begin_analysis(prefix):
+    '''Prepares the parsing of a new LHADA file. The names defined in a LHADA file (objects, cut blocks, functions, tables) are local to this file, while the generated code is shared by all the analyses. prefix is prepended to the c++ names of the cut blocks.'''
+    global objects, cutblocks, funcs_lhada, tables, ana_info, cut_prefix
+    objects = OrderedDict([("Particles", particles)])
+    cutblocks = {}
+    funcs_lhada = {}
+    tables = {}
+    ana_info = {}
+    cut_prefix = prefix
+#enddef begin_analysis
+
 def main():
-    parser = argparse.ArgumentParser(description='Produce Rivet code for an analysis decribed in LHADA format.')
+    parser = argparse.ArgumentParser(description='Produce Rivet code for an analysis decribed in LHADA format. When several LHADA files are given, a single Rivet analysis is produced, in which the objects defined identically in several files are computed once, while each analysis keeps its own cut flows, whose names are prefixed with the LHADA file name.')
     
-    parser.add_argument('lhadafile', action='store', default=None,
+    parser.add_argument('lhadafiles', action='store', nargs='+', default=None, metavar='lhadafile',
                         help='File describing the analysis')
 
     parser.add_argument('analysis_name', action='store', default=None,
@@ -1827,13 +2394,24 @@ def main():
 
     parser.add_argument('-d', '--debug', action='store_true', default = False, help='Activate debug mode.')
 
+    parser.add_argument('--cache-dir', action='store', default=os.path.join(os.path.expanduser("~"), ".cache", "lhada2rivet"), help='Directory where the results of the checks of the C++ code are cached. An empty value disables the cache.')
+
     global args
     
     args = parser.parse_args()
 
-    parse(args.lhadafile)
+    for lhadafile_name in args.lhadafiles:
+        if len(args.lhadafiles) > 1:
+            prefix = unique_name(canonize_analysis_name(os.path.splitext(os.path.basename(lhadafile_name))[0])) + "_"
+        else:
+            prefix = ""
+        #endif
+        begin_analysis(prefix)
+        parse(lhadafile_name)
+        build_cutflows()
+    #next lhadafile_name
 
-    build_cutflows()
+    check_code_files(code_files)
     
     gen_code()
 
@@ -1862,12 +2440,12 @@ def build_cutflows():
         #endif
     #next v
 
-def add_user_code(pos, src, dst):
+def user_code(src):
+    '''Returns the user code to insert in the analysis code, read from the file src'''
     if src:
-        to_insert = open(src, 'r').read()
-        return block_replace(dst, {'%%USER_CODE_%d%%' % pos: to_insert})
+        return open(src, 'r').read()
     else:
-        return block_replace(dst, {'%%USER_CODE_%d%%' % pos: ""})
+        return ""
 #end
     
 
@@ -1906,10 +2484,12 @@ cutflows.fillinit(w);
 #enddef
 
 def gen_cutflowfill_func_code():
-    '''Generate c++ code for the fillCutFlows function'''
-    return multi_replace('''bool fillCutFlows(const std::vector<int>& cfs, int icut, bool passed, double w){
-%I%for(auto& icf: cfs) cutflows[icf].fill(icut + 1, passed, w);
-%I%return passed;
+    '''Generate c++ code for the fillCutFlows function, which fills the cut flows cfs for the npassed cuts following the first icut cuts'''
+    return multi_replace('''template<size_t N>
+void fillCutFlows(const int (&cfs)[N], int icut, int npassed, double w){
+%I%for(int icf: cfs){
+%I%%I%for(int i = 1; i <= npassed; ++i) cutflows[icf].fill(icut + i, true, w);
+%I%}
 }\n\n''', { "%I%": indent})
     
 def print_dependencies():
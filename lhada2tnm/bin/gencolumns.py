@@ -0,0 +1,172 @@
+#!/usr/bin/python
+#--------------------------------------------------------------------------------
+# Description: generate synthetic events in the columnar format read by
+#              icolumnstream, so that translated analyzers can be run and
+#              benchmarked without ROOT input files (see lhada2tnm.py -m)
+#--------------------------------------------------------------------------------
+import sys, os, optparse, random, math
+from lhadacolumns import ColumnWriter
+#--------------------------------------------------------------------------------
+USAGE ='''
+    Usage:
+       gencolumns.py [options] output-file-name
+
+    Options:
+    -n number of events                  [10000]
+    -f format, delphes or nanoaod        [delphes]
+    -s seed of random number generator   [12345]
+    '''
+
+# columns of each object in the Delphes and CMS nano-AOD formats, as read by
+# the corresponding event adapters, and how to generate them
+DELPHES = {'objects': [('Jet',      'jet'),
+                       ('Electron', 'electron'),
+                       ('Muon',     'muon'),
+                       ('Photon',   'photon')],
+           'kinematics': ['PT', 'Eta', 'Phi', 'Mass'],
+           'extra':  {'Jet':      ['BTag', 'Beta', 'BetaStar', 'Charge',
+                                   'DeltaEta', 'DeltaPhi', 'EhadOverEem',
+                                   'MeanSqDeltaR', 'NCharged', 'NNeutrals',
+                                   'TauTag'],
+                      'Electron': ['Charge', 'IsolationVar',
+                                   'IsolationVarRhoCorr'],
+                      'Muon':     ['Charge', 'IsolationVar',
+                                   'IsolationVarRhoCorr'],
+                      'Photon':   ['IsolationVar', 'IsolationVarRhoCorr']},
+           'separator': '.',
+           'met':    [('MissingET.MET', 'met'),
+                      ('MissingET.Eta', 'zero'),
+                      ('MissingET.Phi', 'phi'),
+                      ('ScalarHT.HT',   'ht')]}
+
+NANOAOD = {'objects': [('Jet',      'jet'),
+                       ('Electron', 'electron'),
+                       ('Muon',     'muon'),
+                       ('Photon',   'photon')],
+           'kinematics': ['pt', 'eta', 'phi', 'mass'],
+           'extra':  {'Jet':      ['area', 'bReg', 'btagCMVA', 'btagCSVV2',
+                                   'btagDeepB', 'btagDeepC', 'btagDeepFlavB',
+                                   'chEmEF', 'chHEF'],
+                      'Electron': ['charge'],
+                      'Muon':     ['charge'],
+                      'Photon':   []},
+           'separator': '_',
+           'met':    [('MET_pt',           'met'),
+                      ('MET_phi',          'phi'),
+                      ('MET_sumEt',        'ht'),
+                      ('MET_significance', 'significance')]}
+
+# mean multiplicity, minimum pT, slope of pT spectrum, and mass
+PARTICLES = {'jet':      (6.0, 20.0, 80.0, 10.0),
+             'electron': (0.6, 10.0, 30.0, 0.000511),
+             'muon':     (0.6, 10.0, 30.0, 0.105),
+             'photon':   (0.4, 10.0, 30.0, 0.0)}
+#--------------------------------------------------------------------------------
+def decodeCommandLine():
+    parser = optparse.OptionParser(usage=USAGE)
+
+    parser.add_option("-n", "--nevents",
+                      action="store",
+                      dest="nevents",
+                      type="int",
+                      default=10000,
+                      help="number of events")
+
+    parser.add_option("-f", "--format",
+                      action="store",
+                      dest="format",
+                      type="string",
+                      default='delphes',
+                      help="format of events (delphes or nanoaod)")
+
+    parser.add_option("-s", "--seed",
+                      action="store",
+                      dest="seed",
+                      type="int",
+                      default=12345,
+                      help="seed of random number generator")
+
+    options, args = parser.parse_args()
+    if len(args) == 0:
+        sys.exit(USAGE)
+    if options.format not in ['delphes', 'nanoaod']:
+        sys.exit('** gencolumns.py ** unknown format %s' % options.format)
+    return (args[0], options)
+
+def poisson(mean):
+    # Knuth's algorithm, adequate for small means
+    limit = math.exp(-mean)
+    n, p  = 0, random.random()
+    while p > limit:
+        n += 1
+        p *= random.random()
+    return n
+
+def extraValue(name):
+    # plausible values of the other attributes
+    lname = name.lower()
+    if   lname == 'charge':
+        return random.choice([-1, 1])
+    elif lname in ['btag', 'tautag']:
+        return int(random.random() < 0.2)
+    elif lname in ['ncharged', 'nneutrals']:
+        return poisson(10.0)
+    elif lname.startswith('isolationvar'):
+        return random.expovariate(20.0)
+    return random.random()
+#--------------------------------------------------------------------------------
+def main():
+    filename, option = decodeCommandLine()
+    random.seed(option.seed)
+    if option.format == 'delphes':
+        fmt = DELPHES
+    else:
+        fmt = NANOAOD
+
+    out = ColumnWriter(filename)
+    sep = fmt['separator']
+    for obj, ptype in fmt['objects']:
+        for name in fmt['kinematics'] + fmt['extra'][obj]:
+            out.add('%s%s%s' % (obj, sep, name), True)
+    for name, what in fmt['met']:
+        out.add(name, False)
+
+    pt, eta, phi, mass = fmt['kinematics']
+    for event in range(option.nevents):
+        ht = 0.0
+        for obj, ptype in fmt['objects']:
+            mean, ptmin, slope, m = PARTICLES[ptype]
+            n = poisson(mean)
+            # objects are ordered in decreasing pT
+            pts = sorted([ptmin + random.expovariate(1.0/slope)
+                          for i in range(n)], reverse=True)
+            ht += sum(pts)
+            out['%s%s%s' % (obj, sep, pt)].fill(pts)
+            out['%s%s%s' % (obj, sep, eta)].fill(\
+                [random.gauss(0, 1.5) for i in range(n)])
+            out['%s%s%s' % (obj, sep, phi)].fill(\
+                [random.uniform(-math.pi, math.pi) for i in range(n)])
+            out['%s%s%s' % (obj, sep, mass)].fill([m]*n)
+            for name in fmt['extra'][obj]:
+                out['%s%s%s' % (obj, sep, name)].fill(\
+                    [extraValue(name) for i in range(n)])
+
+        met = random.expovariate(1.0/(30.0 + 0.1*ht))
+        values = {'met': met,
+                  'zero': 0.0,
+                  'phi': random.uniform(-math.pi, math.pi),
+                  'ht': ht,
+                  'significance': met / math.sqrt(max(ht, 1.0))}
+        for name, what in fmt['met']:
+            out[name].fill(values[what])
+        out.commit()
+
+        if event % 10000 == 0: print(event)
+
+    out.close()
+    print('wrote %d events to %s' % (option.nevents, filename))
+#--------------------------------------------------------------------------------
+try:
+    main()
+except KeyboardInterrupt:
+    print('\nciao!')
@@ -12,7 +12,7 @@
 #          20-Mar-2019 HBP fix implicit loop bug and make implicit loops more
 #                      robust
 #--------------------------------------------------------------------------------
-import sys, os, re, optparse, urllib
+import sys, os, re, optparse, urllib, json
 from time import ctime
 from string import joinfields, split, replace, find, strip, lower, rstrip
 #--------------------------------------------------------------------------------
@@ -21,7 +21,8 @@ VERSION = 'v1.0.3'
 DEBUG = 0
 
 # ADL block types
-BLOCKTYPES = ['info', 'table', 'function', 'object', 'variable', 'cut']
+BLOCKTYPES = ['info', 'table', 'function', 'object', 'variable', 'cut',
+              'variation']
 
 # ADL keywords
 KEYWORDS   = ['experiment',
@@ -34,7 +35,8 @@ KEYWORDS   = ['experiment',
               'doi',
               'arg',
               'code',
-              'take', 'select', 'apply', 'reject']
+              'pure',
+              'take', 'select', 'apply', 'reject', 'weight']
     
 TOKENS = set(BLOCKTYPES+KEYWORDS)
 
@@ -54,6 +56,9 @@ scrubdot = re.compile('[a-zA-Z]+[.]')
 getfunctions = re.compile('^\s*[\w_]+\s+[a-zA-Z][\w_]+\s*[(][^{]+', re.M)
 tlorentz_vector = re.compile('vector\s*[<]\s*TLorentzVector\s*[>]')
 nip      = re.compile('[_](?=[a-zA-Z])|(?<=[a-zA-Z0-9])[_](?= )')
+# a threshold to be scanned, e.g., select Meff > scan(1000, 2000, 11)
+getscan  = re.compile(r'^(.+?)\s*(>=|<=|>|<)\s*scan\s*[(]'\
+                      r'([^,]+),([^,]+),([^,)]+)[)]\s*$')
 
 # some objects are singletons, that is, there is only one instance of the
 # object per event. try to guess which ones:
@@ -68,7 +73,8 @@ NAMES = {'name': 'analyzer',
              'aodimpl': '',
              'adapter': 'adapter',
              'analyzer': 'analyzer',
-             'version': VERSION
+             'version': VERSION,
+             'csedef': ''
              }
     
 SINGLETON_CACHE = set()
@@ -89,18 +95,22 @@ using namespace std;
 // The following functions, objects, and variables are globally visible
 // within this programming unit.
 //------------------------------------------------------------------
-%(fundef)s
+// event counter, used to invalidate per-event caches
+long	lhadaEvent = 0;
+%(timers)s%(fundef)s
 //------------------------------------------------------------------
 %(vardef)s
 //------------------------------------------------------------------
 %(objdef)s
 //------------------------------------------------------------------
+%(csedef)s
+//------------------------------------------------------------------
 %(cutdef)s
 //------------------------------------------------------------------
 %(name)s_s::%(name)s_s()
 {
 %(vobjects)s
-%(vcuts)s }
+%(vcuts)s%(vcolumns)s%(vtimers)s }
 
 %(name)s_s::~%(name)s_s() {}
 
@@ -108,28 +118,20 @@ using namespace std;
 {
   // copy to internal buffers
 %(copyargsimpl)s
+  // invalidate per-event caches
+  lhadaEvent++;
+
   // create filtered objects
-  for(size_t c=0; c < objects.size(); c++) objects[c]->create();
-    
+%(createimpl)s
 %(varimpl)s
   // apply event level selections
-  for(size_t c=0; c < cuts.size(); c++)
-    { 
-      cuts[c]->reset();
-      cuts[c]->apply();
-    }
-}
+%(applyimpl)s}
 
 void %(name)s_s::summary(TFile* fout, ostream& os)
 {
   os << std::endl << "Summary" << std::endl << std::endl;
-  for(size_t c=0; c < cuts.size(); c++)
-    {
-      cuts[c]->summary(os);
-      cuts[c]->write(fout);
-    }
-}
-'''
+%(summaryimpl)s%(timersummary)s}
+%(cacheimpl)s'''
 
 # C++ ADL analyzer header template
 TEMPLATE_HH =\
@@ -145,8 +147,10 @@ TEMPLATE_HH =\
 #include <iostream>
 #include "TFile.h"
 #include "TH1F.h"
+#include "TH2F.h"
+#include "TH3F.h"
 #include "TEParticle.h"
-//------------------------------------------------------------------
+%(timerdef)s//------------------------------------------------------------------
 struct lhadaThing
 {
   lhadaThing() {}
@@ -154,12 +158,25 @@ struct lhadaThing
   virtual void reset() {}
   virtual void create() {}
   virtual bool apply() { return true; }
+  virtual bool operator()() { return true; }
   virtual void write(TFile* fout) {}
   virtual void summary(std::ostream& os) {}
 };
+
+// stand-in for a filtered collection of which only the number of
+// elements is needed
+struct lhadaCounter
+{
+  lhadaCounter() : n(0) {}
+  void   clear()                      { n = 0; }
+  void   push_back(const TEParticle&) { n++; }
+  size_t size() const                 { return n; }
+  size_t n;
+};
     
 struct %(name)s_s
 {
+  // registries of the blocks; run() calls the blocks directly
   std::vector<lhadaThing*> objects;
   std::vector<lhadaThing*> cuts;
 
@@ -167,7 +184,7 @@ struct %(name)s_s
   ~%(name)s_s();
   void run(%(runargs)s);
   void summary(TFile* fout, std::ostream& os);
-};
+%(cachedecl)s%(timerdecl)s};
 #endif
 '''
 
@@ -182,9 +199,42 @@ TNM_TEMPLATE_CC =\
 #include "tnm.h"
 #include "%(adaptername)s.h"
 #include "%(name)s_s.h"
-
+%(streaminclude)s
 using namespace std;
 //------------------------------------------------------------------
+// Return the entries to be processed: all of them, or, if the third
+// command line argument is given as <file>:<cut>, those that passed the
+// cut in a previous run with skims (see lhada2tnm.py -s)
+//------------------------------------------------------------------
+vector<int> skimEntries(int argc, char** argv, int nevents)
+{
+  vector<int> entries;
+  if ( argc < 4 )
+    {
+      entries.resize(nevents);
+      for(int c=0; c < nevents; c++) entries[c] = c;
+      return entries;
+    }
+
+  string skim(argv[3]);
+  size_t colon = skim.rfind(':');
+  if ( colon == string::npos )
+    error("expected skim as <file>:<cut>, but got " + skim);
+  itreestream stream(skim.substr(0, colon), "skim_" + skim.substr(colon+1));
+  if ( !stream.good() ) error("can't read skim " + skim);
+  int entry = 0;
+  stream.select("lhadaEntry", entry);
+  entries.resize(stream.size());
+  for(size_t c=0; c < entries.size(); c++)
+    {
+      stream.read(c);
+      entries[c] = entry;
+    }
+  stream.close();
+  cout << "number of skimmed events: " << entries.size() << endl;
+  return entries;
+}
+%(cachefun)s%(samplefun)s//------------------------------------------------------------------
 int main(int argc, char** argv)
 {
   // If you want canvases to be visible during program execution, just
@@ -196,21 +246,7 @@ int main(int argc, char** argv)
     
   // Get names of ntuple files to be processed
   vector<string> filenames = fileNames(cl.filelist);
-
-  // Create tree reader
-  itreestream stream(filenames, "%(treename)s");
-  if ( !stream.good() ) error("can't read root input files");
-
-  // Create a buffer to receive events from the stream
-  // The default is to select all branches
-  // Use second argument to select specific branches
-  // Example:
-  //   varlist = 'Jet_PT Jet_Eta Jet_Phi'
-  //   ev = eventBuffer(stream, varlist)
-
-  eventBuffer ev(stream);
-  int nevents = ev.size();
-  cout << "number of events: " << nevents << endl;
+%(cacheread)s%(streamopen)s  cout << "number of events: " << nevents << endl;
 
   // Create output file for histograms; see notes in header 
   outputFile of(cl.outputfilename);
@@ -226,21 +262,43 @@ int main(int argc, char** argv)
   %(adaptername)s %(adapter)s;
 
   %(name)s_s %(analyzer)s;
+
+  // external objects, which are refilled for every event. declaring them
+  // outside the event loop allows their memory to be reused.
+%(extobjdecl)s%(cacheopen)s%(skimopen)s%(timeropen)s
+  // number of heap allocations after the first event
+  // (counted only if compiled with -DLHADA_COUNT_ALLOCATIONS)
+  long nallocations = 0;
+
+  // process all entries, or only those listed in a skim written by
+  // a previous run
+  vector<int> entries = skimEntries(argc, argv, nevents);
+%(sampleopen)s
   //------------------------------------------------------------------
   // Loop over events
   //------------------------------------------------------------------
-  for(int entry=0; entry < nevents; entry++)
+  size_t nprocessed = 0;
+  for(size_t c=0; c < entries.size(); c++)
     {
-      // read an event into event buffer
-      ev.read(entry);
+      nprocessed++;
+      int entry = entries[c];
 
-      if ( entry %(percent)s 10000 == 0 ) cout << entry << endl;
+      // read an event into event buffer
+%(readimpl)s
+      if ( c %(percent)s 10000 == 0 ) cout << c << endl;
 
 %(extobjimpl)s
-%(runimpl)s
+%(runimpl)s%(cachestore)s%(skimstore)s%(samplestore)s
+      if ( c == 0 ) nallocations = TEParticle::allocations();
     }
 
-  // summarize analysis
+  if ( (TEParticle::allocations() >= 0) && (nprocessed > 1) )
+    cout << "heap allocations per event: "
+         << (double)(TEParticle::allocations() - nallocations)
+      /(nprocessed-1)
+         << endl;
+
+%(cacheclose)s%(skimclose)s%(sampleclose)s  // summarize analysis
   %(analyzer)s.summary(of.file_, cout);
 
   ev.close();
@@ -248,15 +306,296 @@ int main(int argc, char** argv)
   return 0;
 }
 '''
+# default reading of events with itreestream (see also process_columnar)
+STREAMOPEN_CC = '''
+  // Create tree reader
+  itreestream stream(filenames, "%(treename)s");
+  if ( !stream.good() ) error("can't read root input files");
+
+  // Create a buffer to receive events from the stream
+  // The default is to select all branches
+  // Use second argument to select specific branches
+  // Example:
+  //   varlist = 'Jet_PT Jet_Eta Jet_Phi'
+  //   ev = eventBuffer(stream, varlist)
+
+  eventBuffer ev(stream);
+  int nevents = ev.size();
+'''
+
+# per-event conversion of vector<TEParticle> to vector<TLorentzVector>
+CONVERT_CC =\
+'''//
+// per-event cache of conversions of vector<TEParticle> to
+// vector<TLorentzVector>, keyed by the address of the object
+struct lhadaConversion
+{
+  const vector<TEParticle>* source;
+  long  event;
+  vector<TLorentzVector> target;
+};
+
+inline
+vector<TLorentzVector>& lhadaConvert(const vector<TEParticle>& p)
+{
+  static vector<lhadaConversion> cache;
+  size_t c = 0;
+  while ( (c < cache.size()) && (cache[c].source != &p) ) c++;
+  if ( c == cache.size() )
+    {
+      cache.push_back(lhadaConversion());
+      cache[c].source = &p;
+      cache[c].event  = -1;
+    }
+  lhadaConversion& x = cache[c];
+  if ( x.event != lhadaEvent )
+    {
+      x.event = lhadaEvent;
+      x.target.assign(p.begin(), p.end());
+    }
+  return x.target;
+}
+'''
+# pass counts over a grid of thresholds
+SCAN_CC =\
+'''//
+// threshold scan. for every event, only the position of the value of each
+// scanned variable relative to its grid of thresholds is recorded. the
+// number of events that pass each combination of thresholds is computed
+// from these counts when the scan is written out.
+struct lhadaScan
+{
+  std::string name;
+  std::vector<std::string> titles;
+  std::vector<std::vector<double> > thresholds;
+  std::vector<bool>   above;   // true if thresholds above the value pass
+  std::vector<bool>   strict;  // true for < and >
+  std::vector<size_t> stride;
+  std::vector<size_t> position;
+  std::vector<double> counts;
+  std::vector<double> counts2;
+
+  lhadaScan(std::string name_) : name(name_) {}
+
+  void add(std::string title, std::string op, double lo, double hi, int n)
+  {
+    titles.push_back(title);
+    thresholds.push_back(std::vector<double>(n, lo));
+    for(int c=1; c < n; c++)
+      thresholds.back()[c] = lo + c*(hi-lo)/(n-1);
+    above.push_back(op[0] == '<');
+    strict.push_back(op.size() == 1);
+    stride.push_back(counts.size() > 0 ? counts.size() : 1);
+    position.push_back(0);
+    // a value can pass 0,...,n thresholds
+    counts.assign(stride.back() * (n+1), 0);
+    counts2.assign(counts.size(), 0);
+  }
+
+  void set(size_t d, double x)
+  {
+    const std::vector<double>& t = thresholds[d];
+    // for > and >=, the number of thresholds passed; for < and <=,
+    // the index of the first threshold passed
+    if ( strict[d] != above[d] )
+      position[d] = lower_bound(t.begin(), t.end(), x) - t.begin();
+    else
+      position[d] = upper_bound(t.begin(), t.end(), x) - t.begin();
+  }
+
+  void fill(double w)
+  {
+    size_t index = 0;
+    for(size_t d=0; d < position.size(); d++) index += position[d]*stride[d];
+    counts[index]  += w;
+    counts2[index] += w*w;
+  }
+
+  void cumulate(std::vector<double>& a, size_t d)
+  {
+    size_t n = thresholds[d].size();
+    if ( above[d] )
+      for(size_t c=0; c < a.size(); c++)
+        {
+          if ( (c / stride[d]) % (n+1) > 0 ) a[c] += a[c-stride[d]];
+        }
+    else
+      for(size_t c=a.size(); c-- > 0;)
+        {
+          if ( (c / stride[d]) % (n+1) < n ) a[c] += a[c+stride[d]];
+        }
+  }
+
+  void write(TFile* fout)
+  {
+    // number of events passing each combination of thresholds
+    std::vector<double> pass(counts);
+    std::vector<double> pass2(counts2);
+    for(size_t d=0; d < thresholds.size(); d++)
+      {
+        cumulate(pass,  d);
+        cumulate(pass2, d);
+      }
+
+    // center the bins on the thresholds
+    std::vector<int>    nbins(3, 1);
+    std::vector<double> lo(3, 0), hi(3, 1);
+    for(size_t d=0; d < thresholds.size(); d++)
+      {
+        const std::vector<double>& t = thresholds[d];
+        double step = t.size() > 1 ? t[1] - t[0] : 1;
+        nbins[d] = t.size();
+        lo[d]    = t.front() - step/2;
+        hi[d]    = t.back()  + step/2;
+      }
+    TH1* h = 0;
+    std::string hname("scan_" + name);
+    if      ( thresholds.size() == 1 )
+      h = new TH1F(hname.c_str(), "", nbins[0], lo[0], hi[0]);
+    else if ( thresholds.size() == 2 )
+      h = new TH2F(hname.c_str(), "", nbins[0], lo[0], hi[0],
+                   nbins[1], lo[1], hi[1]);
+    else
+      h = new TH3F(hname.c_str(), "", nbins[0], lo[0], hi[0],
+                   nbins[1], lo[1], hi[1], nbins[2], lo[2], hi[2]);
+    TAxis* axes[3] = { h->GetXaxis(), h->GetYaxis(), h->GetZaxis() };
+    for(size_t d=0; d < titles.size(); d++)
+      axes[d]->SetTitle(titles[d].c_str());
+
+    for(size_t c=0; c < counts.size(); c++)
+      {
+        // thresholds k_d = position_d - 1 (values above), or position_d
+        // (values below), hold the pass counts
+        int  bin[3] = {0, 0, 0};
+        bool inside = true;
+        for(size_t d=0; d < thresholds.size(); d++)
+          {
+            int m = (c / stride[d]) % (thresholds[d].size()+1);
+            int k = above[d] ? m : m-1;
+            if ( (k < 0) || (k >= (int)thresholds[d].size()) ) inside = false;
+            bin[d] = k + 1;
+          }
+        if ( !inside ) continue;
+        int b = h->GetBin(bin[0], bin[1], bin[2]);
+        h->SetBinContent(b, pass[c]);
+        h->SetBinError(b, sqrt(pass2[c]));
+      }
+    fout->cd();
+    h->Write();
+  }
+};
+'''
+# instrumentation of the blocks and statements
+TIMER_HH =\
+'''#include <chrono>
+#include <fstream>
+//------------------------------------------------------------------
+// call and pass counts, and cumulative time, of a block or statement
+struct lhadaTimer
+{
+  std::string name;
+  long   calls;
+  long   passed;
+  double ns;
+  std::chrono::steady_clock::time_point t0;
+
+  lhadaTimer(std::string name_, std::vector<lhadaTimer*>& registry)
+    : name(name_), calls(0), passed(0), ns(0)
+  {
+    registry.push_back(this);
+  }
+
+  void start()
+  {
+    calls++;
+    t0 = std::chrono::steady_clock::now();
+  }
+
+  bool stop(bool pass=true)
+  {
+    ns += std::chrono::duration<double, std::nano>
+      (std::chrono::steady_clock::now() - t0).count();
+    if ( pass ) passed++;
+    return pass;
+  }
+};
+
+// print the instrumentation report, and write it as JSON and as
+// histograms
+inline
+void lhadaTimerReport(std::vector<lhadaTimer*>& timers, TFile* fout,
+                      std::ostream& os, std::string jsonname)
+{
+  int n = timers.size();
+  fout->cd();
+  TH1F* hcalls  = new TH1F("timing_calls",  "", n, 0, n);
+  TH1F* hpassed = new TH1F("timing_passed", "", n, 0, n);
+  TH1F* hns     = new TH1F("timing_ns",     "", n, 0, n);
+  std::ofstream json(jsonname.c_str());
+  json << "[" << std::endl;
+
+  char record[1024];
+  os << "Timing" << std::endl << std::endl;
+  sprintf(record, " %-55s %10s %10s %10s %12s",
+          "block", "calls", "passed", "ns/call", "total (ms)");
+  os << record << std::endl;
+  for(int c=0; c < n; c++)
+    {
+      lhadaTimer& t = *timers[c];
+      double percall = t.calls > 0 ? t.ns / t.calls : 0;
+      sprintf(record, " %-55s %10ld %10ld %10.1f %12.3f",
+              t.name.c_str(), t.calls, t.passed, percall, t.ns/1.e6);
+      os << record << std::endl;
+
+      json << "  {\\"name\\": \\"" << t.name << "\\", "
+           << "\\"calls\\": " << t.calls << ", "
+           << "\\"passed\\": " << t.passed << ", "
+           << "\\"ns\\": " << t.ns << "}"
+           << (c < n-1 ? "," : "") << std::endl;
+
+      TH1F* h[3]   = {hcalls, hpassed, hns};
+      double y[3]  = {(double)t.calls, (double)t.passed, t.ns};
+      for(int k=0; k < 3; k++)
+        {
+          h[k]->GetXaxis()->SetBinLabel(c+1, t.name.c_str());
+          h[k]->SetBinContent(c+1, y[k]);
+        }
+    }
+  json << "]" << std::endl;
+  json.close();
+  os << std::endl << "timing written to " << jsonname << std::endl;
+
+  fout->cd();
+  hcalls->Write();
+  hpassed->Write();
+  hns->Write();
+}
+'''
 #--------------------------------------------------------------------------------
 USAGE ='''
     Usage:
-       lhada2tnm.py [options] ADL-file-name
+       lhada2tnm.py [options] ADL-file-name...
+
+    Several ADL files are combined into a single analyzer.
 
     Options:
     -a name of analyzer to be created [analyzer]
     -e name of event adapter          [DelphesAdapter]
     -t name of ROOT tree              [Delphes]
+    -n do not cache repeated subexpressions
+    -u do not assume that input objects are ordered in decreasing pT
+    -c cache derived variables so that the cuts can be rerun quickly
+    -s comma-separated list of cuts, or all, for which to record the
+       entries that pass
+    -i instrument the analyzer with call and pass counts and timing
+    -m read events from memory-mapped columnar files instead of ROOT files
+       (see gencolumns.py and tree2columns.py)
+    -r process the events in random order and stop when the efficiencies
+       of the cuts are known to the given relative precision, e.g., 0.05,
+       or 0.05:cut1,cut2 to consider only the listed cuts
+    -p reorder the selections of each cut using the timing report of an
+       instrumented analyzer (the final result of each cut is unchanged,
+       but the cutflow follows the new order)
 
     Available adapters       tree name
     ----------------------------------
@@ -288,6 +627,58 @@ def decodeCommandLine():
                       default='Delphes',
                       help="name of ROOT tree")
 
+    parser.add_option("-n", "--nocse",
+                      action="store_false",
+                      dest="cse",
+                      default=True,
+                      help="do not cache repeated subexpressions")
+
+    parser.add_option("-u", "--unordered",
+                      action="store_false",
+                      dest="ordered",
+                      default=True,
+                      help="do not assume objects are ordered in pT")
+
+    parser.add_option("-c", "--cache",
+                      action="store_true",
+                      dest="cache",
+                      default=False,
+                      help="cache derived variables for fast reruns")
+
+    parser.add_option("-s", "--skim",
+                      action="store",
+                      dest="skim",
+                      type="string",
+                      default='',
+                      help="cuts for which to record passing entries")
+
+    parser.add_option("-i", "--instrument",
+                      action="store_true",
+                      dest="instrument",
+                      default=False,
+                      help="instrument the analyzer with counts and timing")
+
+    parser.add_option("-m", "--columnar",
+                      action="store_true",
+                      dest="columnar",
+                      default=False,
+                      help="read events from memory-mapped columnar files")
+
+    parser.add_option("-r", "--precision",
+                      action="store",
+                      dest="precision",
+                      type="string",
+                      default='',
+                      help="relative precision of cut efficiencies at which "\
+                      "to stop")
+
+    parser.add_option("-p", "--profile",
+                      action="store",
+                      dest="profile",
+                      type="string",
+                      default='',
+                      help="timing report used to reorder the selections")
+
     options, args = parser.parse_args()
     if len(args) == 0:
         sys.exit(USAGE)
@@ -298,7 +689,7 @@ def decodeCommandLine():
         if options.treename == 'Delphes':
             options.treename = 'Events'
             
-    filename = args[0]
+    filenames = args
     print('''
     analyzer:        %(name)s
     event adapter:   %(adaptername)s
@@ -307,12 +698,12 @@ def decodeCommandLine():
 ''' % {'name': options.name,
            'adaptername': options.adaptername,
            'treename': options.treename,
-           'filename': filename})
+           'filename': joinfields(filenames, '\n                     ')})
 
-    return (filename, options)
+    return (filenames, options)
 
 def nameonly(s):
-    return posixpath.splitext(posixpath.split(s)[1])[0]
+    return os.path.splitext(os.path.split(s)[1])[0]
 
 def join(left, a, right):
     s = ""
@@ -330,6 +721,9 @@ def getWords(records):
     words  = split(exclude.sub('', record))
     return words
 
+def warning(message):
+    print("** warning ** %s" % message)
+    
 def boohoo(message):
     sys.exit('** lhada2tnm.py * %s' % message)
 #------------------------------------------------------------------------------
@@ -586,7 +980,8 @@ def extractBlocks(filename):
         # skip "_"
         edit = re.compile('\\b%s\\b\s*(?=[(])' % fname[1:])
         
-        for btype in ['object', 'cut']:
+        for btype in ['object', 'cut', 'variation']:
+            if not blockmap.has_key(btype): continue
             for jj, (bname, words, records) in enumerate(blockmap[btype]):
                 for ii, record in enumerate(records):
                     records[ii] = edit.sub(fname, record)
@@ -599,7 +994,8 @@ def extractBlocks(filename):
         # skip "_"
         edit = re.compile('\\b%s\\b(?!=[(])' % vname[:-1])
         
-        for btype in ['object', 'cut']:
+        for btype in ['object', 'cut', 'variation']:
+            if not blockmap.has_key(btype): continue
             for jj, (bname, words, records) in enumerate(blockmap[btype]):
                 for ii, record in enumerate(records):
                     records[ii] = edit.sub(vname, record)
@@ -638,21 +1034,325 @@ def printBlocks(blocks):
             out.write('%s\n' % record)
     out.close()
 #--------------------------------------------------------------------------------
+# Systematic variations. A variation block either modifies external objects,
+#
+#   variation JESup
+#     take  Delphes_Jet
+#     apply scaleEnergy(Delphes_Jet, 1.03)
+#
+# where the function modifies its first argument in place, or changes the
+# event weight of the cuts,
+#
+#   variation btagup
+#     weight 1.1
+#
+# Every object, variable, and cut block that depends, directly or indirectly,
+# on a varied input is duplicated with the suffix _<variation> so that all
+# variations are evaluated in a single pass over the events. Blocks that do
+# not depend on a varied input are computed once and shared. Since a weight
+# applies to every cut, a weight variation duplicates all the cut blocks,
+# but none of the objects and variables.
+#--------------------------------------------------------------------------------
+def expandVariations(blocks):
+    if DEBUG > 0:
+        print '\nBEGIN( expandVariations )'
+
+    blocks['variation_info'] = []
+    if not blocks.has_key('variation'): return
+
+    for btype in ['object', 'variable', 'cut']:
+        if not blocks.has_key(btype): blocks[btype] = []
+
+    # variations are applied to the nominal blocks only
+    nominal = {}
+    names   = set()
+    for btype in ['object', 'variable', 'cut']:
+        nominal[btype] = [x for x in blocks[btype]]
+        for name, words, body in blocks[btype]:
+            names.add(name)
+    objectnames = set([x[0] for x in blocks['object']])
+
+    for vname, vwords, vbody in blocks['variation']:
+        # the singleton test is based on object names, so the names of
+        # the duplicated blocks must not fool it
+        if single.findall(lower(vname)) != []:
+            boohoo('variation name %s would make the duplicated objects look '\
+                   'like singletons; please choose another name' % vname)
+
+        # get varied inputs and weights
+        varied  = [] # (external object, varied copy, singleton, code)
+        weights = []
+        extname = None
+        for record in vbody:
+            t = split(record)
+            token = t[0]
+            value = joinfields(t[1:], ' ')
+            if   token == 'take':
+                extname = value
+                if extname in objectnames:
+                    boohoo('variation %s: only external objects can be '\
+                           'varied, but %s is an object block' % \
+                           (vname, extname))
+            elif token == 'apply':
+                if extname == None:
+                    boohoo('variation %s: apply without take' % vname)
+                varied.append([extname, '%s_%s' % (extname, vname),
+                               single.findall(lower(extname)) != [], value])
+                extname = None
+            elif token == 'weight':
+                weights.append(value)
+            else:
+                boohoo('variation %s: unexpected statement %s' % \
+                       (vname, record))
+
+        # map each dependent block to its duplicate
+        rename = {}
+        for extname, newname, singleton, code in varied:
+            rename[extname] = newname
+        for btype in ['object', 'variable', 'cut']:
+            clones = []
+            for name, words, body in nominal[btype]:
+                if btype == 'cut' and weights != []:
+                    affected = True
+                else:
+                    used = set()
+                    for record in body:
+                        used.update(re.findall(r'\w+', record))
+                    affected = used.intersection(rename.keys()) != set()
+                if not affected: continue
+
+                if btype == 'variable':
+                    # keep the trailing "_" added in extractBlocks
+                    newname = '%s%s_' % (name, vname)
+                else:
+                    newname = '%s_%s' % (name, vname)
+                if newname in names:
+                    boohoo('variation %s: block %s already exists' % \
+                           (vname, newname))
+                rename[name] = newname
+                clones.append((name, newname))
+
+            # duplicate blocks in their original order, so that the
+            # duplicates remain sorted by dependency
+            for name, newname in clones:
+                for oname, words, body in nominal[btype]:
+                    if oname != name: continue
+                    body = [renameWords(x, rename) for x in body]
+                    if btype == 'cut':
+                        body = ['weight %s' % x for x in weights] + body
+                    words = set([rename.get(x, x) for x in words])
+                    blocks[btype].append([newname, words, body])
+                    names.add(newname)
+                    if blocks['cut_analysis'].has_key(name):
+                        blocks['cut_analysis'][newname] = \
+                          blocks['cut_analysis'][name]
+                    break
+            if DEBUG > 0 and clones != []:
+                print "\tvariation( %s ) %s( %s )" % \
+                  (vname, btype, joinfields([x[1] for x in clones], ' '))
+
+        for v in varied:
+            v[-1] = renameWords(v[-1], rename)
+
+        if len(rename) == len(varied):
+            warning('variation %s does not change any object or cut' % vname)
+        blocks['variation_info'].append((vname, varied, weights))
+
+def renameWords(record, rename):
+    # rename whole words only, and all at once, to avoid recursive edits
+    return re.sub(r'\b\w+\b',
+                  lambda m: rename.get(m.group(0), m.group(0)), record)
+#--------------------------------------------------------------------------------
+# Combined analyses. Several ADL files can be translated into a single
+# analyzer, so that every event is read, and converted by the event adapter,
+# only once. The blocks of the ADL files are merged in the order of the files:
+#
+#   1. a table, function, object, variable or variation block that is
+#      identical to a block of a previous file, once the names of the blocks
+#      on which it depends are mapped, is shared with that file;
+#   2. the other blocks keep their name or, if it is already used, are
+#      renamed with the suffix _<analysis>, where <analysis> is the name of
+#      the ADL file. A function is identified by its name, so the files must
+#      not declare different functions with the same name;
+#   3. the cut blocks are never shared and are all renamed with the suffix
+#      _<analysis>, so that every analysis keeps its own cut-flows.
+#--------------------------------------------------------------------------------
+def mergeAnalyses(filenames):
+    if DEBUG > 0:
+        print '\nBEGIN( mergeAnalyses )'
+
+    if len(filenames) == 1:
+        blocks = extractBlocks(filenames[0])
+        blocks['analysis_info'] = []
+        blocks['cut_analysis']  = {}
+        return blocks
+
+    # blocks are renamed before the blocks that use them
+    btypes = ['info', 'table', 'function', 'object', 'variable', 'variation',
+              'cut']
+
+    merged = {'analysis_info': [], 'cut_analysis': {}}
+    shared = {} # (block type, body) => block name
+    used   = set()
+    for filename in filenames:
+        tag = re.sub(r'\W', '_', nameonly(filename))
+        if tag in [x[0] for x in merged['analysis_info']]:
+            tag = '%s_%d' % (tag, len(merged['analysis_info']))
+        # the singleton test is based on object names, so the names of
+        # the renamed blocks must not fool it
+        if single.findall(lower(tag)) != []:
+            boohoo('the name of ADL file %s would make the renamed objects '\
+                   'look like singletons; please rename the file' % filename)
+
+        blocks = extractBlocks(filename)
+        rename = {}
+        info   = []
+        for btype in btypes:
+            if not blocks.has_key(btype): continue
+            if not merged.has_key(btype): merged[btype] = []
+            for name, words, body in blocks[btype]:
+                body  = [renameWords(x, rename) for x in body]
+                words = set([rename.get(x, x) for x in words])
+                if btype == 'info':
+                    info = body
+                    merged[btype].append([name, words, body])
+                    continue
+
+                key = (btype, tuple([joinfields(split(x), ' ') for x in body]))
+                if btype == 'function':
+                    # the name of a function is that of its C++ code
+                    key = (name,) + key
+                if btype != 'cut' and shared.has_key(key):
+                    rename[name] = shared[key]
+                    if DEBUG > 0:
+                        print "\tshare( %s ) %s( %s )" % \
+                          (tag, btype, shared[key])
+                    continue
+
+                newname = name
+                if btype == 'cut':
+                    newname = '%s_%s' % (name, tag)
+                elif name in used:
+                    if btype == 'function':
+                        boohoo('function %s of %s differs from the function '\
+                               'of the same name of a previous ADL file' % \
+                               (name[1:], filename))
+                    elif btype == 'variable':
+                        # keep the trailing "_" added in extractBlocks
+                        newname = '%s%s_' % (name, tag)
+                    else:
+                        newname = '%s_%s' % (name, tag)
+                if newname in used:
+                    boohoo('%s: block %s already exists' % (filename, newname))
+                if newname != name:
+                    rename[name] = newname
+                    body  = [renameWords(x, rename) for x in body]
+                    words = set([rename.get(x, x) for x in words])
+                if btype == 'cut':
+                    merged['cut_analysis'][newname] = tag
+                else:
+                    shared[key] = newname
+                used.add(newname)
+                merged[btype].append([newname, words, body])
+        merged['analysis_info'].append((tag, filename, info))
+    return merged
+#--------------------------------------------------------------------------------
+def reorderSelections(filename, blocks, blocktypes):
+    if DEBUG > 0:
+        print '\nBEGIN( reorderSelections )'
+
+    # read the timing report written by an instrumented analyzer
+    if not os.path.exists(filename):
+        boohoo('timing report %s not found' % filename)
+    try:
+        report = json.load(open(filename))
+    except:
+        boohoo('unable to read timing report %s' % filename)
+    profile = {}
+    for t in report:
+        profile[str(t['name'])] = (float(t['calls']),
+                                   float(t['passed']),
+                                   float(t['ns']))
+
+    if not blocks.has_key('cut'): return
+    getindexed = re.compile(r'([a-zA-Z]\w*)\s*\[')
+    objectnames= blocktypes['object']
+    # functions and variables may index objects too
+    callnames  = blocktypes['function'].union(blocktypes['variable'])
+    for name, words, records in blocks['cut']:
+        # positions and statistics of the selections that can be moved
+        slots   = []
+        missing = False
+        for ii, record in enumerate(records):
+            t = split(record)
+            value = joinfields(t[1:], ' ')
+            if t[0] != 'select' or getscan.findall(value) != []: continue
+            label = 'cut %s: %s' % (name, nip.sub('', value))
+            if not profile.has_key(label) or profile[label][0] <= 0:
+                missing = True
+                break
+            calls, passed, ns = profile[label]
+            # expected cost per rejected event; a selection that rejects
+            # nothing is evaluated last
+            reject = 1 - passed / calls
+            if reject > 0:
+                rank = ns / calls / reject
+            else:
+                rank = float('inf')
+            used = set(re.findall(r'\w+', value))
+            pinned = set(getindexed.findall(value)).intersection(objectnames)\
+              != set() or used.intersection(callnames) != set()
+            slots.append((ii, rank, pinned))
+        if missing:
+            warning('cut %s: selections not in %s are left unchanged' % \
+                    (name, filename))
+            continue
+        if len(slots) < 2: continue
+
+        # a selection on an indexed object, e.g., jets[1].PT, or that
+        # uses a function or a variable, must remain after all the
+        # selections that precede it, since any of these, including a
+        # reference to another cut, may guard against an out of range index
+        after = {}
+        for j, (jj, rank, pinned) in enumerate(slots):
+            if pinned:
+                after[j] = set(range(j))
+            else:
+                after[j] = set()
+
+        # choose the cheapest, most rejecting selection that may go next
+        order = []
+        while len(order) < len(slots):
+            ready = [j for j in range(len(slots))
+                     if j not in order and after[j].issubset(order)]
+            ready.sort(key=lambda j: (slots[j][1], j))
+            order.append(ready[0])
+        if order == range(len(slots)): continue
+
+        moved = [records[slots[j][0]] for j in order]
+        for (ii, rank, pinned), record in zip(slots, moved):
+            records[ii] = record
+        print '\treorder selections of cut %s' % name
+#--------------------------------------------------------------------------------
 # The following functions convert ADL blocks to C++
 #--------------------------------------------------------------------------------
 def process_info(names, blocks):
-    info = '//\n// LHADA file: %(filename)s\n' % names
-    info+= '// info block\n'
-
     if not blocks.has_key('info'):
         boohoo("Thou lump of foul deformity. I can't find info block!")
 
-    name, words, body = blocks['info'][0]
-    
-    for record in body:
-        t = split(record)
-        record = '//\t%-12s\t%s\n' % (t[0], joinfields(t[1:], ' '))
-        info += record
+    # one info block per ADL file for combined analyses
+    analyses = [(names['filename'], blocks['info'][0][-1])]
+    if blocks['analysis_info'] != []:
+        analyses = [(x[1], x[2]) for x in blocks['analysis_info']]
+
+    info = ''
+    for filename, body in analyses:
+        info += '//\n// LHADA file: %s\n' % filename
+        info += '// info block\n'
+        for record in body:
+            t = split(record)
+            record = '//\t%-12s\t%s\n' % (t[0], joinfields(t[1:], ' '))
+            info += record
     info += '//'
     names['info'] = info
 #--------------------------------------------------------------------------------
@@ -705,7 +1405,17 @@ def process_functions(names, blocks):
             print "  internal, external names( %s, %s )" % (intname, extname)
             
         # get details of external function
+        # a function flagged as pure has no side effects and its value
+        # depends only on its arguments, so repeated calls with the same
+        # arguments can be cached (see process_cse)
         args = []
+        pure = False
+        for record in records:
+            t = split(record)
+            if t[0] == 'pure':
+                pure = True
+                break
+            
         for record in records:
             t = split(record)
             token = t[0]
@@ -757,23 +1467,47 @@ expected arguments %s, but %s found in ADL file
                     # TEParticle inherits from TLorentzVector, vector<TEParticle>
                     # is not type compatible with vector<TLorentzVector>. So,
                     # we need to copy each TEParticle to a TLorentzVector.
+                    # the copy is made at most once per event per object
+                    # (see lhadaConvert) unless the function takes the
+                    # vector by non-const reference, and could therefore
+                    # modify it, in which case a copy is made for every call.
                     # however, a singleton TEParticle is type compatible with
                     # TLorentzVector and no copying is needed.
                     copyvars=''
                     argsrec = ''
                     argscall= ''
                     for ii, arg in enumerate(args):
-                        argc = arg
+                        argc  = arg
+                        atype = argtypes[ii]
+                        byref = find(atype, '&') > -1 or find(atype, '*') > -1
+                        const = re.findall(r'\bconst\b', atype) != []
                         # check for vector<TLorenzVector>
-                        if tlorentz_vector.findall(argtypes[ii]) != []:
-                            argc = arg + '_'
-                            copyvars+='\n'
-                            copyvars+='  vector<TLorentzVector> %s(%s.size());\n'\
-                              % (argc, arg)
-                            copyvars+='  copy(%s.begin(), %s.end(), %s.begin());'\
-                              % (arg, arg, argc)
-                            argtypes[ii] = 'vector<TEParticle>&'
-                            
+                        if tlorentz_vector.findall(atype) != []:
+                            if byref and not const and not pure:
+                                warning('''function %s takes %s %s by non-const reference,
+so the collection is copied on every call. declare the argument const, or
+flag the function as pure, to use a single copy per event.''' % \
+                                (origname, atype, arg))
+                                argc = arg + '_'
+                                copyvars+='\n'
+                                copyvars+='  vector<TLorentzVector> %s(%s.begin(), %s.end());'\
+                                  % (argc, arg, arg)
+                            else:
+                                if not byref:
+                                    warning('''function %s takes %s %s by value,
+so the collection is copied on every call. consider using a const
+reference.''' % (origname, atype, arg))
+                                argc = 'lhadaConvert(%s)' % arg
+                                names['convert'] = True
+                            argtypes[ii] = 'const vector<TEParticle>&'
+                        elif not byref and find(atype, '<') > -1:
+                            # pass containers by reference to the internal
+                            # function
+                            warning('''function %s takes %s %s by value,
+so the argument is copied on every call. consider using a const
+reference.''' % (origname, atype, arg))
+                            argtypes[ii] = 'const %s&' % atype
+
                         argsrec += '%s %s, ' % (argtypes[ii], arg)
                         argscall+= '%s, ' % argc
                     if argsrec != '':
@@ -792,11 +1526,14 @@ expected arguments %s, but %s found in ADL file
            'args': argsrec,
            'argscall': argscall}
                     # cache function info
-                    functions[origname] = (rtype, intname, extname, argtypes)
+                    functions[origname] = (rtype, intname, extname, argtypes,
+                                           pure)
                     
                     if DEBUG > 0:
                         print '  function details( %s ); %s' % (origname,
                                                           functions[origname])
+    if names.get('convert', False):
+        fundef = CONVERT_CC + fundef
     names['fundef'] = fundef
     
     blocks['function_info'] = functions
@@ -805,13 +1542,14 @@ expected arguments %s, but %s found in ADL file
 # we have an implicit loop if the next record contains a variable
 # of the form <objectname>.<variable> and objectname is not
 # a singleton. here a singleton is defined to be an object of which only one
-# occurs per event. for now we do not handle nested implicit loops
+# occurs per event. if more than one object is found, the loops are nested
+# in the order in which the objects first appear in the record.
 #--------------------------------------------------------------------------------
 def checkForImplicitLoops(record, blocktypes):
     loopables = []
         
     # get words from record, including those of the form <name>.<variable>
-    words   = set(getvars.findall(record))
+    words   = getvars.findall(record)
     if DEBUG > 0:
         print "checkForImplicitLoops( %s )" % words
 
@@ -829,14 +1567,12 @@ def checkForImplicitLoops(record, blocktypes):
                     if DEBUG > 0:
                         print "\tfound singleton object( %s )" % name
                     continue
-                else:
+                elif name not in loopables:
                     if DEBUG > 0:
                         print "\tfound implicit loop over object( %s )" % name
                     loopables.append(name)
     return loopables
 #--------------------------------------------------------------------------------
-# handle cutvectors depending on whether we have a select or a reject
-#--------------------------------------------------------------------------------
 def fixrecord(record):
     # start with some simple replacements
     record = replace(record, "|", "@")
@@ -852,21 +1588,16 @@ def fixrecord(record):
         print "\tWORDS( %s )" % words
     return (record, words)
 
-def setlogic(record, tab, cutvector, logic_op):
-    t = fixrecord(record)
-    words = t[-1]
-    rec = ''
-    for name in words:    
-        if name in cutvector:
-            rec += '%s%s.logical(%s);\n' % (tab, name, logic_op)
-    return rec
 #--------------------------------------------------------------------------------
 # convert given ADL record into the corresponding C++ code snippet
 # record:     current ADL record
 # btype:      current ADL block type or apply
 # blocktypes: block types and associated names
+# localnames: names of local variables, which are to be used as is
+# loopvars:   map from the names of objects within implicit loops to the
+#             names of the corresponding loop variables
 #--------------------------------------------------------------------------------
-def convert2cpp(record, btype, blocktypes, cutvector=set()):
+def convert2cpp(record, btype, blocktypes, localnames=set(), loopvars={}):
     record, words = fixrecord(record)
         
     for name in words:
@@ -894,11 +1625,24 @@ def convert2cpp(record, btype, blocktypes, cutvector=set()):
         newfield  = field
         oldrecord = record
         prerecord = ''
+
+        # an attribute of the current element of an implicit loop
+        if not undotted and loopvars.has_key(strip(oname, '@')):
+            prefix = ''
+            if oname[0] == '@' and field[-1] == '@':
+                # |<name>.<variable>|
+                prefix = '@'
+                field  = field[:-1]
+            edit = re.compile('%s(?![\w(])' % re.escape(name))
+            newfield = '%s("%s%s%s")' % (loopvars[strip(oname, '@')],
+                                         prefix, lower(field), prefix)
+            record = edit.sub(newfield, record)
+            continue
         
         # need to handle things like PT and e.PT
         # also need to check for singleton objects
         if btype == 'object':
-            if name in cutvector:
+            if name in localnames:
                 pass # use name as is
             elif undotted:
                 if not a_singleton: oname = "p"
@@ -939,7 +1683,7 @@ def convert2cpp(record, btype, blocktypes, cutvector=set()):
                 # check if this is the result of another block
                 if name in blocktypes['cut']:
                     edit = re.compile('\\b%s\\b' % name)
-                    newfield = 'cut_%s()' % name
+                    newfield = 'cut_%s.result' % name
                     if DEBUG > 0:
                         print "\tcut: oname( %s ) field( %s ) newfield( %s )" % \
                           (oname, field, newfield)
@@ -987,17 +1731,92 @@ def process_singleton_object(name, records, tab, blocktypes):
             objdef += '%s%s = %s;\n' % (tab, name, value);
     return objdef
 
-def process_multiple_objects(name, records, TAB, blocktypes):
-    if DEBUG > 0:
-        print '\nBEGIN( process_multiple_objects ) %s' % name
-            
+def process_implicit_loops(value, token, TAB, blocktypes, loops,
+                               localnames, counter):
+    # implement a select or reject statement that contains one or more
+    # implicit loops, either directly or through the values returned by
+    # functions applied within implicit loops. the statement is evaluated
+    # for every combination of elements of the looped over objects. a select
+    # requires the statement to be true for every combination, while a reject
+    # requires it to be true for at least one combination. the loops stop
+    # as soon as the outcome is known.
+    tab4 = ' '*4
+    
+    # get objects to be looped over, and the deferred function calls
+    # that are needed
+    objects = checkForImplicitLoops(value, blocktypes)
+    words   = getwords.findall(value)
+    applies = []
+    for rvalue_name, fcall, loopables in loops:
+        if rvalue_name not in words: continue
+        applies.append((rvalue_name, fcall))
+        for oname in loopables:
+            if oname not in objects: objects.append(oname)
+
+    # assign loop variables q, q1, q2,... and indices n, n1, n2,...
+    loopvars = {}
+    indices  = {}
+    for ii, oname in enumerate(objects):
+        if ii == 0:
+            loopvars[oname] = 'q'
+            indices[oname]  = 'n'
+        else:
+            loopvars[oname] = 'q%d' % ii
+            indices[oname]  = 'n%d' % ii
+
+    counter[0] += 1
+    found = 'found%d' % counter[0]
+    tab   = TAB + tab4
+    objdef = '%sbool %s = false;\n' % (tab, found)
+    for oname in objects:
+        n = indices[oname]
+        objdef += '%sfor(size_t %s=0; %s < %s.size() && !%s; %s++)\n' % \
+          (tab, n, n, oname, found, n)
+        objdef += '%s  {\n' % tab
+        tab += tab4
+        objdef += '%sTEParticle& %s = %s[%s];\n' % (tab, loopvars[oname],
+                                                    oname, n)
+    for rvalue_name, fcall in applies:
+        a, b = split(fcall, '(', 1)
+        b = convert2cpp(b, 'apply', blocktypes, localnames, loopvars)
+        a = replace(a, '.', '_')
+        objdef += '%sdouble %s = %s(%s;\n' % (tab, rvalue_name, a, b)
+
+    names = localnames.union([x[0] for x in applies])
+    cond  = convert2cpp(value, 'object', blocktypes, names, loopvars)
+    if token == 'select':
+        # look for a combination that fails the selection
+        objdef += '%s%s = !(%s);\n' % (tab, found, cond)
+    else:
+        objdef += '%s%s = %s;\n' % (tab, found, cond)
+
+    for oname in objects:
+        tab = tab[:-4]
+        objdef += '%s  }\n' % tab
+    objdef += '%s%sif ( %s ) continue;\n' % (TAB, tab4, found)
+    return objdef
+
+ptcut = re.compile(r'^\s*pt\s*(>=|>|<=|<)\s*[0-9.]+\s*$', re.I)
+
+def process_object_records(name, records, TAB, blocktypes, counter=None,
+                               ordered=False):
+    # implement the apply, select, and reject statements of an object block
+    # within the body of a loop over the object taken by the block.
+    # if the candidates are ordered in decreasing pT, a failed pT threshold
+    # means all remaining candidates fail, so we can exit the loop.
     tab     = TAB
     tab4    = ' '*4
-    objdef  = '%s%s.clear();\n' % (tab, name)
+    objdef  = ''
+    if counter == None: counter = [0]
+
+    # cache for function calls that contain implicit loops. these calls
+    # are implemented within the select or reject statements that use
+    # the values they return
+    loops = []
 
-    # cache for names of returned vector-valued variables
-    # associated with loopable objects
-    cutvector = set() 
+    # cache for names of returned values of functions applied to
+    # each candidate individually
+    scalars = set()
     
     if DEBUG > 0:
         print "\nNAME( %s )" % name
@@ -1014,15 +1833,7 @@ def process_multiple_objects(name, records, TAB, blocktypes):
         # check for implicit loops in current statement
         loopables = checkForImplicitLoops(record, blocktypes)
 
-        if   token == 'take':
-            # --------------------------------------------            
-            # TAKE
-            # --------------------------------------------            
-            objdef += '%sfor(size_t c=0; c < %s.size(); c++)\n' % (tab, value)
-            objdef += '%s  {\n' % tab
-            objdef += '%s%sTEParticle& p = %s[c];\n' % (tab, tab4, value)
-            
-        elif token == 'apply':
+        if token == 'apply':
             # --------------------------------------------            
             # APPLY
             # --------------------------------------------
@@ -1052,71 +1863,235 @@ perhaps you're missing a return value in:
 %s
 ''' % (objdef, record))
 
-            a, b = split(fcall, '(')
-            b = convert2cpp(b, 'apply', blocktypes)
-            a = replace(a, '.', '_')
-            fcall = '%s(%s' % (a, b)   # function call
-            
             if loopables != []:
-                # this function call contains an implicit loop and
-                # therefore returns multiple values that we refer to as a
-                # cutvector. we, therefore, need to cache the name of the
-                # cutvector because it is surely used in a subsequent
+                # this function call contains one or more implicit loops
+                # and therefore returns multiple values, which are
+                # computed when needed within the loops of a subsequent
                 # select or reject statement.
-                cutvector.add(rvalue_name)
-
-                # for now, we handle function calls with a single
-                # implicit loop.
-                object_name = loopables[0]
-                
-                # adjust tab
-                tab = TAB + tab4
-
-                if DEBUG > 0:
-                    print '   BEGIN( IMPLICIT LOOP )'
-                    print '     %s' % fcall
-                
-                objdef += '%scutvector<double> %s(%s.size());\n' % (tab,
-                                                                    rvalue_name,
-                                                                    object_name)
-                objdef += '%sfor(size_t n=0; n < %s.size(); n++)\n' % \
-                (tab, object_name)
-                objdef += '%s  {\n' % tab
-                objdef += '%s%sTEParticle& q = %s[n];\n' % (tab, tab4, object_name)
-                objdef += '%s%s%s[n] = %s;\n' % (tab, tab4, rvalue_name, fcall)
-                objdef += '%s  }\n' % tab
+                loops.append((rvalue_name, fcall, loopables))
                 if DEBUG > 0:
-                    print '   END( IMPLICIT LOOP )'
-
-                # reset tab
-                tab = TAB
-
-        elif token == 'select':
+                    print '   IMPLICIT LOOP( %s )' % fcall
+            else:
+                # this function is applied to the current candidate only,
+                # so its value is simply a local variable
+                a, b = split(fcall, '(', 1)
+                b = convert2cpp(b, 'apply', blocktypes)
+                a = replace(a, '.', '_')
+                scalars.add(rvalue_name)
+                objdef += '%s%sdouble %s = %s(%s;\n' % (tab, tab4,
+                                                        rvalue_name, a, b)
+
+        elif token in ['select', 'reject']:
             # --------------------------------------------            
-            # SELECT
+            # SELECT or REJECT
             # --------------------------------------------
-            # if the current record contains a cutvector variable, then
-            # add a statement to specify whether we should AND or OR the
-            # truth values associated with the cut on each element of the
-            # cutvector. We assume that a select requires every cut be
-            # true, while a reject requires at least one cut be true.
-            objdef += setlogic(value, tab+tab4, cutvector, 'AND')
+            # names are case insensitive, as are attributes, so use the
+            # spelling of the apply statement for the returned values
+            rvalues = {}
+            for x in list(scalars) + [x[0] for x in loops]:
+                rvalues[lower(x)] = x
+            value = re.sub(r'(?<![.\w])\w+\b',
+                           lambda m: rvalues.get(lower(m.group(0)),
+                                                 m.group(0)), value)
+            words = getwords.findall(value)
+            if loopables != [] or \
+              [x for x in loops if x[0] in words] != []:
+                objdef += process_implicit_loops(value, token, TAB,
+                                                 blocktypes, loops,
+                                                 scalars, counter)
+            else:
+                cond = convert2cpp(value, 'object', blocktypes, scalars)
+                jump = 'continue'
+                op   = ptcut.findall(value)
+                if ordered and op != []:
+                    if (token == 'select' and op[0][0] == '>') or \
+                       (token == 'reject' and op[0][0] == '<'):
+                        objdef += '%s%s// candidates are ordered in pT\n' % \
+                          (tab, tab4)
+                        jump = 'break'
+                if token == 'select':
+                    objdef += '%s%sif ( !(%s) ) %s;\n' % (tab, tab4, cond, jump)
+                else:
+                    objdef += '%s%sif ( %s ) %s;\n' % (tab, tab4, cond, jump)
             
-            objdef += '%s%sif ( !(%s) ) continue;\n' % \
-              (tab, tab4, convert2cpp(value, 'object', blocktypes, cutvector))
+    objdef += '%s%s%s.push_back(p);\n' % (tab, tab4, name)
+    return objdef
 
-        elif token == 'reject':
-            # --------------------------------------------            
-            # REJECT
-            # --------------------------------------------
-            objdef += setlogic(value, tab+tab4, cutvector, 'OR')
-            
-            objdef += '%s%sif ( %s ) continue;\n' % \
-              (tab, tab4, convert2cpp(value, 'object', blocktypes, cutvector))
+def process_multiple_objects(name, records, TAB, blocktypes, members=[],
+                                 limit=0, ordered=False):
+    if DEBUG > 0:
+        print '\nBEGIN( process_multiple_objects ) %s' % name
             
-    objdef += '%s%s%s.push_back(p);\n' % (tab, tab4, name)
+    tab     = TAB
+    tab4    = ' '*4
+    objdef  = '%s%s.clear();\n' % (tab, name)
+    for mname, mrecords in members:
+        objdef += '%s%s.clear();\n' % (tab, mname)
+    
+    for record in records:
+        t = split(record)
+        if t[0] != 'take': continue
+        # --------------------------------------------            
+        # TAKE
+        # --------------------------------------------            
+        value = joinfields(t[1:], ' ')
+        objdef += '%sfor(size_t c=0; c < %s.size(); c++)\n' % (tab, value)
+        objdef += '%s  {\n' % tab
+        objdef += '%s%sTEParticle& p = %s[c];\n' % (tab, tab4, value)
+        break
+        
+    counter = [0]
+    objdef += process_object_records(name, records, TAB, blocktypes, counter,
+                                     ordered)
+    if limit > 0 and members == []:
+        # no more than limit candidates are needed
+        objdef += '%s%sif ( %s.size() >= %d ) break;\n' % (tab, tab4,
+                                                              name, limit)
+
+    # a candidate that fails the selection at one level of a fused
+    # chain necessarily fails all subsequent levels
+    for mname, mrecords in members:
+        objdef += '\n%s%s// %s\n' % (tab, tab4, mname)
+        objdef += process_object_records(mname, mrecords, TAB, blocktypes,
+                                         counter)
     objdef += '%s  }\n' % tab
     return objdef
+#--------------------------------------------------------------------------------
+# Find linear chains of object blocks, e.g., cleanjets -> jetsSR, in which
+# each block, apart from the first (the head), takes the preceding block and
+# is its only taker. The blocks of a chain are created within a single loop
+# over the object taken by the head, which avoids a separate pass over each
+# intermediate collection. A block cannot be fused if it uses the block it
+# takes other than through its take statement (e.g., in an implicit loop over
+# the same object), and all other objects used by the block must be created
+# before the head.
+#--------------------------------------------------------------------------------
+def localvars(records):
+    # names of the values returned by apply statements
+    return set([split(x)[-1] for x in records if split(x)[0] == 'apply'])
+
+def findObjectChains(objects, blocktypes):
+    order   = {}
+    takes   = {}
+    takers  = {}
+    for ii, (name, words, records) in enumerate(objects):
+        order[name] = ii
+        for record in records:
+            t = split(record)
+            if t[0] != 'take': continue
+            takes[name] = t[1]
+            if not takers.has_key(t[1]): takers[t[1]] = []
+            takers[t[1]].append(name)
+            break
+
+    def fusable(name, words, records, chain, localnames):
+        if single.findall(lower(name)) != []: return False
+        parent = takes[name]
+        if words.difference([parent]).intersection(chain) != set():
+            return False
+        for record in records:
+            t = split(record)
+            if t[0] == 'take': continue
+            if t[0] not in ['select', 'reject', 'apply']: return False
+            if parent in getwords.findall(record): return False
+            
+        # all other objects must be available before the head is created
+        for oname in words.difference([parent]):
+            if order[oname] >= order[chain[0]]: return False
+            
+        # local variables must not clash with those of other blocks
+        # in the chain
+        if localvars(records).intersection(localnames) != set(): return False
+        return True
+
+    blockmap = {}
+    for name, words, records in objects:
+        blockmap[name] = (words, records)
+        
+    chains = {}
+    fused  = set()
+    for name, words, records in objects:
+        if name in fused: continue
+        if single.findall(lower(name)) != []: continue
+        if not takes.has_key(name): continue
+        
+        chain = [name]
+        localnames = localvars(records)
+        members = []
+        head = name
+        while takers.has_key(head) and len(takers[head]) == 1:
+            child = takers[head][0]
+            cwords, crecords = blockmap[child]
+            if not fusable(child, cwords, crecords, chain, localnames): break
+            chain.append(child)
+            localnames = localnames.union(localvars(crecords))
+            members.append((child, crecords))
+            fused.add(child)
+            head = child
+            
+        if members != []:
+            chains[name] = members
+            if DEBUG > 0:
+                print "\tfused object chain( %s )" % joinfields(chain, ' -> ')
+    return (chains, fused)
+#--------------------------------------------------------------------------------
+# Find how the filtered objects are used. If an object is used only through
+# comparisons of its size with constants, e.g., jetsSR.size >= 2, and through
+# elements at fixed indices, e.g., jets[0].PT, then only the first few
+# candidates are needed. If, further, no elements are accessed, the candidates
+# need only be counted. Return the maximum number of candidates needed for
+# each object (zero if all are needed) and the set of objects that need only
+# be counted.
+#--------------------------------------------------------------------------------
+def findObjectLimits(blocks, blocktypes):
+    records = []
+    for btype in ['object', 'variable', 'cut']:
+        if not blocks.has_key(btype): continue
+        for name, words, body in blocks[btype]:
+            for record in body:
+                t = split(record)
+                if t[0] not in ['take', 'apply', 'select', 'reject',
+                                'weight']: continue
+                records.append((name, record))
+
+    limits    = {}
+    countonly = set()
+    for name in blocktypes['object']:
+        if single.findall(lower(name)) != []: continue
+        # the comparison must be a whole operand of a logical expression,
+        # not part of an arithmetic one, e.g., jets.size > 2 * muons.size
+        sizecut = re.compile(r'(^\s*\w+|[(]|\b(?:and|or|not)\b|&&|[|][|])\s*'\
+                             r'(?:%(n)s[.]size\s*(?:==|!=|>=|<=|>|<)\s*(\d+)'\
+                             r'|(\d+)\s*(?:==|!=|>=|<=|>|<)\s*%(n)s[.]size)'\
+                             r'(?=\s*(?:$|[)]|\band\b|\bor\b|&&|[|][|]))' % \
+                             {'n': name})
+        element = re.compile(r'\b%s\s*\[\s*(\d+)\s*\]' % name)
+        limit   = 0
+        indexed = False
+        allneeded = False
+        for bname, record in records:
+            if bname == name: continue
+            if name not in getwords.findall(record): continue
+            # n candidates suffice to decide size comparisons with constants
+            # less than n
+            for b, x, y in sizecut.findall(record):
+                limit = max(limit, int(x+y)+1)
+            record = sizecut.sub(r'\1', record)
+            for x in element.findall(record):
+                limit = max(limit, int(x)+1)
+                indexed = True
+            record = element.sub('', record)
+            if name in getwords.findall(record):
+                allneeded = True
+                break
+        if allneeded or limit == 0: continue
+        limits[name] = limit
+        if not indexed:
+            countonly.add(name)
+        if DEBUG > 0:
+            print "\tobject( %s ) limit( %d ) count only( %s )" % \
+              (name, limit, not indexed)
+    return (limits, countonly)
 
 def process_objects(names, blocks, blocktypes):
     if DEBUG > 0:
@@ -1137,6 +2112,19 @@ def process_objects(names, blocks, blocktypes):
     vobjects  = '%s// cache pointers to filtered objects\n' % tab2
     vobjects += '%sobjects.clear();\n' % tab2
 
+    # copies of external objects modified by systematic variations
+    varied = set()
+    for vname, vinputs, weights in blocks['variation_info']:
+        for extname, newname, singleton, code in vinputs:
+            varied.add(newname)
+    defined = set()
+
+    # find objects of which only the first few candidates are needed.
+    # however, the sizes stored in the derived variable cache must be
+    # exact, since the cuts on them may be changed
+    limits, countonly = findObjectLimits(blocks, blocktypes)
+    if names['cache']: limits = {}
+
     for name, words, records in blocks['object']:
         if DEBUG > 0:
             print 'OBJECT( %s )' % name
@@ -1147,23 +2135,64 @@ def process_objects(names, blocks, blocktypes):
             if token == 'take':
                 objname = t[1]
                 if objname not in blocktypes['object']:
-                    extobj.add(objname)
+                    # a varied object is created from the original
+                    # in run(), not by the event adapter
+                    if objname not in varied: extobj.add(objname)
                     singleton = single.findall(lower(objname)) != []
                     if singleton:
-                        extobjdef += '\nTEParticle %s;\n\n' % objname
                         SINGLETON_CACHE.add(name)
                         if DEBUG > 0:
                             print "\tsingleton object( %s )" % name
+                    # an external object can be taken by several blocks
+                    if objname in defined: continue
+                    defined.add(objname)
+                    if singleton:
+                        extobjdef += '\nTEParticle %s;\n\n' % objname
                     else:
                         extobjdef += 'vector<TEParticle> %s;\n' % objname
                             
         singleton = single.findall(lower(name)) != []
         if singleton:
             intobjdef += '\nTEParticle %s;\n\n' % name
+        elif name in countonly:
+            intobjdef += 'lhadaCounter %s;\n' % name
         else:
             intobjdef += 'vector<TEParticle> %s;\n' % name
 
+    # the objects are created in dependency order by calling each
+    # block directly
+    createimpl = ''
+    if varied != set():
+        createimpl += '%s// apply systematic variations to copies of the '\
+          'inputs\n' % tab2
+    for vname, vinputs, weights in blocks['variation_info']:
+        for extname, newname, singleton, code in vinputs:
+            if newname not in defined: continue
+            createimpl += '%s%s = %s;\n' % (tab2, newname, extname)
+            createimpl += '%s%s;\n' % (tab2, code)
+            if not singleton:
+                # the variation may change the pT, so the order parameter,
+                # set to the pT when the particle is created, is refreshed
+                # before the copy is sorted again
+                createimpl += '%sfor(size_t c=0; c < %s.size(); c++) '\
+                  '%s[c].Order = %s[c].Pt();\n' % \
+                  (tab2, newname, newname, newname)
+                createimpl += '%sif ( !is_sorted(%s.begin(), %s.end()) ) '\
+                  'sort(%s.begin(), %s.end());\n' % \
+                  (tab2, newname, newname, newname, newname)
+    if varied != set():
+        createimpl += '\n'
+    
+    # the blocks fused into a chain are created by the head of the chain
+    chains, fused = findObjectChains(blocks['object'], blocktypes)
+    for name, words, records in blocks['object']:
+        if name in fused: continue
         vobjects += '%sobjects.push_back(&object_%s);\n' % (tab2, name)            
+        label = 'object %s' % name
+        if chains.has_key(name):
+            label += ' (+%s)' % joinfields([x[0] for x in chains[name]], ', ')
+        createimpl += timed(names, 'timer_object_%s' % name, label,
+                            '%sobject_%s.create();\n' % (tab2, name), tab2)
         
     objdef = '''// external objects
 %s
@@ -1184,13 +2213,14 @@ def process_objects(names, blocks, blocktypes):
     adapter     = names['adapter']
     copyargsimpl= ''
     extobjimpl  = '\n%s// map external objects to internal ones\n' % tab6
+    extobjdecl  = ''
     for name in extobj:
         singleton = single.findall(lower(name)) != []
         if singleton:
             rtype = 'TEParticle'
         else:
             rtype = 'std::vector<TEParticle>'        
-        extobjimpl  += '%s%s %s;\n' % (tab6, rtype, name)
+        extobjdecl  += '%s%s %s;\n' % (tab2, rtype, name)
 
         rtype = rtype + '&'
         runargsimpl += '%s %s_,\n%s' % (rtype, name, bigtab)
@@ -1210,9 +2240,26 @@ def process_objects(names, blocks, blocktypes):
     names['runargsimpl'] = runargsimpl
     names['copyargsimpl']= copyargsimpl
     
+    # determine which objects are ordered in decreasing pT. filtering
+    # preserves the order of the objects taken, and the varied copies of the
+    # inputs are sorted after the variation is applied
+    ordered = {}
+    for name in extobj.union(varied):
+        ordered[name] = names['ordered']
+    for name, words, records in blocks['object']:
+        for record in records:
+            t = split(record)
+            if t[0] != 'take': continue
+            ordered[name] = ordered.get(t[1], False)
+            break
+        
     # implement object selections
     objdef += '\n// object definitions\n'
     for name, words, records in blocks['object']:
+        if name in fused: continue
+        if chains.has_key(name):
+            objdef += '// also creates %s\n' % \
+              joinfields([x[0] for x in chains[name]], ', ')
         objdef += 'struct object_%s_s : public lhadaThing\n' % name
         objdef += '{\n'
         objdef += '%sobject_%s_s() : lhadaThing() {}\n' % (tab2, name)
@@ -1224,14 +2271,20 @@ def process_objects(names, blocks, blocktypes):
         if singleton:
             objdef += process_singleton_object(name, records, tab4, blocktypes)
         else:
-            objdef += process_multiple_objects(name, records, tab4, blocktypes)
+            t = split([x for x in records if split(x)[0] == 'take'][0])
+            objdef += process_multiple_objects(name, records, tab4, blocktypes,
+                                               chains.get(name, []),
+                                               limits.get(name, 0),
+                                               ordered.get(t[1], False))
 
         objdef += '%s};\n' % tab2
         objdef += '} object_%s;\n\n' % name
         
     names['objdef']     = objdef   
     names['extobjimpl'] = extobjimpl
+    names['extobjdecl'] = extobjdecl
     names['vobjects']   = vobjects
+    names['createimpl'] = createimpl
 #--------------------------------------------------------------------------------
 def process_variables(names, blocks):
     if DEBUG > 0:
@@ -1262,14 +2315,171 @@ def process_variables(names, blocks):
     variable %s uses the function %s, 
     but the latter may not have been defined in the LHADA file.
     ''' % (name, fname))
-                rtype, intname, extname, argtypes = blocks['function_info'][fname]
+                rtype, intname, extname, argtypes, pure = \
+                  blocks['function_info'][fname]
                 func = replace(func, fname, intname)
+                func = substituteCSE(func, blocks)
                 vardef  += '%s\t%s;\n' % (rtype, name)
-                varimpl += '%s%s\t= %s;\n' % (tab2, name, func)
+                varimpl += timed(names, 'timer_variable_%s' % name,
+                                 'variable %s' % name[:-1],
+                                 '%s%s\t= %s;\n' % (tab2, name, func), tab2)
                 
     names['vardef']  = vardef
     names['varimpl'] = varimpl
 #--------------------------------------------------------------------------------
+# Common subexpression elimination. The same expressions, e.g., jetsSR.size(),
+# MET("pt"), jetsSR[0]("pt"), and calls to pure functions with identical
+# arguments, typically recur across many cut blocks and variables. Each
+# expression that occurs more than once is replaced by a call to an inline
+# function that computes the expression at most once per event and caches
+# its value. The cache is invalidated by incrementing lhadaEvent at the
+# start of each event. Since the cached functions are evaluated lazily,
+# expressions such as jetsSR[1]("pt") are still guarded by the cuts that
+# precede them.
+#--------------------------------------------------------------------------------
+cseaccessor = re.compile(r'\b[a-zA-Z_]\w*(?:[.]size[(][)]|(?:\[\d+\])?[(]"[^"]+"[)])')
+csename     = re.compile(r'\W+')
+
+def findCalls(record, fname):
+    # return all calls to function fname within record, taking care
+    # to match nested parentheses
+    calls = []
+    for m in re.finditer(r'\b%s\s*[(]' % fname, record):
+        depth = 0
+        for ii in range(m.end()-1, len(record)):
+            if   record[ii] == '(':
+                depth += 1
+            elif record[ii] == ')':
+                depth -= 1
+                if depth == 0:
+                    calls.append(record[m.start():ii+1])
+                    break
+    return calls
+
+def substituteCSE(record, blocks):
+    if not blocks.has_key('cse'): return record
+    # replace longest expressions first so that a cached function call
+    # is not broken up by the replacement of one of its arguments
+    for expr, cname in blocks['cse']:
+        record = re.sub(r'(?<![\w.])%s' % re.escape(expr), '%s()' % cname, record)
+    return record
+
+def process_cse(names, blocks, blocktypes):
+    if DEBUG > 0:
+        print '\nBEGIN( process_cse )'
+
+    blocks['cse'] = []
+    csedef  = '// per-event cache of repeated subexpressions\n'
+    names['csedef'] = csedef
+    # the derived variable cache (see process_cache) stores the values of
+    # the cached expressions, so caching is needed
+    cache = names['cache']
+    if not (names['cse'] or cache): return
+
+    # collect the C++ expressions of event variables and cut blocks
+    records = []
+    if blocks.has_key('variable'):
+        for name, words, body in blocks['variable']:
+            for record in body:
+                t = split(record)
+                if t[0] != 'apply': continue
+                func  = joinfields(t[1:], ' ')
+                fname = split(func, '(')[0]
+                if not blocks['function_info'].has_key(fname): continue
+                intname = blocks['function_info'][fname][1]
+                records.append(replace(func, fname, intname))
+
+    cutrecords = []
+    if blocks.has_key('cut'):
+        for name, words, body in blocks['cut']:
+            for record in body:
+                t = split(record)
+                if t[0] not in ['select', 'weight']: continue
+                value = joinfields(t[1:], ' ')
+                cutrecords.append(convert2cpp(value, 'cut', blocktypes))
+    records += cutrecords
+
+    # 1) calls to pure functions. when the derived variables are cached,
+    #    every function called within a cut is cached, since the objects
+    #    passed to it are not available when the cuts are rerun
+    calls  = []
+    counts = {}
+    for fname, info in blocks['function_info'].items():
+        rtype, intname, extname, argtypes, pure = info
+        for record in records:
+            incut = cache and record in cutrecords
+            if not (pure or incut): continue
+            for call in findCalls(record, intname):
+                key = (call, rtype, intname[1:])
+                counts[key] = counts.get(key, 0) + 1
+                if incut: counts[key] += 1
+    keys = [x for x in counts.keys() if counts[x] > 1]
+    keys.sort()
+    for ii, (call, rtype, fname) in enumerate(keys):
+        calls.append((call, rtype, 'cached_%s%d' % (fname, ii)))
+
+    # 2) object attributes and sizes, including those within the
+    #    arguments of cached function calls
+    objectnames = blocktypes['object']
+    cse = [(x[0], x[2]) for x in calls]
+    cse.sort(lambda x, y: cmp(len(y[0]), len(x[0])))
+    records = [substituteCSE(x, {'cse': cse}) for x in records]
+    cutrecords = [substituteCSE(x, {'cse': cse}) for x in cutrecords]
+    counts = {}
+    for record in records + [x[0] for x in calls]:
+        for expr in cseaccessor.findall(record):
+            oname = split(expr, '[')[0]
+            oname = split(oname, '(')[0]
+            oname = split(oname, '.')[0]
+            if oname not in objectnames: continue
+            counts[expr] = counts.get(expr, 0) + 1
+            if cache and record in cutrecords: counts[expr] += 1
+    keys = [x for x in counts.keys() if counts[x] > 1]
+    keys.sort()
+    accessors = []
+    for expr in keys:
+        if find(expr, '.size()') > -1:
+            rtype = 'size_t'
+        else:
+            rtype = 'double'
+        cname = 'cached_%s' % strip(csename.sub('_', expr), '_')
+        accessors.append((expr, rtype, cname))
+
+    # accessors are defined first since cached function calls may use them
+    cse = []
+    for expr, rtype, cname in accessors + calls:
+        body = substituteCSE(expr, {'cse': cse})
+        # all cached expressions are computed when the derived variables
+        # are stored, so guard against elements that do not exist,
+        # including those used in the arguments of a function call
+        guards = []
+        for oname, index in re.findall(r'\b(\w+)\[(\d+)\]', expr):
+            if oname not in objectnames: continue
+            guard = '%s.size() > %s' % (oname, index)
+            if guard not in guards: guards.append(guard)
+        if cache and guards != []:
+            body = '%s ? %s : 0' % (joinfields(guards, ' && '), body)
+        csedef += '''
+%(rtype)s\t%(cname)s_;
+long\t%(cname)s_event = -1;
+inline
+%(rtype)s\t%(cname)s()
+{
+  if ( %(cname)s_event == lhadaEvent ) return %(cname)s_;
+  %(cname)s_event = lhadaEvent;
+  %(cname)s_ = %(body)s;
+  return %(cname)s_;
+}
+''' % {'rtype': rtype, 'cname': cname, 'body': body}
+        cse.append((expr, cname))
+        if DEBUG > 0:
+            print "  cache( %s ) -> %s()" % (expr, cname)
+
+    # substitute longest expressions first
+    cse.sort(lambda x, y: cmp(len(y[0]), len(x[0])))
+    blocks['cse'] = cse
+    names['csedef'] = csedef
+#--------------------------------------------------------------------------------
 def process_cuts(names, blocks, blocktypes):
     if DEBUG > 0:
         print '\nBEGIN( process_cuts )'
@@ -1281,6 +2491,9 @@ def process_cuts(names, blocks, blocktypes):
     vcuts   = '  // cache pointers to cuts\n'
     vcuts  += '  cuts.clear();\n'
     #vcuts  += '  vector<lhadaThing*> cuts;\n'
+    # the cuts are applied in dependency order by calling each block
+    # directly, so a cut can use the result of a cut on which it depends
+    applyimpl = ''
     for name, words, records in blocks['cut']:    
         vcuts += '  cuts.push_back(&cut_%s);\n' % name
     
@@ -1292,36 +2505,69 @@ def process_cuts(names, blocks, blocktypes):
         if DEBUG > 0:
             print 'CUT( %s )' % name
 
-        # get cut strings
-        values = []
+        applyimpl += timed(names, 'timer_cut_%s' % name, 'cut %s' % name,
+                           '%scut_%s.apply();\n' % (tab2, name), tab2,
+                           'cut_%s.result' % name)
+
+        # get cut strings, scanned thresholds, and event weights
+        values  = []
+        scans   = []
+        weights = []
         for record in records:
             t = split(record)
             token = t[0]
-            if token != 'select': continue
             value = joinfields(t[1:], ' ')
-            values.append(value)
-
+            if   token == 'select':
+                scan = getscan.findall(value)
+                if scan == []:
+                    values.append(value)
+                    continue
+                expr, op, lo, hi, n = map(strip, scan[0])
+                try:
+                    n = int(n)
+                except:
+                    boohoo('cut %s: the number of thresholds in %s must be '\
+                           'an integer' % (name, value))
+                if n < 1:
+                    boohoo('cut %s: the number of thresholds in %s must be '\
+                           'at least 1' % (name, value))
+                try:
+                    if float(hi) < float(lo):
+                        boohoo('cut %s: the upper threshold in %s is below '\
+                               'the lower one' % (name, value))
+                except ValueError:
+                    pass # thresholds given as expressions
+                scans.append((expr, op, lo, hi, n))
+            elif token == 'weight':
+                weights.append(substituteCSE(convert2cpp(value, 'cut',
+                                                         blocktypes), blocks))
+
+        if len(scans) > 3:
+            boohoo('cut %s: at most three thresholds can be scanned' % name)
+        
         cutdef += 'struct cut_%s_s : public lhadaThing\n' % name 
         cutdef += '{\n'
         cutdef += '  std::string name;\n'
         cutdef += '  double total;\n'
         cutdef += '  double dtotal;\n'
         cutdef += '  TH1F*  hcount;\n'
-        cutdef += '  bool   done;\n'
         cutdef += '  bool   result;\n'
         cutdef += '  double weight;\n\n'
         cutdef += '  int    ncuts;\n\n'
+        if scans != []:
+            cutdef += '  lhadaScan scan;\n\n'
         cutdef += '  cut_%s_s()\n' % name
         cutdef += '''    : lhadaThing(),
       name("%s"),
       total(0),
       dtotal(0),
       hcount(0),
-      done(false),
       result(false),
       weight(1),
-      ncuts(%d)
-''' % (name, len(values))
+      ncuts(%d)''' % (name, len(values))
+        if scans != []:
+            cutdef += ',\n      scan("%s")' % name
+        cutdef += '\n'
            
         cutdef += '''  {
     hcount = new TH1F("cutflow_%s", "", 1, 0, 1);
@@ -1334,8 +2580,18 @@ def process_cuts(names, blocks, blocktypes):
         
         for value in values:
             cutdef += '    hcount->Fill("%s", 0);\n' % nip.sub('', value)        
+        if scans != []:
+            cutdef += '\n'
+        for expr, op, lo, hi, n in scans:
+            cutdef += '    scan.add("%s", "%s", %s, %s, %d);\n' % \
+              (strip(nip.sub('', expr + ' ')), op, lo, hi, n)
         cutdef += '  }\n\n'
         cutdef += '  ~cut_%s_s() {}\n\n' % name
+        scansummary = ''
+        if scans != []:
+            scansummary = '''    os << "  threshold scan written to histogram scan_" << name
+       << std::endl;
+'''
         cutdef += '''  void summary(std::ostream& os)
   {
     os << name << std::endl;
@@ -1354,37 +2610,602 @@ def process_cuts(names, blocks, blocktypes):
                 value, error, efficiency);
         os << record << std::endl;
       }
-    os << std::endl;
+%(scan)s    os << std::endl;
   }
-''' % {'percent': '%'}
+''' % {'percent': '%', 'scan': scansummary}
         
-        cutdef += '  void count(string c)\t\t{ hcount->Fill(c.c_str(), weight); }\n'
-        cutdef += '  void write(TFile* fout)\t{ fout->cd(); hcount->Write(); }\n'
-        cutdef += '  void reset()\t\t\t{ done = false; result = false; }\n'
-        cutdef += '  bool operator()()\t\t{ return apply(); }\n\n'     
+        cutdef += '  void count(const char* c)\t{ hcount->Fill(c, weight); }\n'
+        if scans != []:
+            cutdef += '''  void write(TFile* fout)
+  {
+    fout->cd();
+    hcount->Write();
+    scan.write(fout);
+  }
+'''
+        else:
+            cutdef += '  void write(TFile* fout)\t{ fout->cd(); hcount->Write(); }\n'
+        cutdef += '  void reset()\t\t\t{ result = false; }\n'
+        cutdef += '  bool operator()()\t\t{ return result; }\n\n'     
         cutdef += '  bool apply()\n'
         cutdef += '  {\n'
-        cutdef +='''    if ( done ) return result;
-    done   = true;
-    result = false;
-    count("none");
-
-'''       
-        for value in values:
+        cutdef += '    result = false;\n'
+        if weights != []:
+            cutdef += '    weight = %s;\n' % \
+              joinfields(['(%s)' % x for x in weights], ' * ')
+        cutdef += '    count("none");\n\n'
+        for ii, value in enumerate(values):
             # convert to C++
-            cutdef += '%sif ( !(%s) ) return false;\n' % \
-              (tab4, convert2cpp(value, 'cut', blocktypes))
+            cpp = substituteCSE(convert2cpp(value, 'cut', blocktypes), blocks)
+            if names['instrument']:
+                timer = 'timer_cut_%s_%d' % (name, ii+1)
+                addTimer(names, timer, 'cut %s: %s' % \
+                         (name, nip.sub('', value)))
+                cutdef += '%s%s.start();\n' % (tab4, timer)
+                cutdef += '%sif ( !%s.stop(%s) ) return false;\n' % \
+                  (tab4, timer, cpp)
+            else:
+                cutdef += '%sif ( !(%s) ) return false;\n' % (tab4, cpp)
             cutdef += '%scount("%s");\n\n' % (tab4, nip.sub('', value))
+        if scans != []:
+            # the scanned variables are computed once per event that
+            # passes the other selections
+            cutdef += '%s// record the scanned variables\n' % tab4
+        for ii, (expr, op, lo, hi, n) in enumerate(scans):
+            cutdef += '%sscan.set(%d, %s);\n' % \
+              (tab4, ii, substituteCSE(convert2cpp(expr, 'cut', blocktypes),
+                                       blocks))
+        if scans != []:
+            cutdef += '%sscan.fill(weight);\n\n' % tab4
         cutdef += '%stotal  += weight;\n'  % tab4
         cutdef += '%sdtotal += weight * weight;\n\n'  % tab4
-        cutdef += '%s// NB: remember to update result cache\n' % tab4
         cutdef += '%sresult  = true;\n' % tab4
         cutdef += '%sreturn true;\n' % tab4
         cutdef += '  }\n'            
         cutdef += '} cut_%s;\n\n' % name
 
+    if find(cutdef, 'lhadaScan scan;') > -1:
+        cutdef = SCAN_CC + cutdef
     names['cutdef'] = cutdef
     names['vcuts']  = vcuts
+    names['applyimpl'] = applyimpl
+
+    # summarize the cuts of each analysis in turn for combined analyses
+    summaryimpl = '''  for(size_t c=0; c < cuts.size(); c++)
+    {
+      cuts[c]->summary(os);
+      cuts[c]->write(fout);
+    }
+'''
+    if blocks['analysis_info'] != []:
+        summaryimpl = ''
+        for tag, filename, info in blocks['analysis_info']:
+            summaryimpl += '  os << "Analysis %s" << std::endl '\
+              '<< std::endl;\n' % filename
+            for name, words, records in blocks['cut']:
+                if blocks['cut_analysis'].get(name, None) != tag: continue
+                summaryimpl += '  cut_%s.summary(os);\n' % name
+                summaryimpl += '  cut_%s.write(fout);\n' % name
+    names['summaryimpl'] = summaryimpl
+#--------------------------------------------------------------------------------
+# Derived variable cache. The event variables, the cached expressions used by
+# the cuts, and the results of the cuts are written, for every event, to the
+# tree lhadacache in the file <output>_cache.root. If the analyzer is run on
+# such files, the cuts are evaluated from the stored values without reading
+# the original trees or recreating the objects. Since the cut values are
+# compiled into the analyzer, a modified ADL file is translated as usual and
+# the new analyzer is run on the cache.
+#--------------------------------------------------------------------------------
+arithmetic = re.compile(r'^(const\s+)?(unsigned\s+)?'\
+                        r'(double|float|int|long|short|bool|size_t)$')
+
+def process_cache(names, blocks, blocktypes):
+    if DEBUG > 0:
+        print '\nBEGIN( process_cache )'
+
+    for key in ['vcolumns', 'cachedecl', 'cacheimpl', 'cachefun',
+                'cacheread', 'cacheopen', 'cachestore', 'cacheclose']:
+        names[key] = ''
+    if not names['cache']: return
+
+    # the cuts must depend only on variables, cached expressions, and
+    # other cuts
+    cached = set()
+    for name, words, records in blocks['cut']:
+        for record in records:
+            t = split(record)
+            if t[0] not in ['select', 'weight']: continue
+            value = joinfields(t[1:], ' ')
+            record = substituteCSE(convert2cpp(value, 'cut', blocktypes),
+                                   blocks)
+            cached.update(re.findall(r'\bcached_\w+(?=[(][)])', record))
+            used = blocktypes['object'].intersection(getwords.findall(record))
+            if used != set():
+                boohoo('''cut %s uses %s in
+    %s
+    which cannot be computed from the cache of derived variables.''' % \
+                       (name, joinfields(list(used), ', '), value))
+
+    columns = [] # (column name, value, variable to restore)
+    if blocks.has_key('variable'):
+        for name, words, records in blocks['variable']:
+            rtype = None
+            for record in records:
+                t = split(record)
+                if t[0] != 'apply': continue
+                fname = split(joinfields(t[1:], ' '), '(')[0]
+                rtype = blocks['function_info'][fname][0]
+            if rtype == None or arithmetic.findall(strip(rtype)) == []:
+                boohoo('variable %s of type %s cannot be cached' % \
+                       (name[:-1], rtype))
+            columns.append((name[:-1], name, name))
+    for expr, cname in blocks['cse']:
+        if cname not in cached: continue
+        columns.append((cname, '%s()' % cname, '%s_' % cname))
+    for name, words, records in blocks['cut']:
+        columns.append(('cut_%s' % name, 'cut_%s.result' % name, None))
+
+    tab2 = ' '*2
+    vcolumns  = '\n%s// names of cached derived variables and cut results\n' \
+      % tab2
+    cacheimpl = '''
+// store the derived variables and cut results of the current event
+void %(name)s_s::store()
+{
+''' % names
+    rerunimpl = '''
+// evaluate the cuts from the derived variables of an event read from
+// the cache
+void %(name)s_s::rerun()
+{
+  // invalidate per-event caches
+  lhadaEvent++;
+
+  // restore derived variables
+''' % names
+    for ii, (cname, value, variable) in enumerate(columns):
+        vcolumns  += '%scolumnnames.push_back("%s");\n' % (tab2, cname)
+        cacheimpl += '%scolumns[%d]\t= %s;\n' % (tab2, ii, value)
+        if variable == None: continue
+        rerunimpl += '%s%s\t= columns[%d];\n' % (tab2, variable, ii)
+        if variable != value:
+            rerunimpl += '%s%s_event\t= lhadaEvent;\n' % (tab2, cname)
+    vcolumns  += '%scolumns.resize(columnnames.size());\n' % tab2
+    cacheimpl += '}\n'
+    rerunimpl += '\n  // apply event level selections\n'
+    rerunimpl += '%s}\n' % names['applyimpl']
+
+    names['vcolumns']  = vcolumns
+    names['cacheimpl'] = cacheimpl + rerunimpl
+    names['cachedecl'] = '''
+  // derived variables and cut results, which are stored by store() and
+  // used by rerun() to evaluate the cuts without recreating the objects
+  std::vector<std::string> columnnames;
+  std::vector<double> columns;
+  void store();
+  void rerun();
+'''
+    names['cachefun'] = '''//------------------------------------------------------------------
+// Return true if the file contains a cache of derived variables
+//------------------------------------------------------------------
+bool isCache(string filename)
+{
+  TFile* file = TFile::Open(filename.c_str());
+  if ( !file ) return false;
+  bool found = file->Get("lhadacache") != 0;
+  file->Close();
+  delete file;
+  return found;
+}
+//------------------------------------------------------------------
+// Evaluate the cuts from a cache of derived variables
+//------------------------------------------------------------------
+int rerun(commandLine& cl, vector<string>& filenames)
+{
+  itreestream stream(filenames, "lhadacache");
+  if ( !stream.good() ) error("can't read cache files");
+  int nevents = stream.size();
+  cout << "number of cached events: " << nevents << endl;
+
+  outputFile of(cl.outputfilename);
+
+  %(name)s_s %(analyzer)s;
+  for(size_t c=0; c < %(analyzer)s.columnnames.size(); c++)
+    stream.select(%(analyzer)s.columnnames[c], %(analyzer)s.columns[c]);
+
+  for(int entry=0; entry < nevents; entry++)
+    {
+      stream.read(entry);
+
+      if ( entry %(percent)s 10000 == 0 ) cout << entry << endl;
+
+      %(analyzer)s.rerun();
+    }
+
+  // summarize analysis
+  %(analyzer)s.summary(of.file_, cout);
+
+  stream.close();
+  of.close();
+  return 0;
+}
+''' % names
+    names['cacheread'] = '''
+  // if these are caches of derived variables written by a previous run,
+  // evaluate the cuts from the caches
+  if ( isCache(filenames[0]) ) return rerun(cl, filenames);
+'''
+    names['cacheopen'] = '''
+  // cache of derived variables keyed by the index of the input file
+  // and the entry number
+  string cachename = cl.outputfilename;
+  if ( cachename.size() > 5 &&
+       cachename.substr(cachename.size()-5) == ".root" )
+    cachename.replace(cachename.size()-5, 5, "_cache.root");
+  else
+    cachename += "_cache.root";
+  otreestream cache(cachename, "lhadacache", "derived variables");
+  int lhadaFile  = 0;
+  int lhadaEntry = 0;
+  cache.add("lhadaFile",  lhadaFile);
+  cache.add("lhadaEntry", lhadaEntry);
+  for(size_t c=0; c < %(analyzer)s.columnnames.size(); c++)
+    cache.add(%(analyzer)s.columnnames[c], %(analyzer)s.columns[c]);
+''' % names
+    names['cachestore'] = '''
+      // store derived variables
+      lhadaFile  = stream.number();
+      lhadaEntry = entry;
+      %(analyzer)s.store();
+      cache.commit();
+''' % names
+    names['cacheclose'] = '''  cache.close();
+  cout << "derived variables cached in " << cachename << endl;
+
+'''
+#--------------------------------------------------------------------------------
+# Skims. For each requested cut, the entries that pass the cut are recorded,
+# in increasing order, in the tree skim_<cut> of the output file. A later run
+# of any analyzer on the same file list can be restricted to these entries
+# by giving <output file>:<cut> as its third command line argument.
+#--------------------------------------------------------------------------------
+def process_skims(names, blocks):
+    if DEBUG > 0:
+        print '\nBEGIN( process_skims )'
+
+    for key in ['skimopen', 'skimstore', 'skimclose']:
+        names[key] = ''
+    if names['skim'] == '': return
+
+    cutnames = [x[0] for x in blocks['cut']]
+    if names['skim'] == 'all':
+        skims = cutnames
+    else:
+        skims = map(strip, split(names['skim'], ','))
+        for name in skims:
+            if name not in cutnames:
+                boohoo('unknown cut %s in skim list' % name)
+
+    skimopen  = '''
+  // entries that pass the cuts, keyed by the index of the input file
+  // and the entry number
+  int skimfile  = 0;
+  int skimentry = 0;
+'''
+    skimstore = '''
+      // record the entries that pass the cuts
+      skimfile  = stream.number();
+      skimentry = entry;
+'''
+    skimclose = ''
+    for name in skims:
+        # position of the cut in the cut registry of the analyzer
+        index = cutnames.index(name)
+        skimopen += '''  otreestream skim_%(cut)s(of.file_, "skim_%(cut)s", "entries passing %(cut)s");
+  skim_%(cut)s.add("lhadaFile",  skimfile);
+  skim_%(cut)s.add("lhadaEntry", skimentry);
+''' % {'cut': name}
+        skimstore += '      if ( (*%s.cuts[%d])() ) skim_%s.commit();\n' % \
+          (names['analyzer'], index, name)
+        skimclose += '  skim_%s.close(false);\n' % name
+    names['skimopen']  = skimopen
+    names['skimstore'] = skimstore
+    names['skimclose'] = skimclose
+#--------------------------------------------------------------------------------
+# Sampled cutflows. If requested, the entries are processed in a random order,
+# so that the events processed so far are a random sample of the input files,
+# and the loop stops as soon as the efficiency of each cut is known to the
+# requested relative precision, as estimated from its Wilson interval. An
+# efficiency below SAMPLE_FLOOR, e.g., that of a cut that never passes, is
+# only required to be known to the precision times SAMPLE_FLOOR, since its
+# relative precision would never be reached.
+#--------------------------------------------------------------------------------
+SAMPLE_FLOOR = 1.e-3
+SAMPLE_CC =\
+'''#include <random>
+#include <algorithm>
+#include <cmath>
+//------------------------------------------------------------------
+// Efficiencies of cuts estimated from a random sample of events.
+// The half-width of the Wilson score interval (at 68.3% confidence),
+// divided by its center, is used as the relative precision. For
+// efficiencies below floor, the half-width divided by floor is used
+// instead. The events are counted without their weights.
+//------------------------------------------------------------------
+struct lhadaSampler
+{
+  double precision;
+  double floor;
+  std::vector<std::string> names;
+  std::vector<lhadaThing*> cuts;
+  std::vector<double> passed;
+  double total;
+
+  lhadaSampler(double precision_, double floor_)
+    : precision(precision_),
+      floor(floor_),
+      names(std::vector<std::string>()),
+      cuts(std::vector<lhadaThing*>()),
+      passed(std::vector<double>()),
+      total(0)
+  {}
+
+  void add(std::string name, lhadaThing* cut)
+  {
+    names.push_back(name);
+    cuts.push_back(cut);
+    passed.push_back(0);
+  }
+
+  void fill()
+  {
+    total++;
+    for(size_t c=0; c < cuts.size(); c++)
+      if ( (*cuts[c])() ) passed[c]++;
+  }
+
+  void interval(size_t c, double& center, double& halfwidth)
+  {
+    double n = total;
+    double p = passed[c] / n;
+    double z2 = 1;
+    double d = 1 + z2 / n;
+    center    = (p + z2 / (2 * n)) / d;
+    halfwidth = sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / d;
+  }
+
+  // true if all efficiencies are known to the requested precision
+  bool done()
+  {
+    if ( total < 1000 ) return false;
+    for(size_t c=0; c < cuts.size(); c++)
+      {
+        double center, halfwidth;
+        interval(c, center, halfwidth);
+        if ( halfwidth > precision * std::max(center, floor) ) return false;
+      }
+    return true;
+  }
+
+  void summary(std::ostream& os, size_t nentries)
+  {
+    os << std::endl << "Sampled efficiencies" << std::endl << std::endl;
+    os << " events used: " << total << " of " << nentries << std::endl;
+    if ( total < 1 ) return;
+    char record[1024];
+    for(size_t c=0; c < cuts.size(); c++)
+      {
+        double center, halfwidth;
+        interval(c, center, halfwidth);
+        sprintf(record, " %-45s: %9.0f %10.4f +/- %8.4f",
+                names[c].c_str(), passed[c], passed[c] / total, halfwidth);
+        os << record << std::endl;
+      }
+    os << std::endl;
+  }
+};
+'''
+
+def process_sampling(names, blocks):
+    if DEBUG > 0:
+        print '\nBEGIN( process_sampling )'
+
+    for key in ['samplefun', 'sampleopen', 'samplestore', 'sampleclose']:
+        names[key] = ''
+    if names['precision'] == '': return
+
+    if names['cache']:
+        boohoo('sampled cutflows cannot be used together with the cache')
+    if names['skim'] != '':
+        boohoo('sampled cutflows cannot be used together with skims')
+
+    t = split(names['precision'], ':')
+    try:
+        precision = float(t[0])
+    except:
+        boohoo('the precision must be a number, but got %s' % t[0])
+    if precision <= 0:
+        boohoo('the precision must be positive')
+
+    cutnames = [x[0] for x in blocks['cut']]
+    if len(t) > 1:
+        regions = map(strip, split(t[1], ','))
+        for name in regions:
+            if name not in cutnames:
+                boohoo('unknown cut %s in precision' % name)
+    else:
+        regions = cutnames
+
+    sampleopen = '''
+  // process the entries in a random, but reproducible, order and stop
+  // when the efficiencies of the cuts are known to a relative precision
+  // of %(precision)s
+  std::mt19937 generator(12345);
+  std::shuffle(entries.begin(), entries.end(), generator);
+  lhadaSampler sampler(%(precision)s, %(floor)s);
+''' % {'precision': repr(precision), 'floor': repr(SAMPLE_FLOOR)}
+    for name in regions:
+        # position of the cut in the cut registry of the analyzer
+        index = cutnames.index(name)
+        sampleopen += '  sampler.add("%s", %s.cuts[%d]);\n' % \
+          (name, names['analyzer'], index)
+
+    names['samplefun']  = SAMPLE_CC
+    names['sampleopen'] = sampleopen
+    names['samplestore']= '''
+      // stop when the efficiencies are known well enough
+      sampler.fill();
+      if ( (nprocessed %(percent)s 1000 == 0) && sampler.done() ) break;
+''' % names
+    names['sampleclose']= '  sampler.summary(cout, entries.size());\n'
+#--------------------------------------------------------------------------------
+# Columnar input. If requested, the events are read from memory-mapped columnar
+# files with icolumnstream, which does not depend on ROOT, instead of from ROOT
+# files with itreestream. Only the eventBuffer fields used by the event adapter
+# are read; their columns are named after the branches in the eventBuffer.
+#--------------------------------------------------------------------------------
+getbranches = re.compile(r'input->select\s*\(\s*"([^"]+)"\s*,\s*(\w+)\s*\)')
+getfields   = re.compile(r'\bev[.](\w+)')
+cppcomment  = re.compile(r'//.*$', re.M)
+
+def process_columnar(names):
+    if DEBUG > 0:
+        print '\nBEGIN( process_columnar )'
+
+    names['streaminclude'] = ''
+    names['streamopen']    = STREAMOPEN_CC % names
+    names['readimpl']      = '      ev.read(entry);\n'
+    if not names['columnar']: return
+
+    # map eventBuffer fields to branches
+    if not os.path.exists('include/eventBuffer.h'):
+        boohoo('include/eventBuffer.h not found')
+    branches = {}
+    for branch, field in getbranches.findall(open('include/eventBuffer.h')\
+                                                 .read()):
+        branches[field] = branch
+
+    # find the fields used by the event adapter
+    adapter = 'src/%(adaptername)s.cc' % names
+    if not os.path.exists(adapter):
+        boohoo('%s not found' % adapter)
+    record = cppcomment.sub('', open(adapter).read())
+    fields = []
+    for field in getfields.findall(record):
+        if field in fields: continue
+        if not branches.has_key(field): continue
+        fields.append(field)
+    if fields == []:
+        boohoo('no eventBuffer fields found in %s' % adapter)
+
+    streamopen = '''
+  // Create a reader of memory-mapped columnar files
+  icolumnstream stream(filenames);
+  if ( !stream.good() ) error("can't read columnar input files");
+
+  // Create a buffer to receive events from the stream, and select the
+  // columns used by the event adapter
+  eventBuffer ev;
+'''
+    for field in fields:
+        streamopen += '  stream.select("%s", ev.%s);\n' % (branches[field],
+                                                           field)
+    streamopen += '  int nevents = stream.size();\n'
+
+    names['streaminclude'] = '#include "columnstream.h"\n'
+    names['streamopen']    = streamopen
+    names['readimpl']      = '      stream.read(entry);\n'
+#--------------------------------------------------------------------------------
+# Instrumentation. If requested, the creation of each object, the computation
+# of each variable, and the application of each cut and of each of its
+# selections are timed, and their calls and passes counted. Note that the
+# time taken to compute a cached expression is attributed to the first
+# statement that uses it in a given event.
+#--------------------------------------------------------------------------------
+def addTimer(names, timer, label):
+    names['timerlist'].append((timer, label))
+
+def timed(names, timer, label, code, tab, passed=None):
+    # return the given code, surrounded by calls to a timer if the
+    # analyzer is to be instrumented
+    if not names['instrument']: return code
+    addTimer(names, timer, label)
+    if passed == None: passed = ''
+    return '%s%s.start();\n%s%s%s.stop(%s);\n' % \
+      (tab, timer, code, tab, timer, passed)
+
+def process_instrument(names):
+    if DEBUG > 0:
+        print '\nBEGIN( process_instrument )'
+
+    for key in ['timers', 'vtimers', 'timersummary', 'timerdecl',
+                'timerdef', 'timeropen']:
+        names[key] = ''
+    if not names['instrument']: return
+
+    timers = '//\n// instrumentation of the blocks and statements\n'
+    timers+= 'vector<lhadaTimer*> lhadaTimers;\n'
+    for timer, label in names['timerlist']:
+        timers += 'lhadaTimer %s("%s", lhadaTimers);\n' % (timer, label)
+
+    names['timers']   = timers
+    names['timerdef'] = TIMER_HH
+    names['timerdecl']= '''
+  // timers of the blocks and statements
+  std::vector<lhadaTimer*> timers;
+'''
+    names['vtimers']  = '\n  timers = lhadaTimers;\n'
+    names['timersummary'] = '''
+  // report of the instrumentation
+  lhadaTimerReport(timers, fout, os, "%(name)s_timing.json");
+''' % names
+
+    # time reading and mapping of events in the main program
+    names['timeropen'] = '''
+  // time the reading of events and the event adapter
+  lhadaTimer timer_read("read event", %(analyzer)s.timers);
+  lhadaTimer timer_adapter("event adapter", %(analyzer)s.timers);
+''' % names
+    tab6 = ' '*6
+    names['readimpl'] = '%stimer_read.start();\n%s%stimer_read.stop();\n' % \
+      (tab6, names['readimpl'], tab6)
+    names['extobjimpl'] = '\n%stimer_adapter.start();%s%stimer_adapter.stop();\n'\
+      % (tab6, names['extobjimpl'], tab6)
+#--------------------------------------------------------------------------------
+# Attribute names are mapped to keys by a search through the list of names.
+# Rather than repeat the search at every access, replace the accesses
+# p("pt"), jetsSR[0]("pt"), etc., in the generated code by accesses with
+# keys that are resolved once, e.g., p(lhadaKey_pt).
+#--------------------------------------------------------------------------------
+particledecl = re.compile(r'\bTEParticle\b\s*>?\s*&?\s*([a-zA-Z_]\w*)')
+
+def resolveKeys(record):
+    particles = set(particledecl.findall(record))
+    if len(particles) == 0: return record
+
+    keys = {}
+    def key(m):
+        attr = m.group(3)
+        if not keys.has_key(attr):
+            # e.g., |eta| -> lhadaKey_abs_eta
+            kname = re.sub(r'^[|](.*)[|]$', r'abs_\1', attr)
+            kname = 'lhadaKey_%s' % strip(re.sub(r'\W+', '_', kname), '_')
+            if kname in keys.values():
+                kname += '%d' % len(keys)
+            keys[attr] = kname
+        return '%s%s(%s)' % (m.group(1), m.group(2) or '', keys[attr])
+
+    accessor = re.compile(r'\b(%s)(\[[^\]]+\])?[(]"([^"]+)"[)]' % \
+                          joinfields(sorted(particles), '|'))
+    record = accessor.sub(key, record)
+    if len(keys) == 0: return record
+
+    keydef = '// keys of the particle attributes\n'
+    for kname, attr in sorted([(v, k) for k, v in keys.items()]):
+        keydef += 'static const int %s = TEValues::key("%s");\n' % \
+          (kname, attr)
+    event  = 'long\tlhadaEvent = 0;\n'
+    return replace(record, event, event + keydef, 1)
 #--------------------------------------------------------------------------------
 def main():
 
@@ -1397,12 +3218,21 @@ def main():
 ''')
         
         
-    filename, option = decodeCommandLine()
+    filenames, option = decodeCommandLine()
     names  = NAMES
-    names['filename']    = filename
+    names['filename']    = joinfields(filenames, ' ')
     names['name']        = option.name    
     names['treename']    = option.treename
     names['adaptername'] = option.adaptername
+    names['cse']         = option.cse
+    names['ordered']     = option.ordered
+    names['cache']       = option.cache
+    names['skim']        = option.skim
+    names['instrument']  = option.instrument
+    names['timerlist']   = []
+    names['profile']     = option.profile
+    names['precision']   = option.precision
+    names['columnar']    = option.columnar
 
     # check that src and include directories exist
     if not os.path.exists('src'):
@@ -1424,6 +3254,11 @@ cp $LHADA2TNM_PATH/external/include/%(adaptername)s.h include/
 cp $LHADA2TNM_PATH/external/src/TEParticle.cc src/
 cp $LHADA2TNM_PATH/external/src/%(adaptername)s.cc src/
 ''' % names
+    if names['columnar']:
+        cmd += '''
+cp $LHADA2TNM_PATH/external/include/columnstream.h include/
+cp $LHADA2TNM_PATH/external/src/columnstream.cc src/
+'''
     os.system(cmd)    
     
     names['fundef']   = ''
@@ -1431,7 +3266,10 @@ cp $LHADA2TNM_PATH/external/src/%(adaptername)s.cc src/
     names['vardef']   = ''
     names['aodimpl']  = ''
     names['percent']  = '%'
-    blocks = extractBlocks(filename)
+    blocks = mergeAnalyses(filenames)
+
+    # duplicate the blocks that depend on systematic variations
+    expandVariations(blocks)
 
     blocktypes = {}
     for btype in BLOCKTYPES:
@@ -1440,6 +3278,10 @@ cp $LHADA2TNM_PATH/external/src/%(adaptername)s.cc src/
         for name, words, records in blocks[btype]:
             blocktypes[btype].add(name)
 
+    # order the selections of each cut by cost and rejection
+    if names['profile'] != '':
+        reorderSelections(names['profile'], blocks, blocktypes)
+
     if DEBUG > 0:
         printBlocks(blocks)
 
@@ -1449,15 +3291,27 @@ cp $LHADA2TNM_PATH/external/src/%(adaptername)s.cc src/
 
     process_objects(names,   blocks, blocktypes)
 
+    process_cse(names,       blocks, blocktypes)
+
     process_variables(names, blocks)
 
     process_cuts(names,      blocks, blocktypes)
 
+    process_cache(names,     blocks, blocktypes)
+
+    process_skims(names,     blocks)
+
+    process_sampling(names,  blocks)
+
+    process_columnar(names)
+
+    process_instrument(names)
+
     # --------------------------------------------    
     # write out C++ code
     # --------------------------------------------
 
-    record = TEMPLATE_CC % names
+    record = resolveKeys(TEMPLATE_CC % names)
     open('src/%(name)s_s.cc' % names, 'w').write(record)
 
     record = TEMPLATE_HH % names
@@ -0,0 +1,103 @@
+#--------------------------------------------------------------------------------
+# Description: write events in the memory-mapped columnar format read by
+#              icolumnstream (see external/include/columnstream.h)
+#--------------------------------------------------------------------------------
+import sys, struct
+from array import array
+#--------------------------------------------------------------------------------
+MAGIC   = 'LHADACOL'
+VERSION = 1
+
+def offsetArray():
+    # an array of unsigned 64-bit integers
+    for code in ['L', 'Q']:
+        try:
+            a = array(code)
+        except ValueError:
+            continue
+        if a.itemsize == 8: return a
+    sys.exit('** lhadacolumns ** no 64-bit integer array type')
+
+class Column:
+    def __init__(self, name, variable):
+        self.name     = name
+        self.variable = variable
+        self.values   = array('f')
+        if variable:
+            self.offsets = offsetArray()
+            self.offsets.append(0)
+        else:
+            self.offsets = None
+
+    def fill(self, values):
+        # add the values of the next event
+        if self.variable:
+            self.values.extend(values)
+            self.offsets.append(len(self.values))
+        else:
+            self.values.append(values)
+
+class ColumnWriter:
+    def __init__(self, filename):
+        self.filename = filename
+        self.columns  = []
+        self.index    = {}
+        self.nevents  = 0
+
+    def add(self, name, variable=True):
+        if name in self.index:
+            sys.exit('** lhadacolumns ** column %s already added' % name)
+        self.index[name] = len(self.columns)
+        self.columns.append(Column(name, variable))
+
+    def __getitem__(self, name):
+        return self.columns[self.index[name]]
+
+    def commit(self):
+        # mark the end of an event
+        self.nevents += 1
+        for column in self.columns:
+            n = len(column.offsets)-1 if column.variable else len(column.values)
+            if n != self.nevents:
+                sys.exit('** lhadacolumns ** column %s has %d events, '\
+                         'but %d are expected' % \
+                         (column.name, n, self.nevents))
+
+    def close(self):
+        def align(n):
+            return (n + 7) & ~7
+
+        # compute positions of the offsets and values of each column
+        header = 24
+        for column in self.columns:
+            header += 4 + len(column.name) + 20
+        position  = align(header)
+        positions = []
+        for column in self.columns:
+            offsets = 0
+            if column.variable:
+                offsets  = position
+                position = align(position + 8*len(column.offsets))
+            values   = position
+            position = align(position + 4*len(column.values))
+            positions.append((offsets, values))
+
+        out = open(self.filename, 'wb')
+        out.write(struct.pack('<8sIIQ', MAGIC.encode('ascii'), VERSION,
+                              len(self.columns), self.nevents))
+        for column, (offsets, values) in zip(self.columns, positions):
+            name = column.name.encode('ascii')
+            out.write(struct.pack('<I', len(name)))
+            out.write(name)
+            out.write(struct.pack('<IQQ', int(column.variable),
+                                  offsets, values))
+        for column, (offsets, values) in zip(self.columns, positions):
+            for data, start in [(column.offsets, offsets),
+                                (column.values,  values)]:
+                if data is None: continue
+                out.write(b'\0' * (start - out.tell()))
+                if sys.byteorder == 'big':
+                    data = array(data.typecode, data)
+                    data.byteswap()
+                data.tofile(out)
+        out.close()
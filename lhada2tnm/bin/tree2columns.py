@@ -0,0 +1,120 @@
+#!/usr/bin/python
+#--------------------------------------------------------------------------------
+# Description: convert Delphes or CMS nano-AOD ROOT trees to the columnar
+#              format read by icolumnstream (see lhada2tnm.py -m)
+#--------------------------------------------------------------------------------
+import sys, os, optparse
+from lhadacolumns import ColumnWriter
+#--------------------------------------------------------------------------------
+USAGE ='''
+    Usage:
+       tree2columns.py [options] ROOT-file-name... output-file-name
+
+    Options:
+    -t name of ROOT tree                           [Delphes]
+    -b space-separated list of branches to convert [all numeric branches]
+    -n maximum number of events to convert         [all]
+    '''
+
+NUMERIC = set(['Float_t', 'Double_t', 'Int_t', 'UInt_t', 'Short_t',
+               'UShort_t', 'Long_t', 'ULong_t', 'Long64_t', 'ULong64_t',
+               'Char_t', 'UChar_t', 'Bool_t',
+               'float', 'double', 'int', 'unsigned int', 'short',
+               'unsigned short', 'long', 'unsigned long', 'bool'])
+#--------------------------------------------------------------------------------
+def decodeCommandLine():
+    parser = optparse.OptionParser(usage=USAGE)
+
+    parser.add_option("-t", "--tree",
+                      action="store",
+                      dest="treename",
+                      type="string",
+                      default='Delphes',
+                      help="name of ROOT tree")
+
+    parser.add_option("-b", "--branches",
+                      action="store",
+                      dest="branches",
+                      type="string",
+                      default='',
+                      help="branches to convert")
+
+    parser.add_option("-n", "--nevents",
+                      action="store",
+                      dest="nevents",
+                      type="int",
+                      default=-1,
+                      help="maximum number of events to convert")
+
+    options, args = parser.parse_args()
+    if len(args) < 2:
+        sys.exit(USAGE)
+    return (args[:-1], args[-1], options)
+#--------------------------------------------------------------------------------
+def main():
+    filenames, outfilename, option = decodeCommandLine()
+
+    # import ROOT only after the command line has been decoded, since it
+    # may interpret the command line
+    import ROOT
+
+    chain = ROOT.TChain(option.treename)
+    for filename in filenames:
+        if not os.path.exists(filename):
+            sys.exit('** tree2columns.py ** file %s not found' % filename)
+        chain.Add(filename)
+    nevents = chain.GetEntries()
+    if option.nevents > -1:
+        nevents = min(nevents, option.nevents)
+    if nevents == 0:
+        sys.exit('** tree2columns.py ** no events in tree %s' % \
+                 option.treename)
+
+    # the columns are named after the branches, e.g., Jet.PT (Delphes) or
+    # Jet_pt (nano-AOD), as in the eventBuffer
+    chain.GetEntry(0)
+    leaves = []
+    for leaf in chain.GetListOfLeaves():
+        name = leaf.GetBranch().GetName()
+        if leaf.GetTypeName() not in NUMERIC: continue
+        if name in [x[0] for x in leaves]: continue
+        # leaves with a counter are stored with a variable number of values
+        variable = leaf.GetLeafCount() != None or leaf.GetLenStatic() > 1
+        leaves.append((name, variable))
+
+    if option.branches != '':
+        available = dict(leaves)
+        leaves = []
+        for name in option.branches.split():
+            if name not in available:
+                sys.exit('** tree2columns.py ** branch %s not found' % name)
+            leaves.append((name, available[name]))
+
+    out = ColumnWriter(outfilename)
+    for name, variable in leaves:
+        out.add(name, variable)
+
+    treenumber = -1
+    for event in range(nevents):
+        chain.GetEntry(event)
+        # the leaves change when the chain moves to the next file
+        if chain.GetTreeNumber() != treenumber:
+            treenumber = chain.GetTreeNumber()
+            current = [chain.GetLeaf(name) for name, variable in leaves]
+        for leaf, (name, variable) in zip(current, leaves):
+            if variable:
+                out[name].fill([leaf.GetValue(i) for i in range(leaf.GetLen())])
+            else:
+                out[name].fill(leaf.GetValue(0))
+        out.commit()
+
+        if event % 10000 == 0: print(event)
+
+    out.close()
+    print('wrote %d events and %d columns to %s' % \
+          (nevents, len(leaves), outfilename))
+#--------------------------------------------------------------------------------
+try:
+    main()
+except KeyboardInterrupt:
+    print('\nciao!')
@@ -3,7 +3,7 @@
 #include <cmath>
 #include "TLorentzVector.h"
 
-double METoverSqrtSumET(TLorentzVector& MET, double scalarHT) {
+double METoverSqrtSumET(const TLorentzVector& MET, double scalarHT) {
   return MET.Pt() / sqrt(scalarHT);
 }
 
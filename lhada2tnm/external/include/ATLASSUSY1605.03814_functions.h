@@ -5,7 +5,7 @@
 #include <cmath>
 #include "TLorentzVector.h"
 
-double Meff(std::vector<TLorentzVector>& jets, TLorentzVector& MET) {
+double Meff(const std::vector<TLorentzVector>& jets, const TLorentzVector& MET) {
   double meff = MET.Pt();
   for (size_t i=0; i<jets.size(); i++) {
     meff += jets[i].Pt();
@@ -13,7 +13,7 @@ double Meff(std::vector<TLorentzVector>& jets, TLorentzVector& MET) {
   return meff;
 }
 
-double dphijNjle3METmin(std::vector<TLorentzVector>& jets, TLorentzVector& MET) {
+double dphijNjle3METmin(const std::vector<TLorentzVector>& jets, const TLorentzVector& MET) {
   if (jets.size() < 2)
     return 0;
   int njets = jets.size();
@@ -26,7 +26,7 @@ double dphijNjle3METmin(std::vector<TLorentzVector>& jets, TLorentzVector& MET)
   return dphimin;
 }
 
-double dphijNjgt3METmin(std::vector<TLorentzVector>& jets, TLorentzVector& MET) {
+double dphijNjgt3METmin(const std::vector<TLorentzVector>& jets, const TLorentzVector& MET) {
   double dphimin = 999;
   if (jets.size() <= (size_t)3) 
     return 0;
@@ -37,8 +37,8 @@ double dphijNjgt3METmin(std::vector<TLorentzVector>& jets, TLorentzVector& MET)
   return dphimin;
 }
   
-double METovermeffNJ(std::vector<TLorentzVector>& jets,
-		     int njets, TLorentzVector& MET) {
+double METovermeffNJ(const std::vector<TLorentzVector>& jets,
+		     int njets, const TLorentzVector& MET) {
   if (jets.size() < (size_t)njets) {
     //std::cout << "Not enough jets" << std::endl;
     return 0;
@@ -50,7 +50,7 @@ double METovermeffNJ(std::vector<TLorentzVector>& jets,
   return MET.Pt() / meff;
 }
 
-double METoversqrtHT(std::vector<TLorentzVector>& jets, TLorentzVector& MET) {
+double METoversqrtHT(const std::vector<TLorentzVector>& jets, const TLorentzVector& MET) {
   double HT = 0;
   for (size_t i=0; i<jets.size(); i++) {
     HT += jets[i].Pt();
@@ -58,7 +58,7 @@ double METoversqrtHT(std::vector<TLorentzVector>& jets, TLorentzVector& MET) {
   return MET.Pt() / sqrt(HT);
 }
 
-double aplanarity(std::vector<TLorentzVector>& jets) {
+double aplanarity(const std::vector<TLorentzVector>& jets) {
   // to be filled in
   return 0;
 }
@@ -10,8 +10,8 @@ struct CMSNanoAODAdapter
 {
   CMSNanoAODAdapter();
   ~CMSNanoAODAdapter();
-  void operator()(eventBuffer& ev, std::string a, std::vector<TEParticle>& p);
-  void operator()(eventBuffer& ev, std::string a, TEParticle& p);
+  void operator()(eventBuffer& ev, const char* a, std::vector<TEParticle>& p);
+  void operator()(eventBuffer& ev, const char* a, TEParticle& p);
 };
 
 #endif
@@ -1,137 +1,180 @@
-#ifndef TEPARTICLE_H
-#define TEPARTICLE_H
-// ---------------------------------------------------------------------------
-// File: TEParticle.h
-// Description: Prototype of a generic ADL particle class.
-// created: Les Houches 2015 HBP
-// updated: 21-Mar-2019 HBP add cutvalue template class
-// ---------------------------------------------------------------------------
-#include <iostream>
-#include <string>
-#include <vector>
-#include <map>
-#include "TROOT.h"
-#include "TLorentzVector.h"
-// ---------------------------------------------------------------------------
-namespace {
-  enum LOGIC {OR, AND};
-};
-
-template <class T>
-class cutvector : public std::vector<T>
-{
- public:
-  cutvector<T>() : std::vector<T>(), logic(AND) {}
-  cutvector<T>(size_t n) : std::vector<T>(n, 0), logic(AND) {};
-  ~cutvector<T>() {}
-
-  void logical(LOGIC logic_)
-  {
-    logic = logic_;
-  }
-
-  LOGIC logic;
-};
-
-template <class X, class Y>
-bool operator<(cutvector<X> const& x, Y const& y)
-{
-  bool value;
-  switch(x.logic)
-    {
-    case OR:  value = false;
-      break;
-    case AND: value = true;
-      break;
-    };
-
-  for(size_t c=0; c < x.size(); c++)
-    {
-      switch(x.logic)
-	{
-	case OR:  value = value || (x[c] < static_cast<X>(y));
-	  break;
-	case AND: value = value && (x[c] < static_cast<X>(y));
-	  break;
-	}
-    }
-  return value;
-}
-
-template <class X, class Y>
-bool operator>(cutvector<X> const& x, Y const& y)
-{
-  bool value;
-  switch(x.logic)
-    {
-    case OR:  value = false;
-      break;
-    case AND: value = true;
-      break;
-    };
-
-  for(size_t c=0; c < x.size(); c++)
-    {
-      switch(x.logic)
-	{
-	case OR:  value = value || (x[c] > static_cast<X>(y));
-	  break;
-	case AND: value = value && (x[c] > static_cast<X>(y));
-	  break;
-	}
-    }
-  return value;
-}
-
-template <class X, class Y>
-bool operator<(X const& x, cutvector<Y> const& y)
-{
-  return y > x;
-}
-
-template <class X, class Y>
-bool operator>(X const& x, cutvector<Y> const& y)
-{
-  return y < x;
-}
-
-struct TEParticle : public TLorentzVector
-{
-  TEParticle();
-  TEParticle(int PID_,
-	     double PT, double Eta, double Phi, double Mass=0);
-  TEParticle(const TEParticle& p);
-  ~TEParticle();
-
-  static std::string name(int pdgid);
-  
-  bool        operator<(const TEParticle& p) const;
-  TEParticle& operator=(const TEParticle& p);
-  TEParticle  operator+(const TEParticle& o) const;
-  TEParticle  operator-(const TEParticle& o) const;
-  TEParticle  operator*(double a) const;
-  inline      operator float() {return Pt(); }
-  inline      operator double() {return Pt(); }
-  
-  double      operator()(std::string varname);
-
-  void        operator()(std::string varname, double x);
-  
-  int  UID;   // event unique identifier
-  int  PID;   // PDG ID
-  int  ID;
-  int  Status;  
-  int  Mother;
-  bool Skip;
-  double Order;
-  std::string Name;
-  std::vector<int> Daughters;
-  std::map<std::string, double> Value;
-  
-  static int s_UID;
-
-  ClassDef(TEParticle,0)
-};
-std::ostream& operator<<(std::ostream& os, const TEParticle& o);
-
-#endif
+#ifndef TEPARTICLE_H
+#define TEPARTICLE_H
+// ---------------------------------------------------------------------------
+// File: TEParticle.h
+// Description: Prototype of a generic ADL particle class.
+// created: Les Houches 2015 HBP
+// updated: 21-Mar-2019 HBP add cutvalue template class
+//          store attributes in a flat, allocation-free TEValues
+// ---------------------------------------------------------------------------
+#include <iostream>
+#include <string>
+#include <vector>
+#include <map>
+#include "TROOT.h"
+#include "TLorentzVector.h"
+// ---------------------------------------------------------------------------
+namespace {
+  enum LOGIC {OR, AND};
+};
+
+template <class T>
+class cutvector : public std::vector<T>
+{
+ public:
+  cutvector<T>() : std::vector<T>(), logic(AND) {}
+  cutvector<T>(size_t n) : std::vector<T>(n, 0), logic(AND) {};
+  ~cutvector<T>() {}
+
+  void logical(LOGIC logic_)
+  {
+    logic = logic_;
+  }
+
+  LOGIC logic;
+};
+
+template <class X, class Y>
+bool operator<(cutvector<X> const& x, Y const& y)
+{
+  bool value;
+  switch(x.logic)
+    {
+    case OR:  value = false;
+      break;
+    case AND: value = true;
+      break;
+    };
+
+  for(size_t c=0; c < x.size(); c++)
+    {
+      switch(x.logic)
+	{
+	case OR:  value = value || (x[c] < static_cast<X>(y));
+	  break;
+	case AND: value = value && (x[c] < static_cast<X>(y));
+	  break;
+	}
+    }
+  return value;
+}
+
+template <class X, class Y>
+bool operator>(cutvector<X> const& x, Y const& y)
+{
+  bool value;
+  switch(x.logic)
+    {
+    case OR:  value = false;
+      break;
+    case AND: value = true;
+      break;
+    };
+
+  for(size_t c=0; c < x.size(); c++)
+    {
+      switch(x.logic)
+	{
+	case OR:  value = value || (x[c] > static_cast<X>(y));
+	  break;
+	case AND: value = value && (x[c] > static_cast<X>(y));
+	  break;
+	}
+    }
+  return value;
+}
+
+template <class X, class Y>
+bool operator<(X const& x, cutvector<Y> const& y)
+{
+  return y > x;
+}
+
+template <class X, class Y>
+bool operator>(X const& x, cutvector<Y> const& y)
+{
+  return y < x;
+}
+
+// ---------------------------------------------------------------------------
+// Flat store of named attributes. Attribute names are case insensitive and
+// each is mapped, once, to a small integer key. Copying a particle or
+// accessing its attributes therefore does not allocate memory, unless a
+// particle has more than SIZE attributes, in which case the others are
+// stored on the heap. Looking up a name takes time, so code that accesses
+// attributes often should get their keys once, with TEValues::key, and use
+// the accessors that take a key.
+// ---------------------------------------------------------------------------
+struct TEValues
+{
+  enum { SIZE=32 };
+
+  TEValues() : n(0), xkeys(), xvalues() {}
+  double& operator[](const std::string& name) { return at(key(name.c_str())); }
+  double& operator[](const char* name) { return at(key(name)); }
+  double& operator[](int k) { return at(k); }
+  double& at(int k);
+  double  get(int k) const;
+  size_t  size() const { return n + xkeys.size(); }
+
+  static int key(const char* name);
+  static std::string name(int k);
+
+  size_t n;
+  int    keys[SIZE];
+  double values[SIZE];
+
+  // attributes beyond the first SIZE
+  std::vector<int>    xkeys;
+  std::vector<double> xvalues;
+};
+
+struct TEParticle : public TLorentzVector
+{
+  TEParticle();
+  TEParticle(int PID_,
+	     double PT, double Eta, double Phi, double Mass=0);
+  TEParticle(const TEParticle& p);
+  ~TEParticle();
+
+  static std::string name(int pdgid);
+
+  // number of heap allocations made so far by the program. allocations
+  // are counted only if compiled with -DLHADA_COUNT_ALLOCATIONS;
+  // otherwise -1 is returned.
+  static long allocations();
+  
+  bool        operator<(const TEParticle& p) const;
+  TEParticle& operator=(const TEParticle& p);
+  TEParticle  operator+(const TEParticle& o) const;
+  TEParticle  operator-(const TEParticle& o) const;
+  TEParticle  operator*(double a) const;
+  inline      operator float() {return Pt(); }
+  inline      operator double() {return Pt(); }
+  
+  double      operator()(std::string varname);
+  double      operator()(const char* varname);
+  double      operator()(int key);
+
+  void        operator()(std::string varname, double x);
+  void        operator()(const char* varname, double x);
+  void        operator()(int key, double x);
+  
+  int  UID;   // event unique identifier
+  int  PID;   // PDG ID
+  int  ID;
+  int  Status;  
+  int  Mother;
+  bool Skip;
+  double Order;
+  std::string Name;
+  std::vector<int> Daughters;
+  TEValues Value; //!
+  
+  static int s_UID;
+
+  ClassDef(TEParticle,0)
+};
+std::ostream& operator<<(std::ostream& os, const TEParticle& o);
+
+#endif
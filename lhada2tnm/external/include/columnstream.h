@@ -0,0 +1,133 @@
+#ifndef COLUMNSTREAM_H
+#define COLUMNSTREAM_H
+// ---------------------------------------------------------------------------
+// File: columnstream.h
+// Description: read events from memory-mapped columnar files. This is an
+//              alternative to itreestream, which does not depend on ROOT, for
+//              filling an eventBuffer (see lhada2tnm.py -m).
+//
+//              Layout of a columnar file (little endian):
+//
+//                char[8]  LHADACOL
+//                uint32   version (1)
+//                uint32   number of columns
+//                uint64   number of events
+//                for each column:
+//                  uint32 length of name
+//                  char[] name, e.g., Jet.PT
+//                  uint32 0 if one value per event, 1 if a variable number
+//                  uint64 position of offsets (variable number only)
+//                  uint64 position of values
+//                for each column:
+//                  uint64[events+1] offsets to the first value of each event
+//                                   (variable number only)
+//                  float[]          values
+//
+//              The positions are in bytes from the start of the file and
+//              are multiples of 8.
+// ---------------------------------------------------------------------------
+#include <iostream>
+#include <string>
+#include <vector>
+#include <map>
+#include <stdint.h>
+// ---------------------------------------------------------------------------
+class icolumnstream
+{
+ public:
+  icolumnstream();
+  icolumnstream(std::string filename);
+  icolumnstream(std::vector<std::string>& filenames);
+  virtual ~icolumnstream();
+
+  /// true if all files have been mapped
+  bool   good() { return good_; }
+
+  /// true if the named column is present
+  bool   present(std::string name);
+
+  /// read the named column into the given variable
+  template <class T>
+  void   select(std::string name, T& datum)
+  {
+    _select(name, &datum, copyValue<T>);
+  }
+
+  /// read the named column into the given vector
+  template <class T>
+  void   select(std::string name, std::vector<T>& data)
+  {
+    _select(name, &data, copyValues<T>);
+  }
+
+  /// read the selected columns of the given entry
+  int    read(int entry);
+
+  /// number of entries in all files
+  int    size()    { return (int)entries_; }
+  int    entries() { return (int)entries_; }
+
+  /// index of the file containing the current entry
+  int    number()  { return current_; }
+
+  std::string filename();
+  std::vector<std::string> filenames();
+  std::vector<std::string> names();
+
+  void   close();
+  void   ls(std::ostream& os=std::cout);
+
+ private:
+  typedef void (*Copy)(void* address, const float* values, uint64_t n);
+
+  struct Column
+  {
+    bool  variable;
+    const uint64_t* offsets;
+    const float*    values;
+  };
+
+  struct File
+  {
+    std::string name;
+    int         fd;
+    char*       address;
+    size_t      length;
+    uint64_t    first;
+    uint64_t    entries;
+    std::map<std::string, Column> columns;
+  };
+
+  struct Binding
+  {
+    std::string   name;
+    void*         address;
+    Copy          copy;
+    const Column* column;
+  };
+
+  bool _open(std::string filename);
+  void _select(std::string name, void* address, Copy copy);
+  void _update(int current);
+
+  template <class T>
+  static void copyValue(void* address, const float* values, uint64_t n)
+  {
+    *(T*)address = n > 0 ? (T)values[0] : (T)0;
+  }
+
+  template <class T>
+  static void copyValues(void* address, const float* values, uint64_t n)
+  {
+    // assign reuses the capacity of the vector
+    ((std::vector<T>*)address)->assign(values, values + n);
+  }
+
+  bool     good_;
+  uint64_t entries_;
+  int      current_;
+  std::vector<File>    files_;
+  std::vector<Binding> bindings_;
+};
+
+#endif
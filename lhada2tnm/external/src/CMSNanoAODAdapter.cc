@@ -9,11 +9,51 @@
 #include <string>
 #include <map>
 
-#include "TString.h"
+#include <cctype>
+#include <cstring>
 #include "CMSNanoAODAdapter.h"
 
 using namespace std;
 
+namespace {
+  // lower case copy of an object name, held on the stack so that
+  // mapping an object does not allocate memory
+  struct Key
+  {
+    char str[256];
+    Key(const char* name)
+    {
+      size_t c = 0;
+      for(; (name[c] != 0) && (c < sizeof(str)-1); c++)
+	str[c] = tolower(name[c]);
+      str[c] = 0;
+    }
+    bool Contains(const char* s) const { return strstr(str, s) != 0; }
+  };
+  
+  std::ostream& operator<<(std::ostream& os, const Key& key)
+  {
+    os << key.str;
+    return os;
+  }
+
+  // keys of the attributes, resolved once
+  const int attr_charge = TEValues::key("charge");
+  const int attr_area = TEValues::key("area");
+  const int attr_breg = TEValues::key("breg");
+  const int attr_btagcmva = TEValues::key("btagcmva");
+  const int attr_btagcsvv2 = TEValues::key("btagcsvv2");
+  const int attr_btagdeepb = TEValues::key("btagdeepb");
+  const int attr_btagdeepc = TEValues::key("btagdeepc");
+  const int attr_btagdeepflavb = TEValues::key("btagdeepflavb");
+  const int attr_chemef = TEValues::key("chemef");
+  const int attr_chhef = TEValues::key("chhef");
+  const int attr_met = TEValues::key("met");
+  const int attr_sumet = TEValues::key("sumet");
+  const int attr_significance = TEValues::key("significance");
+  const int attr_ht = TEValues::key("ht");
+}
+
 CMSNanoAODAdapter::CMSNanoAODAdapter()
 {
 }
@@ -22,11 +62,10 @@ CMSNanoAODAdapter::~CMSNanoAODAdapter()
 {
 }
 
-void CMSNanoAODAdapter::operator()(eventBuffer& ev, std::string name,
+void CMSNanoAODAdapter::operator()(eventBuffer& ev, const char* name,
 				   std::vector<TEParticle>& p)
 {
-  TString key(name.c_str());
-  key.ToLower();
+  Key key(name);
   p.clear();
   
   if      ( key.Contains("muon") )
@@ -38,8 +77,7 @@ void CMSNanoAODAdapter::operator()(eventBuffer& ev, std::string name,
 				 ev.Muon_eta[c],
 				 ev.Muon_phi[c],
 				 ev.Muon_mass[c]));
-	  p.back().Value["Charge"] = ev.Muon_charge[c];
-	  p.back().Value["charge"] = ev.Muon_charge[c];
+	  p.back().Value[attr_charge] = ev.Muon_charge[c];
 
 	}
     }
@@ -52,8 +90,7 @@ void CMSNanoAODAdapter::operator()(eventBuffer& ev, std::string name,
 				 ev.Electron_eta[c],
 				 ev.Electron_phi[c],
 				 ev.Electron_mass[c]));
-	  p.back().Value["Charge"] = ev.Electron_charge[c];
-	  p.back().Value["charge"] = ev.Electron_charge[c];	  
+	  p.back().Value[attr_charge] = ev.Electron_charge[c];
  
 	}      
     }
@@ -78,15 +115,15 @@ void CMSNanoAODAdapter::operator()(eventBuffer& ev, std::string name,
 				 ev.Jet_phi[c],
 				 ev.Jet_mass[c]));
 
-	  p.back().Value["area"]      = ev.Jet_area[c];
-	  p.back().Value["bReg"]      = ev.Jet_bReg[c];
-	  p.back().Value["btagCMVA"]  = ev.Jet_btagCMVA[c];
-	  p.back().Value["btagCSVV2"] = ev.Jet_btagCSVV2[c];
-	  p.back().Value["btagDeepB"] = ev.Jet_btagDeepB[c];
-	  p.back().Value["btagDeepC"] = ev.Jet_btagDeepC[c];
-	  p.back().Value["btagDeepFlavB"] = ev.Jet_btagDeepFlavB[c];
-	  p.back().Value["chEmEF"]    = ev.Jet_chEmEF[c];
-	  p.back().Value["chHEF"]     = ev.Jet_chHEF[c];
+	  p.back().Value[attr_area]      = ev.Jet_area[c];
+	  p.back().Value[attr_breg]      = ev.Jet_bReg[c];
+	  p.back().Value[attr_btagcmva]  = ev.Jet_btagCMVA[c];
+	  p.back().Value[attr_btagcsvv2] = ev.Jet_btagCSVV2[c];
+	  p.back().Value[attr_btagdeepb] = ev.Jet_btagDeepB[c];
+	  p.back().Value[attr_btagdeepc] = ev.Jet_btagDeepC[c];
+	  p.back().Value[attr_btagdeepflavb] = ev.Jet_btagDeepFlavB[c];
+	  p.back().Value[attr_chemef]    = ev.Jet_chEmEF[c];
+	  p.back().Value[attr_chhef]     = ev.Jet_chHEF[c];
 	}      
     }
   else
@@ -94,18 +131,21 @@ void CMSNanoAODAdapter::operator()(eventBuffer& ev, std::string name,
       cout << "** CMSNanoAODAdapter ** unknown type: " << key << endl;
       exit(0);
     }
+
+  // the translated analysis assumes that objects are ordered in
+  // decreasing pT (see TEParticle::operator<)
+  if ( !is_sorted(p.begin(), p.end()) ) sort(p.begin(), p.end());
 }
 
-void CMSNanoAODAdapter::operator()(eventBuffer& ev, std::string name, TEParticle& p)
+void CMSNanoAODAdapter::operator()(eventBuffer& ev, const char* name, TEParticle& p)
 {
-  TString key(name.c_str());
-  key.ToLower();  
+  Key key(name);
   if ( key.Contains("met") || key.Contains("missinget") )
     {
       TEParticle q(81, ev.MET_pt, 0, ev.MET_phi, 0);
-      q.Value["met"] = q.Pt();
-      q.Value["sumEt"] = ev.MET_sumEt;
-      q.Value["significance"] = ev.MET_significance;
+      q.Value[attr_met] = q.Pt();
+      q.Value[attr_sumet] = ev.MET_sumEt;
+      q.Value[attr_significance] = ev.MET_significance;
       p = q;
     }
   else if ( key.Contains("scalarht") || key.Contains("ht") )
@@ -152,8 +192,7 @@ void CMSNanoAODAdapter::operator()(eventBuffer& ev, std::string name, TEParticle
       }
       
       TEParticle q(82, HT, 0, 0, 0);
-      q.Value["ht"]  = HT;
-      q.Value["HT"]  = HT;
+      q.Value[attr_ht]  = HT;
       p = q;
     }  
 }
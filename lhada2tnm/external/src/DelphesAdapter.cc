@@ -9,11 +9,53 @@
 #include <string>
 #include <map>
 
-#include "TString.h"
+#include <cctype>
+#include <cstring>
 #include "DelphesAdapter.h"
 
 using namespace std;
 
+namespace {
+  // lower case copy of an object name, held on the stack so that
+  // mapping an object does not allocate memory
+  struct Key
+  {
+    char str[256];
+    Key(const char* name)
+    {
+      size_t c = 0;
+      for(; (name[c] != 0) && (c < sizeof(str)-1); c++)
+	str[c] = tolower(name[c]);
+      str[c] = 0;
+    }
+    bool Contains(const char* s) const { return strstr(str, s) != 0; }
+  };
+  
+  std::ostream& operator<<(std::ostream& os, const Key& key)
+  {
+    os << key.str;
+    return os;
+  }
+
+  // keys of the attributes, resolved once
+  const int attr_charge = TEValues::key("charge");
+  const int attr_isolationvar = TEValues::key("isolationvar");
+  const int attr_isolationvarrhocorr = TEValues::key("isolationvarrhocorr");
+  const int attr_btag = TEValues::key("btag");
+  const int attr_beta = TEValues::key("beta");
+  const int attr_betastar = TEValues::key("betastar");
+  const int attr_deltaeta = TEValues::key("deltaeta");
+  const int attr_deltaphi = TEValues::key("deltaphi");
+  const int attr_ehadovereem = TEValues::key("ehadovereem");
+  const int attr_meansqdeltar = TEValues::key("meansqdeltar");
+  const int attr_vvharged = TEValues::key("vvharged");
+  const int attr_nneutrals = TEValues::key("nneutrals");
+  const int attr_phi = TEValues::key("phi");
+  const int attr_pt = TEValues::key("pt");
+  const int attr_met = TEValues::key("met");
+  const int attr_ht = TEValues::key("ht");
+}
+
 DelphesAdapter::DelphesAdapter()
 {
 }
@@ -23,11 +65,10 @@ DelphesAdapter::~DelphesAdapter()
 }
 
 
-void DelphesAdapter::operator()(eventBuffer& ev, std::string name,
+void DelphesAdapter::operator()(eventBuffer& ev, const char* name,
 				std::vector<TEParticle>& p)
 {
-  TString key(name.c_str());
-  key.ToLower();
+  Key key(name);
   p.clear();
   
   if      ( key.Contains("muon") )
@@ -39,9 +80,9 @@ void DelphesAdapter::operator()(eventBuffer& ev, std::string name,
 				 ev.Muon_Eta[c],
 				 ev.Muon_Phi[c],
 				 0));
-	  p.back().Value["charge"] = ev.Muon_Charge[c];
-	  p.back().Value["isolationvar"] = ev.Muon_IsolationVar[c];
-	  p.back().Value["isolationvarrhocorr"] = ev.Muon_IsolationVarRhoCorr[c];
+	  p.back().Value[attr_charge] = ev.Muon_Charge[c];
+	  p.back().Value[attr_isolationvar] = ev.Muon_IsolationVar[c];
+	  p.back().Value[attr_isolationvarrhocorr] = ev.Muon_IsolationVarRhoCorr[c];
 	}
     }
   else if ( key.Contains("electron") )
@@ -53,9 +94,9 @@ void DelphesAdapter::operator()(eventBuffer& ev, std::string name,
 				 ev.Electron_Eta[c],
 				 ev.Electron_Phi[c],
 				 0));
-	  p.back().Value["charge"] = ev.Electron_Charge[c];
-	  p.back().Value["isolationvar"] = ev.Electron_IsolationVar[c];	  
-	  p.back().Value["isolationvarrhocorr"] = ev.Electron_IsolationVarRhoCorr[c];	  
+	  p.back().Value[attr_charge] = ev.Electron_Charge[c];
+	  p.back().Value[attr_isolationvar] = ev.Electron_IsolationVar[c];	  
+	  p.back().Value[attr_isolationvarrhocorr] = ev.Electron_IsolationVarRhoCorr[c];	  
 	}      
     }
   else if ( key.Contains("photon") )
@@ -67,9 +108,9 @@ void DelphesAdapter::operator()(eventBuffer& ev, std::string name,
 				 ev.Photon_Eta[c],
 				 ev.Photon_Phi[c],
 				 0));
-	  p.back().Value["charge"] = 0;
-	  p.back().Value["isolationvar"] = ev.Photon_IsolationVar[c];	  
-	  p.back().Value["isolationvarrhocorr"] = ev.Photon_IsolationVarRhoCorr[c];	  
+	  p.back().Value[attr_charge] = 0;
+	  p.back().Value[attr_isolationvar] = ev.Photon_IsolationVar[c];	  
+	  p.back().Value[attr_isolationvarrhocorr] = ev.Photon_IsolationVarRhoCorr[c];	  
 	}      
     }  
   else if ( key.Contains("jet") )
@@ -81,16 +122,16 @@ void DelphesAdapter::operator()(eventBuffer& ev, std::string name,
 				 ev.Jet_Eta[c],
 				 ev.Jet_Phi[c],
 				 ev.Jet_Mass[c]));
-	  p.back().Value["btag"] = ev.Jet_BTag[c];
-	  p.back().Value["beta"] = ev.Jet_Beta[c];
-	  p.back().Value["charge"] = ev.Jet_Charge[c];
-	  p.back().Value["betastar"] = ev.Jet_BetaStar[c];
-	  p.back().Value["deltaeta"] = ev.Jet_DeltaEta[c];
-	  p.back().Value["deltaphi"] = ev.Jet_DeltaPhi[c];
-	  p.back().Value["ehadovereem"] = ev.Jet_EhadOverEem[c];
-	  p.back().Value["meansqdeltar"] = ev.Jet_MeanSqDeltaR[c];
-	  p.back().Value["vvharged"] = ev.Jet_NCharged[c];
-	  p.back().Value["nneutrals"] = ev.Jet_NNeutrals[c];
+	  p.back().Value[attr_btag] = ev.Jet_BTag[c];
+	  p.back().Value[attr_beta] = ev.Jet_Beta[c];
+	  p.back().Value[attr_charge] = ev.Jet_Charge[c];
+	  p.back().Value[attr_betastar] = ev.Jet_BetaStar[c];
+	  p.back().Value[attr_deltaeta] = ev.Jet_DeltaEta[c];
+	  p.back().Value[attr_deltaphi] = ev.Jet_DeltaPhi[c];
+	  p.back().Value[attr_ehadovereem] = ev.Jet_EhadOverEem[c];
+	  p.back().Value[attr_meansqdeltar] = ev.Jet_MeanSqDeltaR[c];
+	  p.back().Value[attr_vvharged] = ev.Jet_NCharged[c];
+	  p.back().Value[attr_nneutrals] = ev.Jet_NNeutrals[c];
 
 	  // p.back().Value["tau1"] = ev.Jet_Tau1[c];
 	  // p.back().Value["tau2"] = ev.Jet_Tau2[c];
@@ -105,18 +146,21 @@ void DelphesAdapter::operator()(eventBuffer& ev, std::string name,
       cout << "** DelphesAdapter ** unknown type: " << key << endl;
       exit(0);
     }
+
+  // the translated analysis assumes that objects are ordered in
+  // decreasing pT (see TEParticle::operator<)
+  if ( !is_sorted(p.begin(), p.end()) ) sort(p.begin(), p.end());
 }
 
-void DelphesAdapter::operator()(eventBuffer& ev, std::string name, TEParticle& p)
+void DelphesAdapter::operator()(eventBuffer& ev, const char* name, TEParticle& p)
 {
-  TString key(name.c_str());
-  key.ToLower();
+  Key key(name);
   if ( key.Contains("met") || key.Contains("missinget") )
     {
       TEParticle q(81, ev.MissingET_MET, ev.MissingET_Eta, ev.MissingET_Phi, 0);
-      q.Value["phi"] = q.Phi();
-      q.Value["pt"]  = q.Pt();
-      q.Value["met"] = q.Pt();
+      q.Value[attr_phi] = q.Phi();
+      q.Value[attr_pt]  = q.Pt();
+      q.Value[attr_met] = q.Pt();
       p = q;
     }
 
@@ -124,8 +168,8 @@ void DelphesAdapter::operator()(eventBuffer& ev, std::string name, TEParticle& p
   if ( key.Contains("scalarht") || key.Contains("ht") )
     {
       TEParticle q(82, ev.ScalarHT_HT, 0, 0, 0);
-      q.Value["ht"]  = ev.ScalarHT_HT;
-      q.Value["pt"]  = ev.ScalarHT_HT;
+      q.Value[attr_ht]  = ev.ScalarHT_HT;
+      q.Value[attr_pt]  = ev.ScalarHT_HT;
       p = q;
     }
 #endif
@@ -0,0 +1,270 @@
+// ---------------------------------------------------------------------------
+// File: columnstream.cc
+// Description: read events from memory-mapped columnar files
+// ---------------------------------------------------------------------------
+#include <cstdlib>
+#include <cstring>
+#include <fcntl.h>
+#include <unistd.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include "columnstream.h"
+
+using namespace std;
+
+namespace {
+  const char     MAGIC[]  = "LHADACOL";
+  const uint32_t VERSION  = 1;
+
+  // a column name, without the tree name if present (e.g., Delphes/Jet.PT)
+  std::string columnName(std::string name)
+  {
+    size_t slash = name.rfind('/');
+    if ( slash == std::string::npos ) return name;
+    return name.substr(slash+1);
+  }
+}
+
+icolumnstream::icolumnstream()
+  : good_(false),
+    entries_(0),
+    current_(-1),
+    files_(vector<File>()),
+    bindings_(vector<Binding>())
+{}
+
+icolumnstream::icolumnstream(std::string filename)
+  : good_(true),
+    entries_(0),
+    current_(-1),
+    files_(vector<File>()),
+    bindings_(vector<Binding>())
+{
+  good_ = _open(filename);
+}
+
+icolumnstream::icolumnstream(std::vector<std::string>& filenames)
+  : good_(true),
+    entries_(0),
+    current_(-1),
+    files_(vector<File>()),
+    bindings_(vector<Binding>())
+{
+  for(size_t c=0; c < filenames.size(); c++)
+    good_ = _open(filenames[c]) && good_;
+  if ( files_.size() == 0 ) good_ = false;
+}
+
+icolumnstream::~icolumnstream()
+{
+  close();
+}
+
+bool icolumnstream::_open(std::string filename)
+{
+  File file;
+  file.name    = filename;
+  file.fd      = open(filename.c_str(), O_RDONLY);
+  file.address = 0;
+  file.length  = 0;
+  file.first   = entries_;
+  file.entries = 0;
+  if ( file.fd < 0 )
+    {
+      cout << "** icolumnstream ** unable to open " << filename << endl;
+      return false;
+    }
+
+  struct stat info;
+  if ( fstat(file.fd, &info) < 0 || info.st_size < 24 )
+    {
+      cout << "** icolumnstream ** " << filename
+           << " is not a columnar file" << endl;
+      ::close(file.fd);
+      return false;
+    }
+  file.length  = info.st_size;
+  void* address = mmap(0, file.length, PROT_READ, MAP_SHARED, file.fd, 0);
+  if ( address == MAP_FAILED )
+    {
+      cout << "** icolumnstream ** unable to map " << filename << endl;
+      ::close(file.fd);
+      return false;
+    }
+  file.address = (char*)address;
+
+  // decode header
+  const char* p   = file.address;
+  const char* end = file.address + file.length;
+  bool ok = memcmp(p, MAGIC, 8) == 0;
+  uint32_t version = 0, ncolumns = 0;
+  if ( ok )
+    {
+      memcpy(&version,      p+8,  4);
+      memcpy(&ncolumns,     p+12, 4);
+      memcpy(&file.entries, p+16, 8);
+      ok = version == VERSION;
+    }
+  p += 24;
+  for(uint32_t c=0; ok && c < ncolumns; c++)
+    {
+      uint32_t length = 0, variable = 0;
+      uint64_t offsets = 0, values = 0;
+      if ( p + 4 > end ) { ok = false; break; }
+      memcpy(&length, p, 4);
+      p += 4;
+      if ( p + length + 20 > end ) { ok = false; break; }
+      std::string name(p, length);
+      p += length;
+      memcpy(&variable, p,    4);
+      memcpy(&offsets,  p+4,  8);
+      memcpy(&values,   p+12, 8);
+      p += 20;
+
+      Column column;
+      column.variable = variable != 0;
+      column.offsets  = 0;
+      column.values   = (const float*)(file.address + values);
+      uint64_t nvalues = file.entries;
+      if ( column.variable )
+        {
+          if ( offsets + 8*(file.entries+1) > file.length ) { ok = false; break; }
+          column.offsets = (const uint64_t*)(file.address + offsets);
+          nvalues = column.offsets[file.entries];
+        }
+      if ( values + 4*nvalues > file.length ) { ok = false; break; }
+      file.columns[name] = column;
+    }
+  if ( !ok )
+    {
+      cout << "** icolumnstream ** " << filename
+           << " is not a valid columnar file" << endl;
+      munmap(file.address, file.length);
+      ::close(file.fd);
+      return false;
+    }
+
+  entries_ += file.entries;
+  files_.push_back(file);
+  return true;
+}
+
+bool icolumnstream::present(std::string name)
+{
+  if ( files_.size() == 0 ) return false;
+  return files_[0].columns.find(columnName(name)) != files_[0].columns.end();
+}
+
+void icolumnstream::_select(std::string name, void* address, Copy copy)
+{
+  name = columnName(name);
+  if ( !present(name) )
+    {
+      cout << "** icolumnstream ** column " << name
+           << " not found; it will not be read" << endl;
+      return;
+    }
+  Binding binding;
+  binding.name    = name;
+  binding.address = address;
+  binding.copy    = copy;
+  binding.column  = 0;
+  bindings_.push_back(binding);
+  current_ = -1;
+}
+
+void icolumnstream::_update(int current)
+{
+  // point the selected variables to the columns of the current file
+  File& file = files_[current];
+  for(size_t c=0; c < bindings_.size(); c++)
+    {
+      std::map<std::string, Column>::iterator column =
+        file.columns.find(bindings_[c].name);
+      if ( column == file.columns.end() )
+        {
+          cout << "** icolumnstream ** column " << bindings_[c].name
+               << " not found in " << file.name << endl;
+          exit(0);
+        }
+      bindings_[c].column = &column->second;
+    }
+  current_ = current;
+}
+
+int icolumnstream::read(int entry)
+{
+  if ( entry < 0 || (uint64_t)entry >= entries_ ) return 0;
+
+  // find the file containing this entry
+  if ( current_ < 0 ||
+       (uint64_t)entry <  files_[current_].first ||
+       (uint64_t)entry >= files_[current_].first + files_[current_].entries )
+    {
+      int current = 0;
+      while ( (uint64_t)entry >=
+              files_[current].first + files_[current].entries ) current++;
+      _update(current);
+    }
+
+  uint64_t local = entry - files_[current_].first;
+  for(size_t c=0; c < bindings_.size(); c++)
+    {
+      const Column* column = bindings_[c].column;
+      if ( column->variable )
+        {
+          uint64_t first = column->offsets[local];
+          bindings_[c].copy(bindings_[c].address, column->values + first,
+                            column->offsets[local+1] - first);
+        }
+      else
+        bindings_[c].copy(bindings_[c].address, column->values + local, 1);
+    }
+  return 1;
+}
+
+std::string icolumnstream::filename()
+{
+  if ( current_ < 0 ) return "";
+  return files_[current_].name;
+}
+
+std::vector<std::string> icolumnstream::filenames()
+{
+  vector<string> names;
+  for(size_t c=0; c < files_.size(); c++) names.push_back(files_[c].name);
+  return names;
+}
+
+std::vector<std::string> icolumnstream::names()
+{
+  vector<string> names;
+  if ( files_.size() == 0 ) return names;
+  for(std::map<std::string, Column>::iterator column =
+        files_[0].columns.begin();
+      column != files_[0].columns.end(); column++)
+    names.push_back(column->first);
+  return names;
+}
+
+void icolumnstream::close()
+{
+  for(size_t c=0; c < files_.size(); c++)
+    {
+      munmap(files_[c].address, files_[c].length);
+      ::close(files_[c].fd);
+    }
+  files_.clear();
+  bindings_.clear();
+  entries_ = 0;
+  current_ = -1;
+}
+
+void icolumnstream::ls(std::ostream& os)
+{
+  os << "icolumnstream: " << entries_ << " entries in "
+     << files_.size() << " file(s)" << endl;
+  vector<string> columns = names();
+  for(size_t c=0; c < columns.size(); c++)
+    os << "  " << columns[c] << endl;
+}